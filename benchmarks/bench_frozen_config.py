@@ -0,0 +1,60 @@
+"""
+Compare handing a built config to workers with `copy.deepcopy` against sharing a frozen one.
+
+Usage: python benchmarks/bench_frozen_config.py [--sections 400] [--requests 50]
+"""
+import argparse
+import copy
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from readtheyaml.frozen import freeze  # noqa: E402
+
+
+def make_config(sections: int) -> dict:
+    return {
+        f"section_{i}": {
+            "name": f"service-{i}",
+            "enabled": i % 2 == 0,
+            "limits": {"cpu": 0.5 * i, "memory": 256 * i, "replicas": i % 7},
+            "hosts": [f"host-{i}-{j}.example.com" for j in range(20)],
+            "ports": list(range(8000, 8040)),
+        }
+        for i in range(sections)
+    }
+
+
+def measure(label: str, requests: int, per_request) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = [per_request() for _ in range(requests)]
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    print(f"{label:>22}: {elapsed / requests * 1000:8.3f} ms/request  peak {peak / 2**20:8.2f} MiB for {requests} live copies")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sections", type=int, default=400)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+
+    built = make_config(args.sections)
+    frozen = freeze(built)
+    print(f"config: {args.sections} sections, {args.requests} requests")
+
+    measure("deepcopy(dict)", args.requests, lambda: copy.deepcopy(built))
+    measure("share frozen", args.requests, lambda: frozen)
+    measure("deepcopy(frozen)", args.requests, lambda: copy.deepcopy(frozen))
+    measure("derive one key", args.requests, lambda: frozen.derive({"section_0.limits.replicas": 3}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Compare item-by-item and NumPy bulk validation of long `list[float]` / `list[int]` values.
+
+Usage: python benchmarks/bench_numeric_lists.py [--length 1000000] [--repeat 3]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from readtheyaml.fields import numeric_arrays  # noqa: E402
+from readtheyaml.fields.base.numerical_field import NumericalField  # noqa: E402
+from readtheyaml.fields.composite.list_field import ListField  # noqa: E402
+
+
+def best_of(repeat: int, func) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--length", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if not numeric_arrays.HAS_NUMPY:
+        print("numpy is not installed: only the item-by-item path is available.")
+
+    rng = random.Random(0)
+    samples = {
+        float: [rng.uniform(-1.0, 1.0) for _ in range(args.length)],
+        int: [rng.randint(0, 10_000) for _ in range(args.length)],
+    }
+
+    for value_type, values in samples.items():
+        type_name = value_type.__name__
+        item_field = NumericalField(name="value", description="value", value_type=value_type, min_value=value_type(-10_000))
+        field = ListField(name="values", description="values", item_field=item_field)
+        vectorized = field._vectorized
+        field._vectorized = False
+        scalar = best_of(args.repeat, lambda: field.validate_and_build(values))
+        print(f"list[{type_name}] item by item: {scalar * 1000:9.2f} ms")
+        if vectorized:
+            field._vectorized = True
+            bulk = best_of(args.repeat, lambda: field.validate_and_build(values))
+            print(f"list[{type_name}] numpy bulk:   {bulk * 1000:9.2f} ms  (x{scalar / bulk:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Time `validate_and_build` per value for each primitive field type (int, float, bool, str).
+
+Usage: python benchmarks/bench_primitive_fields.py [--number 200000] [--repeat 5]
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from readtheyaml.fields.base.bool_field import BoolField  # noqa: E402
+from readtheyaml.fields.base.numerical_field import NumericalField  # noqa: E402
+from readtheyaml.fields.base.string_field import StringField  # noqa: E402
+
+CASES = [
+    ("int", NumericalField(name="n", description="", value_type=int), 42),
+    ("int bounded", NumericalField(name="n", description="", value_type=int, min_value=0, max_value=100), 42),
+    ("int from float", NumericalField(name="n", description="", value_type=int), 42.0),
+    ("float", NumericalField(name="n", description="", value_type=float), 0.5),
+    ("float bounded", NumericalField(name="n", description="", value_type=float, min_value=0.0, max_value=1.0), 0.5),
+    ("float from int", NumericalField(name="n", description="", value_type=float), 3),
+    ("bool", BoolField(name="b", description=""), True),
+    ("bool from str", BoolField(name="b", description=""), "false"),
+    ("str", StringField(name="s", description=""), "hello"),
+    ("str bounded", StringField(name="s", description="", min_length=1, max_length=16), "hello"),
+    ("str cast", StringField(name="s", description="", cast_to_string=True), 12),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for label, field, value in CASES:
+        validate = field.validate_and_build
+        best = min(timeit.repeat(lambda: validate(value), number=args.number, repeat=args.repeat))
+        print(f"{label:>15}: {best / args.number * 1e9:7.1f} ns/value")
+
+
+if __name__ == "__main__":
+    main()
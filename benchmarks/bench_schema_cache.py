@@ -0,0 +1,44 @@
+"""
+Compare a cold `Schema.from_yaml` load with one served from the on-disk schema cache.
+
+Usage: python benchmarks/bench_schema_cache.py [--schema examples/schema_composed.yaml] [--repeat 5]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from readtheyaml.schema import Schema  # noqa: E402
+
+
+def best_of(repeat: int, func) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--schema", default=str(ROOT / "examples" / "schema_composed.yaml"))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cold = best_of(args.repeat, lambda: Schema.from_yaml(args.schema))
+        Schema.from_yaml(args.schema, cache_dir=cache_dir)
+        cached = best_of(args.repeat, lambda: Schema.from_yaml(args.schema, cache_dir=cache_dir))
+
+    print(f"  cold: {cold * 1000:8.2f} ms")
+    print(f"cached: {cached * 1000:8.2f} ms")
+    print(f"speedup: x{cold / cached:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compare YAML parsing/dumping time of the pure-Python and libyaml backends.
+
+Usage: python benchmarks/bench_yaml_backend.py [--services 2000] [--repeat 3]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from readtheyaml import yaml_backend  # noqa: E402
+
+
+def build_config(services: int) -> dict:
+    return {
+        "services": {
+            f"service_{index}": {
+                "image": f"registry.local/app-{index}:1.{index % 10}",
+                "replicas": index % 7 + 1,
+                "ports": [8000 + index % 100, 9000 + index % 100],
+                "env": {"LOG_LEVEL": "info", "FEATURE_X": index % 2 == 0, "RATIO": index / 3},
+            }
+            for index in range(services)
+        }
+    }
+
+
+def best_of(repeat: int, func) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--services", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    config = build_config(args.services)
+    yaml_backend.set_backend(yaml_backend.BACKEND_PYTHON)
+    text = yaml_backend.safe_dump(config)
+    print(f"document size: {len(text) / 1024:.0f} KiB")
+
+    backends = [yaml_backend.BACKEND_PYTHON]
+    if yaml_backend.HAS_LIBYAML:
+        backends.append(yaml_backend.BACKEND_LIBYAML)
+    else:
+        print("libyaml bindings are not available in this PyYAML build; only the pure-Python backend is measured.")
+
+    results = {}
+    for backend in backends:
+        yaml_backend.set_backend(backend)
+        load = best_of(args.repeat, lambda: yaml_backend.safe_load(text))
+        dump = best_of(args.repeat, lambda: yaml_backend.safe_dump(config))
+        results[backend] = (load, dump)
+        print(f"{backend:>8}: load {load * 1000:8.1f} ms   dump {dump * 1000:8.1f} ms")
+
+    if len(results) == 2:
+        python_load, python_dump = results[yaml_backend.BACKEND_PYTHON]
+        c_load, c_dump = results[yaml_backend.BACKEND_LIBYAML]
+        print(f" speedup: load x{python_load / c_load:.1f}   dump x{python_dump / c_dump:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Profile building a large schema and show where load time goes.
+
+Usage: python benchmarks/profile_schema_load.py [--sections 2000] [--top 15]
+"""
+import argparse
+import cProfile
+import inspect
+import pstats
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from readtheyaml.schema import Schema  # noqa: E402
+
+
+def build_schema_dict(sections: int) -> dict:
+    return {
+        f"section_{index}": {
+            "host": {"type": "str", "description": "host"},
+            "port": {"type": "int", "description": "port", "required": False, "default": 8000 + index % 100},
+            "tags": {"type": "list[str]", "description": "tags", "required": False, "default": []},
+            "limits": {
+                "cpu": {"type": "float", "description": "cpu", "required": False, "default": 0.5},
+                "memory": {"type": "int | None", "description": "memory", "required": False, "default": None},
+            },
+        }
+        for index in range(sections)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sections", type=int, default=2000)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    data = build_schema_dict(args.sections)
+    Schema._from_dict(build_schema_dict(1))  # warm module-level caches
+
+    start = time.perf_counter()
+    Schema._from_dict(data)
+    print(f"load of {args.sections} sections: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    profiler = cProfile.Profile()
+    profiler.runcall(Schema._from_dict, data)
+    stats = pstats.Stats(profiler)
+
+    signature_calls = sum(
+        calls for (filename, _, name), (calls, *_rest) in stats.stats.items()
+        if name == "signature" and filename == inspect.__file__
+    )
+    print(f"inspect.signature calls during load: {signature_calls}")
+    stats.sort_stats("cumulative").print_stats(args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,10 @@ import argparse
 import sys
 from pathlib import Path
 
-import yaml
-
+from readtheyaml import yaml_backend
 from readtheyaml.data_instance import DataInstance
 from readtheyaml.exceptions.validation_error import ValidationError
+from readtheyaml.profiling import profile_validation
 from readtheyaml.schema import Schema
 from readtheyaml.schema_doc import write_schema_documentation_html
 
@@ -15,25 +15,44 @@ def main():
     parser.add_argument("--schema", required=True, help="Path to the YAML schema definition file")
     parser.add_argument("--config", help="Path to the YAML configuration file to validate")
     parser.add_argument("--generate-doc", action="store_true", help="Generate HTML documentation from the schema instead of validating a config.")
-    parser.add_argument("--output", default="schema-doc.html", help="Output HTML file path for --generate-doc (default: schema-doc.html).")
+    parser.add_argument("--bundle", action="store_true", help="Resolve every $ref of the schema once and write a single self-contained bundle file.")
+    parser.add_argument("--profile", action="store_true", help="Print per-field validation timings (slowest first) to stderr after validating --config.")
+    parser.add_argument("--output", help="Output file path for --generate-doc (default: schema-doc.html) or --bundle (default: schema.bundle.yaml).")
 
     args = parser.parse_args()
 
+    if args.generate_doc and args.bundle:
+        parser.error("--generate-doc and --bundle cannot be used together.")
+
     if args.generate_doc:
-        write_schema_documentation_html(args.schema, args.output)
-        print(f"Documentation generated: {args.output}")
+        output = args.output or "schema-doc.html"
+        write_schema_documentation_html(args.schema, output)
+        print(f"Documentation generated: {output}")
+        return
+
+    if args.bundle:
+        output = args.output or "schema.bundle.yaml"
+        Schema.write_bundle(args.schema, output)
+        print(f"Schema bundle written: {output}")
         return
 
     if not args.config:
-        parser.error("--config is required unless --generate-doc is used.")
+        parser.error("--config is required unless --generate-doc or --bundle is used.")
 
     try:
         yaml_path = Path(args.config)
         with open(yaml_path, "r", encoding="utf-8") as f:
-            yaml_data = yaml.safe_load(f)
+            yaml_data = yaml_backend.safe_load(f)
 
         schema = Schema.from_yaml(args.schema, Path("./examples"))
-        data_instance = DataInstance(data=yaml_data, schema=schema, strict=False)
+        if args.profile:
+            with profile_validation() as profile:
+                try:
+                    data_instance = DataInstance(data=yaml_data, schema=schema, strict=False)
+                finally:
+                    print(profile.table(), file=sys.stderr)
+        else:
+            data_instance = DataInstance(data=yaml_data, schema=schema, strict=False)
         print("✅ Config is valid!")
     except ValidationError as e:
         print(f"❌ Validation failed: {e}", file=sys.stderr)
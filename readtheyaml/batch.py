@@ -0,0 +1,141 @@
+import os
+import pickle
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+BatchItem = Union[str, Path, Dict[str, Any]]
+
+# Per-process state set once by the pool initializer so the schema is shipped to each worker only once.
+_worker_schema = None
+_worker_strict = True
+
+# Chunks kept submitted per worker; bounds the work still running when a consumer stops early.
+MAX_PENDING_CHUNKS_PER_WORKER = 2
+
+
+class ValidationResult:
+    """Outcome of validating one config: either the built output or the error it raised."""
+
+    def __init__(
+        self,
+        index: int,
+        source: Optional[str] = None,
+        built: Optional[Dict[str, Any]] = None,
+        data_with_default: Optional[Dict[str, Any]] = None,
+        error: Optional[Exception] = None,
+    ):
+        self.index = index
+        self.source = source
+        self.built = built
+        self.data_with_default = data_with_default
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = "ok" if self.ok else f"error={self.error!s}"
+        return f"ValidationResult(index={self.index}, source={self.source!r}, {outcome})"
+
+
+def validate_item(schema, index: int, item: BatchItem, strict: bool) -> ValidationResult:
+    if isinstance(item, dict):
+        return validate_document(schema, index, item, strict)
+
+    source = str(item)
+    try:
+        built, data_with_default = schema.validate_file(item, strict=strict)
+    except Exception as e:
+        # Not only ReadTheYAMLError/OSError: a field or an ObjectField constructor may raise anything,
+        # and one bad item must not abort the batch.
+        return ValidationResult(index, source, error=e)
+    return ValidationResult(index, source, built=built, data_with_default=data_with_default)
+
+
+def validate_document(schema, index: int, document: Any, strict: bool, source: Optional[str] = None) -> ValidationResult:
+    try:
+        built, data_with_default = schema.build_and_validate(document, strict=strict)
+    except Exception as e:
+        return ValidationResult(index, source, error=e)
+    return ValidationResult(index, source, built=built, data_with_default=data_with_default)
+
+
+def validate_many(
+    schema, items: Iterable[BatchItem], strict: bool = True, workers: Optional[int] = None, chunksize: int = 16
+) -> Iterator[ValidationResult]:
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for index, item in enumerate(items):
+            yield validate_item(schema, index, item, strict)
+        return
+
+    # Work is submitted in a bounded window of chunks rather than all at once, so a caller that
+    # stops consuming early only waits for the chunks already running.
+    window = workers * MAX_PENDING_CHUNKS_PER_WORKER
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(schema, strict))
+    pending: Deque[Tuple[List[Tuple[int, BatchItem]], Future]] = deque()
+    try:
+        for chunk in _chunks(enumerate(items), chunksize):
+            pending.append((chunk, executor.submit(_validate_chunk_in_worker, chunk)))
+            if len(pending) >= window:
+                yield from _chunk_results(*pending.popleft())
+        while pending:
+            yield from _chunk_results(*pending.popleft())
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _chunks(indexed_items: Iterator[Tuple[int, BatchItem]], size: int) -> Iterator[List[Tuple[int, BatchItem]]]:
+    while True:
+        chunk = list(islice(indexed_items, max(size, 1)))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _chunk_results(chunk: List[Tuple[int, BatchItem]], future: Future) -> List[ValidationResult]:
+    try:
+        payloads = future.result()
+    except Exception as e:
+        # The worker itself failed (e.g. the pool broke): report it on every item of the chunk.
+        return [ValidationResult(index, _source(item), error=e) for index, item in chunk]
+    return [_unpickle_result(index, item, payload) for (index, item), payload in zip(chunk, payloads)]
+
+
+def _init_worker(schema, strict: bool) -> None:
+    global _worker_schema, _worker_strict
+    _worker_schema = schema
+    _worker_strict = strict
+
+
+def _validate_chunk_in_worker(chunk: List[Tuple[int, BatchItem]]) -> List[bytes]:
+    # Each result is pickled here, once: the list of bytes is cheap for the pool to send, and a
+    # result that cannot be pickled (or unpickled) only fails its own item, not the whole chunk.
+    return [_pickle_result(validate_item(_worker_schema, index, item, _worker_strict)) for index, item in chunk]
+
+
+def _pickle_result(result: ValidationResult) -> bytes:
+    try:
+        return pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        if result.ok:
+            error = RuntimeError(f"Built output cannot be pickled: {e}")
+        else:
+            error = RuntimeError(f"{type(result.error).__name__}: {result.error}")
+    return pickle.dumps(ValidationResult(result.index, result.source, error=error), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _unpickle_result(index: int, item: BatchItem, payload: bytes) -> ValidationResult:
+    try:
+        return pickle.loads(payload)
+    except Exception as e:
+        return ValidationResult(index, _source(item), error=RuntimeError(f"Result cannot be unpickled: {e}"))
+
+
+def _source(item: BatchItem) -> Optional[str]:
+    return None if isinstance(item, dict) else str(item)
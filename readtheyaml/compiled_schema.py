@@ -0,0 +1,406 @@
+import copy
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import profiling
+from .condition_graph import CopyOnWriteTree
+from .conditions import compile_when
+from .exceptions.validation_error import ValidationError
+from .ui.constants import ROOT_PATH
+
+_IMMUTABLE_SCALARS = (type(None), bool, int, float, complex, str, bytes)
+_REMOVED = object()
+# Patch value (see `CompiledSchema.revalidate`) that removes the key instead of setting it.
+DELETE = object()
+
+
+def _is_immutable(value: Any) -> bool:
+    if isinstance(value, _IMMUTABLE_SCALARS):
+        return True
+    if type(value) in (tuple, frozenset):
+        return all(_is_immutable(item) for item in value)
+    return False
+
+
+def _report(errors: Optional[List[ValidationError]], message: str, path: Tuple[str, ...]) -> None:
+    # Fail-fast mode (no error sink) keeps the historical path-less messages.
+    if errors is None:
+        raise ValidationError(message)
+    errors.append(ValidationError(message, path=".".join(path)))
+
+
+def make_default_factory(value: Any) -> Callable[[], Any]:
+    # Immutable defaults can be shared between results; everything else is copied per call
+    # so callers can never mutate the schema's default through a built config.
+    if _is_immutable(value):
+        return lambda: value
+    return lambda: copy.deepcopy(value)
+
+
+class DeferredValue:
+    """Raw value of a deferrable field whose validation/build waits until first access."""
+
+    __slots__ = ("validate", "value")
+
+    def __init__(self, validate: Callable[[Any], Any], value: Any):
+        self.validate = validate
+        self.value = value
+
+    def build(self) -> Any:
+        return self.validate(self.value)
+
+
+class CompiledSection:
+    """Flat validation plan for one section occurrence of a schema tree."""
+
+    def __init__(self, schema, path: Tuple[str, ...] = (), lazy: bool = False, profiled: bool = False):
+        self.schema = schema
+        self.path = path
+        self.label = schema.name or ROOT_PATH
+        self.field_names = tuple(schema.fields)
+        self.allowed_keys = frozenset(schema.fields) | frozenset(schema.subsections)
+        self.subsections = {
+            name: CompiledSection(subsection, path + (name,), lazy, profiled) for name, subsection in schema.subsections.items()
+        }
+        self.steps = tuple(
+            [_compile_field_step(name, field, path + (name,), lazy, profiled) for name, field in schema.fields.items()]
+            + [_compile_section_step(name, self.subsections[name]) for name in schema.subsections]
+        )
+        self.step_by_name = dict(zip(list(schema.fields) + list(schema.subsections), self.steps))
+
+    def run(
+        self, data: Any, strict: bool, context: Dict[str, Any], errors: Optional[List[ValidationError]] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Validate one section. With `errors` set, problems are appended to it (with their
+        dotted path) and the traversal continues instead of raising on the first one.
+        """
+        if not isinstance(data, dict):
+            _report(errors, f"Section '{self.label}' expects a mapping/dictionary, got {type(data).__name__}", self.path)
+            return {}, data
+
+        built_data = {}
+        # Copy-on-write: steps record their edits here and the input mapping is only
+        # copied (shallowly) when at least one key is injected or popped, so untouched
+        # subtrees are shared between `data` and `data_with_default`.
+        edits = {}
+
+        for step in self.steps:
+            step(data, built_data, edits, context, strict, errors)
+
+        allowed_keys = self.allowed_keys
+        if strict:
+            unexpected_keys = data.keys() - allowed_keys
+            if unexpected_keys:
+                if errors is None:
+                    raise ValidationError(f"Unexpected key(s) in section '{self.label}': {', '.join(sorted(unexpected_keys))}")
+                for key in sorted(unexpected_keys):
+                    _report(errors, f"Unexpected key '{key}' in section '{self.label}'", self.path + (key,))
+        else:
+            for key in data:
+                if key not in allowed_keys:
+                    built_data[key] = data[key]
+
+        if not edits:
+            return built_data, data
+        return built_data, _apply_edits(data, edits)
+
+
+def _apply_patch(data: Dict[str, Any], path: Tuple[str, ...], value: Any, key: str) -> Tuple[Dict[str, Any], int]:
+    """
+    Copy of `data` with `value` set (or removed, for `DELETE`) at `path`; only the mappings along
+    `path` are copied and missing ones are created. Also returns how many leading segments of
+    `path` already existed as mappings.
+    """
+    root = dict(data)
+    current = root
+    existing_depth = len(path) - 1
+    for depth, segment in enumerate(path[:-1]):
+        child = current.get(segment, _REMOVED)
+        if child is _REMOVED:
+            existing_depth = min(existing_depth, depth)
+            child = {}
+        elif not isinstance(child, dict):
+            raise ValidationError(f"Cannot apply patch '{key}': '{'.'.join(path[:depth + 1])}' is not a mapping")
+        else:
+            child = dict(child)
+        current[segment] = child
+        current = child
+
+    if value is DELETE:
+        current.pop(path[-1], None)
+    else:
+        current[path[-1]] = value
+    return root, existing_depth
+
+
+def _apply_edits(data: Dict[str, Any], edits: Dict[str, Any]) -> Dict[str, Any]:
+    data_with_default = dict(data)
+    for key, value in edits.items():
+        if value is _REMOVED:
+            data_with_default.pop(key, None)
+        else:
+            data_with_default[key] = value
+    return data_with_default
+
+
+def resolve_deferred(plan: CompiledSection, built_data: Dict[str, Any]) -> None:
+    """Build, in place, every `DeferredValue` left in `built_data` and its subsections."""
+    for name in plan.field_names:
+        value = built_data.get(name)
+        if type(value) is DeferredValue:
+            built_data[name] = value.build()
+    for name, subsection in plan.subsections.items():
+        section_data = built_data.get(name)
+        if isinstance(section_data, dict):
+            resolve_deferred(subsection, section_data)
+
+
+def _compile_field_step(name: str, field, path: Tuple[str, ...], lazy: bool = False, profiled: bool = False) -> Callable:
+    predicate = None if field.when is None else compile_when(field.when)
+    required = field.required
+    validate = field.validate_and_build
+    if profiled:
+        validate = profiling.timed_field_validator(validate, ".".join(path), type(field).__name__)
+    if lazy and field.deferrable:
+        build = validate
+
+        def validate(value):
+            return DeferredValue(build, value)
+
+    make_default = make_default_factory(field.default)
+    missing_message = f"Missing required field '{name}'"
+
+    def step(data, built_data, edits, context, strict, errors):
+        if predicate is not None and not predicate(context):
+            if name in data:
+                edits[name] = _REMOVED
+            return
+
+        if name in data:
+            if errors is None:
+                built_data[name] = validate(data[name])
+                return
+            try:
+                built_data[name] = validate(data[name])
+            except ValidationError as e:
+                errors.append(ValidationError(e.message, path=".".join(path)))
+        elif required:
+            _report(errors, missing_message, path)
+        else:
+            # Defaults are already validated/built by Field.post_init.
+            # Re-validating them can be harmful for fields like ObjectField
+            # where validate_and_build constructs instances.
+            built_data[name] = make_default()
+            edits[name] = make_default()
+
+    return step
+
+
+def _compile_section_step(name: str, plan: CompiledSection) -> Callable:
+    subsection = plan.schema
+    gated = subsection.when is not None
+    predicate = compile_when(subsection.when) if gated else None
+    required = subsection.required
+    has_default = subsection.has_default
+    make_default = make_default_factory(subsection.default)
+    missing_message = f"Missing required section '{name}'"
+
+    def step(data, built_data, edits, context, strict, errors):
+        if predicate is not None and not predicate(context):
+            if name in data:
+                edits[name] = _REMOVED
+            return
+
+        if name in data:
+            section_data = data[name]
+            built_data[name], section_with_default = plan.run(section_data, strict, context, errors)
+            if section_with_default is not section_data:
+                edits[name] = section_with_default
+        elif required:
+            _report(errors, missing_message, plan.path)
+            # Collecting: also report every required member missing underneath.
+            plan.run({}, strict, context, errors)
+        elif has_default:
+            built_data[name] = make_default()
+            edits[name] = make_default()
+        elif gated:
+            # For when-gated optional subsections: once active, nested required
+            # members must still be validated even if the subsection key is absent.
+            plan.run({}, strict, context, errors)
+        # Otherwise the missing optional subsection without explicit default is inactive:
+        # do not materialize/validate nested required fields.
+
+    return step
+
+
+class CompiledSchema:
+    """Validation plan lowered once from a `Schema` tree and reused across validations."""
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.root = CompiledSection(schema)
+        self._lazy_root: Optional[CompiledSection] = None
+        self._profiled_root: Optional[CompiledSection] = None
+
+    @property
+    def lazy_root(self) -> CompiledSection:
+        """Plan that leaves deferrable fields as `DeferredValue`s; compiled on first use."""
+        if self._lazy_root is None:
+            self._lazy_root = CompiledSection(self.schema, lazy=True)
+        return self._lazy_root
+
+    def _active_root(self) -> CompiledSection:
+        # The instrumented plan is only compiled (and used) while `profiling.profile_validation()` is active.
+        if profiling.active is None:
+            return self.root
+        if self._profiled_root is None:
+            self._profiled_root = CompiledSection(self.schema, profiled=True)
+        return self._profiled_root
+
+    def build_and_validate(
+        self, data: Dict[str, Any], strict: bool = True, _condition_context: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        if not isinstance(data, dict):
+            raise ValidationError(f"Section '{self.root.label}' expects a mapping/dictionary, got {type(data).__name__}")
+
+        if _condition_context is None:
+            _condition_context = self.schema._build_condition_context(data)
+
+        return self._active_root().run(data, strict, _condition_context)
+
+    def build_deferred(self, data: Dict[str, Any], strict: bool = True) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Like `build_and_validate`, but values of deferrable fields (objects, lists, tuples) are
+        left as `DeferredValue`s; build them with `resolve_deferred(self.lazy_root, ...)`.
+        Structural checks (required and unknown keys, `when` gating, defaults) still run here.
+        """
+        if not isinstance(data, dict):
+            raise ValidationError(f"Section '{self.root.label}' expects a mapping/dictionary, got {type(data).__name__}")
+
+        return self.lazy_root.run(data, strict, self.schema._build_condition_context(data))
+
+    def revalidate(
+        self, previous: Tuple[Dict[str, Any], ...], patch: Dict[str, Any], strict: bool = True
+    ) -> Tuple[Dict[str, Any], ...]:
+        """
+        Validate a previous result with `patch` applied, re-running only the members the patch
+        touches and the members whose `when` depends on them (transitively).
+
+        `previous` is a `(built, data_with_default, raw)` triple, `raw` being the data the result was
+        built from: the patch is applied to it and the returned triple (patched `raw` last) equals
+        `(*build_and_validate(patched raw), patched raw)`, so it can be fed to the next call.
+        A `(built, data_with_default)` pair is also accepted; the patch then applies to
+        `data_with_default`, where values of members inactive at that point are already gone.
+
+        `patch` maps dotted paths to new values, `DELETE` removing the key. The previous built output
+        is reused for every member that is not re-run; no input is mutated.
+        """
+        built, data_with_default = previous[:2]
+        raw = previous[2] if len(previous) > 2 else None
+        graph = self.schema.condition_graph()
+        data = data_with_default
+        touched = set()
+        full_run = False
+
+        for key, value in patch.items():
+            path = tuple(key.split("."))
+            data, existing_depth = _apply_patch(data, path, value, key)
+            if raw is not None:
+                # Sections filled in from their default exist in `data_with_default` only: whether
+                # the patch creates a section is decided on the source.
+                raw, existing_depth = _apply_patch(raw, path, value, key)
+            owner = graph.owner_of(path)
+            if owner is None:
+                # Key outside the schema: the strict check and `when` lookups of the root may change.
+                full_run = True
+                continue
+            if raw is None:
+                # Without the source a default-filled section cannot be told from a supplied one:
+                # re-run the outermost section that could have been defaulted as a whole.
+                for end in range(1, len(owner)):
+                    node = graph.nodes[owner[:end]]
+                    if node.is_section and node.can_default:
+                        existing_depth = min(existing_depth, end - 1)
+                        break
+            # Sections created by the patch are run as a whole.
+            touched.add(owner[:existing_depth + 1] if existing_depth < len(owner) - 1 else owner)
+
+        if full_run:
+            return self._full_revalidate(data, raw, strict)
+
+        affected = set(touched)
+        pending = list(touched)
+        while pending:
+            for dependent in graph.dependents[pending.pop()]:
+                if dependent not in affected:
+                    affected.add(dependent)
+                    pending.append(dependent)
+
+        # Members under an affected section are re-run by that section's step.
+        members = [path for path in affected if not any(path[:end] in affected for end in range(1, len(path)))]
+        members.sort(key=lambda path: graph.nodes[path].order)
+
+        context = graph.build_observed_context(data if raw is None else raw)
+        data_tree = CopyOnWriteTree(data)
+        built_tree = CopyOnWriteTree(built)
+        raw_tree = CopyOnWriteTree(raw) if raw is not None else None
+        for path in members:
+            parent_path, name = path[:-1], path[-1]
+            section_data = data_tree.lookup(parent_path)
+            if section_data is None:
+                # The parent section is absent (and was not touched): so is this member.
+                continue
+            if built_tree.lookup(parent_path) is None:
+                return self._full_revalidate(data, raw, strict)
+
+            if raw_tree is not None:
+                # Re-run members from the source value, which `data_with_default` may have pruned.
+                raw_section = raw_tree.lookup(parent_path)
+                if raw_section is not None and section_data.get(name, _REMOVED) is not raw_section.get(name, _REMOVED):
+                    section_data = data_tree.owned(parent_path)
+                    if name in raw_section:
+                        section_data[name] = raw_section[name]
+                    else:
+                        section_data.pop(name, None)
+
+            plan = self.root
+            for segment in parent_path:
+                plan = plan.subsections[segment]
+            built_data = built_tree.owned(parent_path)
+            built_data.pop(name, None)
+            edits = {}
+            plan.step_by_name[name](section_data, built_data, edits, context, strict, None)
+            if edits:
+                owned_data = data_tree.owned(parent_path)
+                for key, value in edits.items():
+                    if value is _REMOVED:
+                        owned_data.pop(key, None)
+                    else:
+                        owned_data[key] = value
+
+        if raw is None:
+            return built_tree.root, data_tree.root
+        return built_tree.root, data_tree.root, raw
+
+    def _full_revalidate(self, data: Dict[str, Any], raw: Optional[Dict[str, Any]], strict: bool) -> Tuple[Dict[str, Any], ...]:
+        if raw is None:
+            return self.build_and_validate(data, strict=strict)
+        return (*self.build_and_validate(raw, strict=strict), raw)
+
+    def validate_all(
+        self, data: Dict[str, Any], strict: bool = True
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], List[ValidationError]]:
+        """
+        Validate in a single traversal, collecting every error instead of stopping at the first.
+
+        Returns `(built, data_with_default, errors)`; each error carries the dotted path of the
+        offending member in `error.path`. The outputs are only meaningful when `errors` is empty.
+        """
+        errors: List[ValidationError] = []
+        if not isinstance(data, dict):
+            _report(errors, f"Section '{self.root.label}' expects a mapping/dictionary, got {type(data).__name__}", ())
+            return {}, data, errors
+
+        context = self.schema._build_condition_context(data)
+        built, data_with_default = self._active_root().run(data, strict, context, errors)
+        return built, data_with_default, errors
@@ -0,0 +1,216 @@
+import heapq
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .conditions import compile_when, condition_field_paths
+from .exceptions.format_error import FormatError
+
+_MISSING = object()
+
+
+class ConditionNode:
+    """One schema member (field or subsection) at an absolute path of the config."""
+
+    __slots__ = ("path", "name", "parent_path", "is_section", "when", "predicate", "can_default", "default", "order")
+
+    def __init__(self, path: Tuple[str, ...], is_section: bool, when: Optional[dict], can_default: bool, default: Any, order: int):
+        self.path = path
+        self.name = path[-1]
+        self.parent_path = path[:-1]
+        self.is_section = is_section
+        self.when = when
+        self.predicate = compile_when(when)
+        self.can_default = can_default
+        self.default = default
+        self.order = order
+
+
+class ConditionGraph:
+    """
+    Static dependency graph between schema members and the `when` conditions gating them.
+
+    Every member depends on its parent section and on the members owning the paths its
+    `when` reads. Members are stored in topological order, so the condition context
+    (inactive payload pruned, defaults injected) is built in a single pass.
+    """
+
+    def __init__(self, schema):
+        self.nodes: Dict[Tuple[str, ...], ConditionNode] = {}
+        self._collect(schema, ())
+        self.dependents: Dict[Tuple[str, ...], List[Tuple[str, ...]]] = {path: [] for path in self.nodes}
+        self._sources: Dict[Tuple[str, ...], Set[Tuple[str, ...]]] = {}
+        self._link()
+        self.order: Tuple[ConditionNode, ...] = self._topological_order()
+        self.observed_order: Tuple[ConditionNode, ...] = self._observed_order()
+
+    def _collect(self, schema, section_path: Tuple[str, ...]) -> None:
+        for name, field in schema.fields.items():
+            path = section_path + (name,)
+            self.nodes[path] = ConditionNode(
+                path,
+                is_section=False,
+                when=field.when,
+                can_default=not field.required,
+                default=getattr(field, "raw_default", field.default),
+                order=len(self.nodes),
+            )
+
+        for name, subsection in schema.subsections.items():
+            path = section_path + (name,)
+            self.nodes[path] = ConditionNode(
+                path,
+                is_section=True,
+                when=subsection.when,
+                can_default=subsection.has_default,
+                default=subsection.default,
+                order=len(self.nodes),
+            )
+            self._collect(subsection, path)
+
+    def _link(self) -> None:
+        for path, node in self.nodes.items():
+            sources = set()
+            if node.parent_path:
+                sources.add(node.parent_path)
+
+            for field_path in condition_field_paths(node.when):
+                owner = self.owner_of(tuple(field_path.split(".")))
+                # A member reading its own payload (or a section reading one of its
+                # children) is evaluated against the value as provided: no edge.
+                if owner is None or owner[:len(path)] == path:
+                    continue
+                sources.add(owner)
+
+            self._sources[path] = sources
+            for source in sources:
+                self.dependents[source].append(path)
+
+    def owner_of(self, path: Tuple[str, ...]) -> Optional[Tuple[str, ...]]:
+        """Return the deepest schema member whose path is a prefix of `path`."""
+        for end in range(len(path), 0, -1):
+            if path[:end] in self.nodes:
+                return path[:end]
+        return None
+
+    def _topological_order(self) -> Tuple[ConditionNode, ...]:
+        in_degree = {path: 0 for path in self.nodes}
+        for targets in self.dependents.values():
+            for target in targets:
+                in_degree[target] += 1
+
+        # Ties are broken by declaration order so independent members keep the
+        # schema's field-then-subsection evaluation order.
+        ready = [(node.order, path) for path, node in self.nodes.items() if in_degree[path] == 0]
+        heapq.heapify(ready)
+        ordered = []
+        while ready:
+            _, path = heapq.heappop(ready)
+            ordered.append(self.nodes[path])
+            for target in self.dependents[path]:
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    heapq.heappush(ready, (self.nodes[target].order, target))
+
+        if len(ordered) != len(self.nodes):
+            cycle = self._find_cycle({path for path, degree in in_degree.items() if degree > 0})
+            chain = " -> ".join(".".join(path) for path in cycle + cycle[:1])
+            raise FormatError(f"Cyclic 'when' dependencies (each member depends on the next): {chain}")
+
+        return tuple(ordered)
+
+    def _find_cycle(self, remaining: Set[Tuple[str, ...]]) -> List[Tuple[str, ...]]:
+        # Every member left over by the sort still has a source among the left-over members, so
+        # walking sources backwards must revisit one: the walk from there is a cycle. Members only
+        # downstream of it are not part of the walk's loop.
+        walk: List[Tuple[str, ...]] = []
+        position: Dict[Tuple[str, ...], int] = {}
+        path = min(remaining, key=lambda member: self.nodes[member].order)
+        while path not in position:
+            position[path] = len(walk)
+            walk.append(path)
+            path = min((source for source in self._sources[path] if source in remaining), key=lambda member: self.nodes[member].order)
+
+        cycle = walk[position[path]:]
+        start = min(range(len(cycle)), key=lambda index: self.nodes[cycle[index]].order)
+        return cycle[start:] + cycle[:start]
+
+    def _observed_order(self) -> Tuple[ConditionNode, ...]:
+        # Members a `when` can observe: the owners of the paths conditions read, their subtrees,
+        # and (transitively) every member their presence or default depends on.
+        read = set()
+        for node in self.nodes.values():
+            for field_path in condition_field_paths(node.when):
+                owner = self.owner_of(tuple(field_path.split(".")))
+                if owner is not None:
+                    read.add(owner)
+
+        pending = [path for path in self.nodes if any(path[:end] in read for end in range(1, len(path) + 1))]
+        observed = set()
+        while pending:
+            path = pending.pop()
+            if path not in observed:
+                observed.add(path)
+                pending.extend(self._sources[path])
+        return tuple(node for node in self.order if node.path in observed)
+
+    def build_context(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return `data` with inactive members removed and active defaults injected.
+
+        Mappings are copied only along paths that change; the rest is shared with `data`.
+        """
+        return self._apply_activity(data, self.order)
+
+    def build_observed_context(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Like `build_context`, but only the members `when` conditions can observe are processed:
+        enough to evaluate every predicate, at a cost independent of the rest of the schema.
+        """
+        return self._apply_activity(data, self.observed_order)
+
+    @staticmethod
+    def _apply_activity(data: Dict[str, Any], nodes: Tuple[ConditionNode, ...]) -> Dict[str, Any]:
+        context = CopyOnWriteTree(data)
+        for node in nodes:
+            container = context.lookup(node.parent_path)
+            if container is None:
+                continue
+
+            if node.name in container:
+                if not node.predicate(context.root):
+                    del context.owned(node.parent_path)[node.name]
+            elif node.can_default and node.predicate(context.root):
+                context.owned(node.parent_path)[node.name] = node.default
+
+        return context.root
+
+
+class CopyOnWriteTree:
+    """Nested mappings copied on first write along a path; untouched subtrees stay shared."""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.root = data
+        self._owned: Dict[int, Dict[str, Any]] = {}
+
+    def lookup(self, path: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        current: Any = self.root
+        for segment in path:
+            current = current.get(segment, _MISSING)
+            if not isinstance(current, dict):
+                return None
+        return current
+
+    def owned(self, path: Tuple[str, ...]) -> Dict[str, Any]:
+        self.root = self._own(self.root)
+        current = self.root
+        for segment in path:
+            child = self._own(current[segment])
+            current[segment] = child
+            current = child
+        return current
+
+    def _own(self, mapping: Dict[str, Any]) -> Dict[str, Any]:
+        if id(mapping) in self._owned:
+            return mapping
+        copied = dict(mapping)
+        self._owned[id(copied)] = copied
+        return copied
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import operator
 from copy import deepcopy
 from difflib import get_close_matches
 from enum import Enum
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict
 
 from readtheyaml.exceptions.format_error import FormatError
 
@@ -54,6 +55,15 @@ _ATOMIC_OP_ALIASES = {
     "nin": AtomicOp.NOT_IN,
 }
 
+_COMPARISON_OPERATORS = {
+    AtomicOp.GT: operator.gt,
+    AtomicOp.GE: operator.ge,
+    AtomicOp.LT: operator.lt,
+    AtomicOp.LE: operator.le,
+}
+
+_MISSING = object()
+
 _COMBINATOR_ALIASES = {
     "all": Combinator.ALL,
     "and": Combinator.ALL,
@@ -63,13 +73,36 @@ _COMBINATOR_ALIASES = {
 }
 
 
-def parse_when(condition: Any, location: str = "when") -> dict | None:
+class ParsedCondition(dict):
+    """
+    Parsed `when` condition.
+
+    Behaves like the plain parsed dict and lazily carries `predicate`, the condition
+    compiled into a closure (pre-split paths, set-backed membership). The predicate is
+    rebuilt on demand after copying/pickling, so it never has to be serialized.
+    """
+
+    __slots__ = ("_predicate",)
+
+    @property
+    def predicate(self) -> Callable[[Dict[str, Any]], bool]:
+        try:
+            return self._predicate
+        except AttributeError:
+            self._predicate = _compile_condition(self)
+            return self._predicate
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
+def parse_when(condition: Any, location: str = "when") -> ParsedCondition | None:
     if condition is None:
         return None
     return _parse_condition(condition, location)
 
 
-def _parse_condition(condition: Any, location: str) -> dict:
+def _parse_condition(condition: Any, location: str) -> ParsedCondition:
     if not isinstance(condition, dict):
         raise FormatError(f"Invalid {location}: must be a mapping/dictionary.")
 
@@ -90,12 +123,12 @@ def _parse_condition(condition: Any, location: str) -> dict:
             if not isinstance(raw_children, list) or not raw_children:
                 raise FormatError(f"Invalid {location}.{source_key}: must be a non-empty list.")
 
-            return {
-                "kind": combinator,
-                "conditions": [_parse_condition(child, f"{location}.{source_key}[{index}]") for index, child in enumerate(raw_children)]
-            }
+            return ParsedCondition(
+                kind=combinator,
+                conditions=[_parse_condition(child, f"{location}.{source_key}[{index}]") for index, child in enumerate(raw_children)],
+            )
 
-        return {"kind": Combinator.NOT, "condition": _parse_condition(condition[source_key], f"{location}.{source_key}")}
+        return ParsedCondition(kind=Combinator.NOT, condition=_parse_condition(condition[source_key], f"{location}.{source_key}"))
 
     _raise_if_misspelled_combinator(condition, location)
 
@@ -128,47 +161,133 @@ def _parse_condition(condition: Any, location: str) -> dict:
         if not isinstance(haystack, (list, tuple, set, frozenset)):
             raise FormatError(f"Invalid {location}.value: operator '{parsed_op.value}' expects a list/tuple/set.")
 
-    parsed = {"kind": "atomic", "field": field_path, "op": parsed_op}
+    parsed = ParsedCondition(kind="atomic", field=field_path, op=parsed_op)
     if has_value:
         parsed["value"] = deepcopy(condition["value"])
     return parsed
 
 
 def evaluate_when(condition: dict | None, context: Dict[str, Any]) -> bool:
+    return compile_when(condition)(context)
+
+
+def compile_when(condition: dict | None) -> Callable[[Dict[str, Any]], bool]:
     if condition is None:
-        return True
+        return _always_true
+    if isinstance(condition, ParsedCondition):
+        return condition.predicate
+    return _compile_condition(condition)
+
+
+def _always_true(context: Dict[str, Any]) -> bool:
+    return True
+
 
+def _compile_condition(condition: dict) -> Callable[[Dict[str, Any]], bool]:
     kind = condition["kind"]
     if kind == Combinator.ALL:
-        return all(evaluate_when(child, context) for child in condition["conditions"])
+        children = tuple(compile_when(child) for child in condition["conditions"])
+        return lambda context: all(child(context) for child in children)
     if kind == Combinator.ANY:
-        return any(evaluate_when(child, context) for child in condition["conditions"])
+        children = tuple(compile_when(child) for child in condition["conditions"])
+        return lambda context: any(child(context) for child in children)
     if kind == Combinator.NOT:
-        return not evaluate_when(condition["condition"], context)
+        child = compile_when(condition["condition"])
+        return lambda context: not child(context)
 
-    field_exists, field_value = _resolve_path(context, condition["field"])
-    op = condition["op"]
+    lookup = _compile_path_lookup(condition["field"])
+    op = AtomicOp(condition["op"])
 
     if op == AtomicOp.EXISTS:
-        return field_exists
+        return lambda context: lookup(context) is not _MISSING
     if op == AtomicOp.NOT_EXISTS:
-        return not field_exists
-    if not field_exists:
-        return False
+        return lambda context: lookup(context) is _MISSING
 
     target = condition["value"]
     if op == AtomicOp.EQ:
-        return field_value == target
-    if op == AtomicOp.NE:
-        return field_value != target
-    if op in {AtomicOp.GT, AtomicOp.GE, AtomicOp.LT, AtomicOp.LE}:
-        return _safe_cmp(field_value, target, op)
-    if op == AtomicOp.IN:
-        return _safe_membership(field_value, target)
-    if op == AtomicOp.NOT_IN:
-        return not _safe_membership(field_value, target)
+        def predicate(context):
+            value = lookup(context)
+            return value is not _MISSING and value == target
+    elif op == AtomicOp.NE:
+        def predicate(context):
+            value = lookup(context)
+            return value is not _MISSING and value != target
+    elif op in _COMPARISON_OPERATORS:
+        compare = _COMPARISON_OPERATORS[op]
+
+        def predicate(context):
+            value = lookup(context)
+            if value is _MISSING:
+                return False
+            try:
+                return compare(value, target)
+            except TypeError:
+                return False
+    else:
+        contains = _compile_membership(target)
+        expected = op == AtomicOp.IN
+
+        def predicate(context):
+            value = lookup(context)
+            return value is not _MISSING and contains(value) is expected
+
+    return predicate
+
+
+def _compile_path_lookup(field_path: str) -> Callable[[Dict[str, Any]], Any]:
+    segments = tuple(field_path.split("."))
+    if len(segments) == 1:
+        key = segments[0]
+
+        def lookup(context):
+            if not isinstance(context, dict):
+                return _MISSING
+            return context.get(key, _MISSING)
+
+        return lookup
+
+    def lookup(context):
+        current = context
+        for segment in segments:
+            if not isinstance(current, dict):
+                return _MISSING
+            current = current.get(segment, _MISSING)
+            if current is _MISSING:
+                return _MISSING
+        return current
+
+    return lookup
+
+
+def _compile_membership(haystack: Any) -> Callable[[Any], bool]:
+    try:
+        members = frozenset(haystack)
+    except TypeError:
+        return lambda needle: _safe_membership(needle, haystack)
+
+    def contains(needle):
+        try:
+            return needle in members
+        except TypeError:
+            # Unhashable needles (lists/dicts) can still equal an item: fall back to a scan.
+            return _safe_membership(needle, haystack)
+
+    return contains
 
-    return False
+
+def condition_field_paths(condition: dict | None) -> list[str]:
+    if condition is None:
+        return []
+
+    kind = condition["kind"]
+    if kind in {Combinator.ALL, Combinator.ANY}:
+        paths = []
+        for child in condition["conditions"]:
+            paths.extend(condition_field_paths(child))
+        return paths
+    if kind == Combinator.NOT:
+        return condition_field_paths(condition["condition"])
+    return [condition["field"]]
 
 
 def format_when_human(condition: dict | None) -> str:
@@ -214,30 +333,6 @@ def format_when_human(condition: dict | None) -> str:
     return str(condition)
 
 
-def _resolve_path(data: Dict[str, Any], field_path: str) -> Tuple[bool, Any]:
-    current: Any = data
-    for segment in field_path.split("."):
-        if not isinstance(current, dict) or segment not in current:
-            return False, None
-        current = current[segment]
-    return True, current
-
-
-def _safe_cmp(left: Any, right: Any, op: AtomicOp) -> bool:
-    try:
-        if op == AtomicOp.GT:
-            return left > right
-        if op == AtomicOp.GE:
-            return left >= right
-        if op == AtomicOp.LT:
-            return left < right
-        if op == AtomicOp.LE:
-            return left <= right
-        return False
-    except TypeError:
-        return False
-
-
 def _safe_membership(needle: Any, haystack: Any) -> bool:
     try:
         return needle in haystack
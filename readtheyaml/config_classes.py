@@ -0,0 +1,118 @@
+import re
+from typing import Any, Dict, FrozenSet, Iterator, Optional
+
+EXTRAS_SLOT = "_extras"
+
+
+class ConfigSection:
+    """
+    Base of the frozen `__slots__` classes generated per schema section (see `make_config_class`).
+
+    Fields and subsections with identifier names are slots, read as attributes (`config.network.port`)
+    or items (`config["network"]["port"]`). Other keys (unknown keys kept with `strict=False`,
+    names that are not identifiers or start with `_`) live in the `_extras` mapping and are
+    only readable as items. Fields skipped by `when` are unset, like missing dict keys.
+
+    Only the sections are frozen: list and dict values inside them stay mutable. Generated classes
+    are not importable, so instances cannot be pickled; pickle `config_to_dict(config)` instead.
+    """
+
+    __slots__ = (EXTRAS_SLOT,)
+    _slot_names: FrozenSet[str] = frozenset()
+    _subsection_classes: Dict[str, type] = {}
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen: cannot set '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen: cannot delete '{name}'")
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._slot_names:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        extras = self._extras
+        if extras is not None and key in extras:
+            return extras[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        for name in type(self).__slots__:
+            if hasattr(self, name):
+                yield name
+        if self._extras is not None:
+            yield from self._extras
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return config_to_dict(self) == config_to_dict(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        members = ", ".join(f"{key}={self[key]!r}" for key in self)
+        return f"{type(self).__name__}({members})"
+
+
+def make_config_class(schema, class_name: str = "Config") -> type:
+    """Generate the `ConfigSection` subclass of `schema` and, recursively, of its subsections."""
+    names = list(schema.fields) + list(schema.subsections)
+    slots = tuple(name for name in names if _is_slot_name(name))
+    subsection_classes = {
+        name: make_config_class(subsection, _class_name(name)) for name, subsection in schema.subsections.items()
+    }
+    return type(
+        class_name,
+        (ConfigSection,),
+        {"__slots__": slots, "_slot_names": frozenset(slots), "_subsection_classes": subsection_classes, "__module__": __name__},
+    )
+
+
+def to_config(config_class: type, built: Dict[str, Any]) -> ConfigSection:
+    """Wrap a built section (as returned by `build_and_validate`) into `config_class` instances."""
+    config = object.__new__(config_class)
+    slot_names = config_class._slot_names
+    subsection_classes = config_class._subsection_classes
+    extras: Optional[Dict[str, Any]] = None
+
+    for key, value in built.items():
+        subsection_class = subsection_classes.get(key)
+        if subsection_class is not None and isinstance(value, dict):
+            value = to_config(subsection_class, value)
+        if key in slot_names:
+            object.__setattr__(config, key, value)
+        else:
+            if extras is None:
+                extras = {}
+            extras[key] = value
+
+    object.__setattr__(config, EXTRAS_SLOT, extras)
+    return config
+
+
+def config_to_dict(config: ConfigSection) -> Dict[str, Any]:
+    """Nested plain-dict copy of a config, as `build_and_validate` would have returned it."""
+    output = {}
+    for key in config:
+        value = config[key]
+        output[key] = config_to_dict(value) if isinstance(value, ConfigSection) else value
+    return output
+
+
+def _is_slot_name(name: str) -> bool:
+    return name.isidentifier() and not name.startswith("_")
+
+
+def _class_name(section_name: str) -> str:
+    words = re.split(r"[^0-9A-Za-z]+", section_name)
+    return "".join(word[:1].upper() + word[1:] for word in words) + "Config"
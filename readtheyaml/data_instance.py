@@ -1,23 +1,153 @@
 import sys
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+from readtheyaml import yaml_backend
+from readtheyaml.compiled_schema import DeferredValue, resolve_deferred
+from readtheyaml.frozen import freeze
+
+PATH_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def parse_path(key: str) -> Tuple[str, ...]:
+    if not key:
+        raise KeyError("Empty key is not allowed.")
+    return tuple(key.split("."))
+
+
+def _path_walker(keys: Tuple[str, ...]) -> Callable[[Any], Any]:
+    # Unrolled for the usual shallow paths; deeper ones loop.
+    if len(keys) == 1:
+        (k0,) = keys
+        return lambda root: root[k0]
+    if len(keys) == 2:
+        k0, k1 = keys
+        return lambda root: root[k0][k1]
+    if len(keys) == 3:
+        k0, k1, k2 = keys
+        return lambda root: root[k0][k1][k2]
+
+    def walk(root):
+        for k in keys:
+            root = root[k]
+        return root
+
+    return walk
 
-import yaml
 
 class DataInstance:
-    def __init__(self, data: dict, schema, strict=True):
+    def __init__(self, data: dict, schema, strict=True, lazy=False, frozen=False):
+        """
+        With `lazy=True`, only the structural checks (required and unknown keys, `when` gating,
+        defaults) run here. Deferrable fields (objects, lists, tuples) are validated and built on
+        the first read of a path that contains them, so their errors are raised at that point
+        (`dump()` writes `data_with_default`, which may hold values that were never validated).
+
+        With `frozen=True`, `built` is immutable (`FrozenDict` mappings, tuples for lists) and can
+        be handed to any number of threads without copying.
+        """
+        if lazy and frozen:
+            raise ValueError("DataInstance: lazy and frozen modes cannot be combined.")
         self.schema = schema
         self.raw = data
+        # Lazy mode only: plan of the sections still holding deferred values (None once all are built).
+        self._lazy_root = None
 
-        self.built, self.data_with_default = self.schema.build_and_validate(self.raw, strict=strict)
+        if lazy:
+            plan = schema.compile()
+            self._built, self.data_with_default = plan.build_deferred(self.raw, strict=strict)
+            self._lazy_root = plan.lazy_root
+            self._materialized = set()
+            self._lock = threading.RLock()
+        else:
+            self._built, self.data_with_default = self.schema.build_and_validate(self.raw, strict=strict)
+            if frozen:
+                self._built = freeze(self._built)
+
+    @property
+    def built(self):
+        if self._lazy_root is not None:
+            with self._lock:
+                if self._lazy_root is not None:
+                    resolve_deferred(self._lazy_root, self._built)
+                    self._lazy_root = None
+        return self._built
+
+    @built.setter
+    def built(self, value):
+        # Replacing the output wholesale leaves nothing deferred to build.
+        if self._lazy_root is not None:
+            with self._lock:
+                self._lazy_root = None
+        self._built = value
 
     def __getitem__(self, key):
-        if not key:
-            raise KeyError("Empty key is not allowed.")
+        keys = parse_path(key)
+        if self._lazy_root is not None:
+            return self._get_lazy(keys)
 
-        keys = key.split(".")
-        result = self.built
+        result = self._built
         for k in keys:
             result = result[k]
         return result
 
+    @staticmethod
+    def accessor(key: str) -> Callable[["DataInstance"], Any]:
+        """
+        Precompiled getter for a dotted key, reusable across instances:
+        `get_port = DataInstance.accessor("db.port")`, then `get_port(instance)`.
+        """
+        keys = parse_path(key)
+        walk = _path_walker(keys)
+
+        def get(instance: "DataInstance") -> Any:
+            if instance._lazy_root is not None:
+                return instance._get_lazy(keys)
+            return walk(instance._built)
+
+        return get
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Resolve several dotted keys at once, walking each shared prefix (e.g. `db` in `db.host`/`db.port`) once."""
+        paths = {key: parse_path(key) for key in keys}
+        if self._lazy_root is not None:
+            return {key: self._get_lazy(path) for key, path in paths.items()}
+
+        resolved = {(): self._built}
+        values = {}
+        for key, path in paths.items():
+            depth = len(path)
+            while path[:depth] not in resolved:
+                depth -= 1
+            value = resolved[path[:depth]]
+            for i in range(depth, len(path)):
+                value = value[path[i]]
+                resolved[path[:i + 1]] = value
+            values[key] = value
+        return values
+
+    def _get_lazy(self, keys):
+        with self._lock:
+            plan = self._lazy_root
+            if plan is None:
+                return self[".".join(keys)]
+
+            result = self._built
+            for k in keys:
+                value = result[k]
+                if type(value) is DeferredValue:
+                    value = result[k] = value.build()
+                plan = plan.subsections.get(k) if plan is not None else None
+                result = value
+
+            # A whole section was requested: build what is still deferred underneath it once.
+            path = tuple(keys)
+            if plan is not None and path not in self._materialized and isinstance(result, dict):
+                resolve_deferred(plan, result)
+                self._materialized.add(path)
+            return result
+
     def dump(self, file=None):
-        yaml.safe_dump(self.data_with_default, file or sys.stdout)
+        yaml_backend.safe_dump(self.data_with_default, file or sys.stdout)
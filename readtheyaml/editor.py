@@ -7,7 +7,7 @@ from typing import Any, Dict, Optional, Tuple
 
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-import yaml
+from readtheyaml import yaml_backend
 
 from readtheyaml.exceptions.format_error import FormatError
 from readtheyaml.exceptions.validation_error import ValidationError
@@ -763,8 +763,8 @@ class EditorApp:
                 if raw == "":
                     return True, {}, ""
                 try:
-                    parsed = yaml.safe_load(raw)
-                except yaml.YAMLError:
+                    parsed = yaml_backend.safe_load(raw)
+                except yaml_backend.YAMLError:
                     return False, {}, "Extra kwargs must be valid YAML."
                 if parsed is None:
                     return True, {}, ""
@@ -911,14 +911,14 @@ class EditorApp:
         parsed_value: Any = raw_text
         if type_name.startswith("list("):
             try:
-                parsed_value = yaml.safe_load(raw_text)
-            except yaml.YAMLError:
+                parsed_value = yaml_backend.safe_load(raw_text)
+            except yaml_backend.YAMLError:
                 return False, None, "Invalid YAML list value."
         elif type_name.startswith("tuple("):
             if not (text_value.startswith("(") and text_value.endswith(")")):
                 try:
-                    candidate = yaml.safe_load(raw_text)
-                except yaml.YAMLError:
+                    candidate = yaml_backend.safe_load(raw_text)
+                except yaml_backend.YAMLError:
                     candidate = raw_text
                 if isinstance(candidate, (list, tuple)):
                     parsed_value = tuple(candidate)
@@ -926,8 +926,8 @@ class EditorApp:
                     parsed_value = raw_text
         elif type_name == "any" or type_name.startswith("union("):
             try:
-                parsed_value = yaml.safe_load(raw_text)
-            except yaml.YAMLError:
+                parsed_value = yaml_backend.safe_load(raw_text)
+            except yaml_backend.YAMLError:
                 parsed_value = raw_text
 
             # Keep tuple-literal ergonomics consistent across editors.
@@ -12,3 +12,6 @@ class ReadTheYAMLError(Exception):
 
     def __str__(self) -> str:
         return self.full_message
+
+    def __reduce__(self):
+        return self.__class__, (self.message, self.path)
@@ -3,6 +3,8 @@ from readtheyaml.fields.field import Field
 
 
 class AnyField(Field):
+    type_heads = frozenset({"any", "Any", "ANY"})
+
     def __init__(self, *, when=None, **kwargs):
         required = kwargs.get("required", True)
         if not required and "default" not in kwargs:
@@ -14,7 +16,7 @@ class AnyField(Field):
         return value
 
     @staticmethod
-    def from_type_string(type_str: str, name: str, factory, **kwargs):
-        if type_str in {"any", "Any", "ANY"}:
+    def from_type_node(node, name: str, factory, **kwargs):
+        if node.head in AnyField.type_heads and not node.bracketed:
             return AnyField(name=name, **kwargs)
         return None
@@ -3,30 +3,37 @@ from readtheyaml.fields.field import Field
 
 
 class BoolField(Field):
+    type_heads = frozenset({"Bool", "bool", "BOOL"})
+
     def __init__(self, *, when=None, **kwargs):
         super().__init__(when=when, field_type="bool", **kwargs)
 
     def validate_and_build(self, value):
+        if value is True or value is False:
+            return value
+
         if type(value) == str:
-            if value.lower() in {"none", "null", ""}:
+            lowered = value.lower()
+            if lowered == "true":
+                return True
+            if lowered == "false":
+                return False
+            if lowered in {"none", "null", ""}:
                 raise ValidationError(f"Field '{self.name}': Must be of type bool, contains None or null or empty")
-            if value.lower() not in {"true", "false"}:
-                raise ValidationError(f"Field '{self.name}': Expected a boolean value.")
+            raise ValidationError(f"Field '{self.name}': Expected a boolean value.")
 
-            value = True if value.lower() in {"true"} else False
-        else:
-            if not isinstance(value, bool):
-                raise ValidationError(f"Field '{self.name}': Expected a boolean value, got {type(value).__name__}")
+        raise ValidationError(f"Field '{self.name}': Expected a boolean value, got {type(value).__name__}")
 
-        return value
+    def accepted_types(self):
+        return (bool, str)
 
     def ui_widget_type(self):
         from readtheyaml.ui.widgets import BoolFieldWidget
         return BoolFieldWidget
 
     @staticmethod
-    def from_type_string(type_str: str, name: str, factory, **kwargs):
-        if type_str in {"Bool", "bool", "BOOL"}:
+    def from_type_node(node, name: str, factory, **kwargs):
+        if node.head in BoolField.type_heads and not node.bracketed:
             return BoolField(name=name, **kwargs)
 
         return None
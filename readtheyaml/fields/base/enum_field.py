@@ -6,6 +6,8 @@ from readtheyaml.fields.field import Field
 
 
 class EnumField(Field):
+    type_heads = frozenset({"enum", "Enum", "ENUM"})
+
     def __init__(self, values=None, *, when=None, **kwargs):
         super().__init__(when=when, field_type="enum", **kwargs)
         if not values or not isinstance(values, (list, tuple) or (isinstance(values, (list, tuple)) and len(values) == 0)):
@@ -25,8 +27,8 @@ class EnumField(Field):
         return {"enum_values": list(self.choices)}
 
     @staticmethod
-    def from_type_string(type_str: str, name: str, factory, **kwargs):
-        if type_str in {"enum", "Enum", "ENUM"}:
+    def from_type_node(node, name: str, factory, **kwargs):
+        if node.head in EnumField.type_heads and not node.bracketed:
             return EnumField(name=name, **kwargs)
 
         return None
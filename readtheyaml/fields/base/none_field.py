@@ -3,6 +3,8 @@ from readtheyaml.fields.field import Field
 
 
 class NoneField(Field):
+    type_heads = frozenset({"None", "none", "NONE"})
+
     def __init__(self, *, when=None, **kwargs):
         super().__init__(when=when, field_type="none", **kwargs)
 
@@ -12,13 +14,16 @@ class NoneField(Field):
 
         raise ValidationError(f"Field '{self.name}': must be null/None")
 
+    def accepted_types(self):
+        return (type(None), str)
+
     def ui_widget_type(self):
         from readtheyaml.ui.widgets import NoneFieldWidget
         return NoneFieldWidget
 
     @staticmethod
-    def from_type_string(type_str: str, name: str, factory, **kwargs):
-        if type_str in {"None", "none", "NONE"}:
+    def from_type_node(node, name: str, factory, **kwargs):
+        if node.head in NoneField.type_heads and not node.bracketed:
             return NoneField(name=name, **kwargs)
 
         return None
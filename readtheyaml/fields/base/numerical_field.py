@@ -1,3 +1,5 @@
+from typing import SupportsFloat, SupportsIndex, SupportsInt
+
 from readtheyaml.exceptions.format_error import FormatError
 from readtheyaml.exceptions.validation_error import ValidationError
 from readtheyaml.fields.field import Field
@@ -5,6 +7,9 @@ from readtheyaml.fields.field_validation_helpers import find_and_validate_bounds
 
 
 class NumericalField(Field):
+    type_heads = frozenset({"int", "Int", "INT", "float", "Float", "FLOAT"})
+    validator_attributes = frozenset({"name", "value_type", "min_value", "max_value"})
+
     def __init__(self, value_type=int, min_value=None, max_value=None, value_range=None, *, when=None, **kwargs):
         super().__init__(when=when, field_type=value_type.__name__, **kwargs)
 
@@ -19,26 +24,75 @@ class NumericalField(Field):
         except FormatError as e:
             raise ValidationError(f"Field '{self.name}': {e}")
 
+        self._validator = self._build_validator()
+
     def validate_and_build(self, value):
-        try:
-            if str(value).lower() in {"true", "false"}:
-                raise ValidationError(f"Field '{self.name}': Must be of type {self.value_type.__name__}, contains True or False.")
+        return self._validator(value)
+
+    def _build_validator(self):
+        name = self.name
+        value_type = self.value_type
+        min_value = self.min_value
+        max_value = self.max_value
+        type_message = f"Field '{name}': Must be of type {value_type.__name__}"
+
+        def convert_any(value):
+            try:
+                if str(value).lower() in {"true", "false"}:
+                    raise ValidationError(f"Field '{name}': Must be of type {value_type.__name__}, contains True or False.")
+
+                new_value = value_type(value)
+                if isinstance(value, float) and value_type is int:
+                    if not value.is_integer():
+                        raise ValidationError(f"Value ({type(value)}) is not of type of the field ({value_type}). Not good.")
+
+                return new_value
+            except (TypeError, ValueError):
+                raise ValidationError(type_message)
+
+        # Plain int/float values skip the bool check (str(value)) and the generic cast.
+        if value_type is int:
+            def convert(value):
+                kind = type(value)
+                if kind is int:
+                    return value
+                if kind is float:
+                    try:
+                        new_value = int(value)
+                    except ValueError:
+                        raise ValidationError(type_message)
+                    if not value.is_integer():
+                        raise ValidationError(f"Value ({kind}) is not of type of the field ({value_type}). Not good.")
+                    return new_value
+                return convert_any(value)
+        elif value_type is float:
+            def convert(value):
+                kind = type(value)
+                if kind is float:
+                    return value
+                if kind is int:
+                    return float(value)
+                return convert_any(value)
+        else:
+            convert = convert_any
 
-            new_value = self.value_type(value)
-            if isinstance(value, float) and self.value_type is int:
-                if not value.is_integer():
-                    raise ValidationError(f"Value ({type(value)}) is not of type of the field ({self.value_type}). Not good.")
+        if min_value is None and max_value is None:
+            return convert
 
-            value = new_value
-        except (TypeError, ValueError):
-            raise ValidationError(f"Field '{self.name}': Must be of type {self.value_type.__name__}")
+        def validate(value):
+            if type(value) is not value_type:
+                value = convert(value)
+            if min_value is not None and value < min_value:
+                raise ValidationError(f"Field '{name}': Value must be at least {min_value}.")
+            if max_value is not None and value > max_value:
+                raise ValidationError(f"Field '{name}': Value must be at most {max_value}.")
+            return value
 
-        if self.min_value is not None and value < self.min_value:
-            raise ValidationError(f"Field '{self.name}': Value must be at least {self.min_value}.")
-        if self.max_value is not None and value > self.max_value:
-            raise ValidationError(f"Field '{self.name}': Value must be at most {self.max_value}.")
+        return validate
 
-        return value
+    def accepted_types(self):
+        # Anything `int()`/`float()` can convert: numeric strings and objects with numeric dunders.
+        return (str, bytes, bytearray, SupportsInt, SupportsFloat, SupportsIndex)
 
     def ui_widget_type(self):
         from readtheyaml.ui.widgets import StringFieldWidget
@@ -53,10 +107,12 @@ class NumericalField(Field):
         return constraints
 
     @staticmethod
-    def from_type_string(type_str: str, name: str, factory, **kwargs):
-        if type_str in {"int", "Int", "INT"}:
+    def from_type_node(node, name: str, factory, **kwargs):
+        if node.bracketed:
+            return None
+        if node.head in {"int", "Int", "INT"}:
             return NumericalField(name=name, value_type=int, **kwargs)
-        elif type_str in {"float", "Float", "FLOAT"}:
+        elif node.head in {"float", "Float", "FLOAT"}:
             return NumericalField(name=name, value_type=float, **kwargs)
 
         return None
@@ -1,13 +1,83 @@
 import inspect
-from functools import partial
+from functools import lru_cache, partial
 
+from readtheyaml import profiling
 from readtheyaml.exceptions.validation_error import ValidationError
 from readtheyaml.fields.base.any_field import AnyField
 from readtheyaml.fields.field import Field
-from readtheyaml.utils.type_utils import type_to_string, get_params_and_defaults, import_type, extract_types_for_composite
+from readtheyaml.utils.type_utils import type_to_string, get_params_and_defaults, import_type
+
+
+# Upper bound on classes whose constructor metadata is kept; polymorphic `_type_` configs
+# can name many classes over a process lifetime.
+CLASS_METADATA_CACHE_SIZE = 512
+
+
+class ClassMetadata:
+    """Constructor facts about one class, shared by every ObjectField that builds it."""
+
+    __slots__ = ("params", "accepts_kwargs", "subfields")
+
+    def __init__(self, params, accepts_kwargs, subfields):
+        self.params = params
+        self.accepts_kwargs = accepts_kwargs
+        self.subfields = subfields
+
+
+@lru_cache(maxsize=CLASS_METADATA_CACHE_SIZE)
+def class_metadata(cls, factory) -> ClassMetadata:
+    try:
+        parameters = inspect.signature(cls.__init__).parameters.values()
+    except Exception:
+        parameters = ()
+    return ClassMetadata(
+        params=frozenset(p.name for p in parameters if p.name != "self"),
+        accepts_kwargs=any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters),
+        subfields=_build_subfields_from_type_hints(cls, factory),
+    )
+
+
+@lru_cache(maxsize=CLASS_METADATA_CACHE_SIZE)
+def import_class(class_path):
+    # Failed imports raise and are therefore not cached.
+    return import_type(class_path)
+
+
+def _build_subfields_from_type_hints(cls, factory):
+    subfields = {}
+    try:
+        hints = get_params_and_defaults(cls)
+    except Exception:
+        hints = {}
+
+    for name, values in hints.items():
+        if name == "self":
+            continue
+        try:
+            if not values["has_hint"]:
+                field_builder = partial(AnyField)
+            else:
+                type_as_string = type_to_string(values["hint"])
+                field_builder = partial(factory.create_field, type_str=type_as_string)
+
+            subfields[name] = field_builder(name=name, description=name, required=not values["has_default"], default=values["default"])
+
+        except Exception:
+            # A parameter whose hint no field can express is left unchecked.
+            pass
+    return subfields
+
+
+def _construct(cls, *args, **kwargs):
+    profile = profiling.active
+    if profile is None:
+        return cls(*args, **kwargs)
+    return profile.call(((profile.object_constructors, f"{cls.__module__}.{cls.__qualname__}"),), cls, *args, **kwargs)
 
 
 class ObjectField(Field):
+    type_heads = frozenset({"object"})
+    deferrable = True
     _sentinel = "_type_"  # key in config used to specify class name if not fixed
 
     def __init__(self, factory, class_path=None, *, when=None, **kwargs):
@@ -17,41 +87,11 @@ class ObjectField(Field):
         self.factory = factory
         self.subfields = {}
         self._fixed_class = None
-        self._subfields_cache = {}
 
         if class_path:
-            cls = import_type(class_path)
+            cls = import_class(class_path)
             self._fixed_class = cls
-            self.subfields = self._build_subfields_from_type_hints(cls)
-            self._subfields_cache[cls] = self.subfields
-
-    def _build_subfields_from_type_hints(self, cls):
-        subfields = {}
-        try:
-            hints = get_params_and_defaults(cls)
-        except Exception:
-            hints = {}
-
-        for name, values in hints.items():
-            if name == "self":
-                continue
-            try:
-                if not values["has_hint"]:
-                    field_builder = partial(AnyField)
-                else:
-                    type_as_string = type_to_string(values["hint"])
-                    field_builder = partial(self.factory.create_field, type_str=type_as_string)
-
-                subfields[name] = field_builder(name=name, description=name, required=not values["has_default"], default=values["default"])
-
-            except Exception as e:
-                print(e)  # fallback: skip unsupported
-        return subfields
-
-    def _get_subfields_for_class(self, cls):
-        if cls not in self._subfields_cache:
-            self._subfields_cache[cls] = self._build_subfields_from_type_hints(cls)
-        return self._subfields_cache[cls]
+            self.subfields = class_metadata(cls, factory).subfields
 
     def validate_and_build(self, value):
         if value is None:
@@ -60,21 +100,21 @@ class ObjectField(Field):
         if not isinstance(value, dict):
             if self.class_path:
                 try:
-                    cls = self._fixed_class or import_type(self.class_path)
-                    return cls(value)
+                    cls = self._fixed_class or import_class(self.class_path)
+                    return _construct(cls, value)
                 except Exception as e:
                     raise ValidationError(f"Field '{self.name}': Failed to create '{self.class_path}': {e}") from e
             raise ValidationError(f"Field '{self.name}': Expected a dictionary to instantiate object")
 
         cls = self._resolve_class(value)
-        subfields = self._get_subfields_for_class(cls)
+        metadata = class_metadata(cls, self.factory)
 
-        extras = set(value) - self._get_constructor_params(cls) - {self._sentinel}
-        if extras and not self._accepts_kwargs(cls):
+        extras = value.keys() - metadata.params - {self._sentinel}
+        if extras and not metadata.accepts_kwargs:
             raise ValidationError(f"Field '{self.name}': Unexpected keys: {sorted(extras)}")
 
         # Validate type hints
-        for param, field in subfields.items():
+        for param, field in metadata.subfields.items():
             if param in value:
                 try:
                     field.validate_and_build(value[param])
@@ -82,40 +122,30 @@ class ObjectField(Field):
                     raise ValidationError(f"Field '{self.name}.{param}': {e}") from e
 
         try:
-            return cls(**self._clear_sentinel(value))
+            return _construct(cls, **self._clear_sentinel(value))
         except Exception as e:
             raise ValidationError(f"Field '{self.name}': Failed to create '{cls.__name__}': {e}") from e
 
     def _resolve_class(self, mapping):
         if self.class_path:
-            base_cls = self._fixed_class or import_type(self.class_path)
+            base_cls = self._fixed_class or import_class(self.class_path)
             if self._sentinel not in mapping:
                 return base_cls
 
-            resolved_cls = import_type(mapping[self._sentinel])
+            resolved_cls = import_class(mapping[self._sentinel])
             if not isinstance(resolved_cls, type) or not issubclass(resolved_cls, base_cls):
                 raise ValidationError(f"Field '{self.name}': '{mapping[self._sentinel]}' is not a subclass of '{self.class_path}'")
             return resolved_cls
         if self._sentinel not in mapping:
             raise ValidationError(f"Field '{self.name}': Missing '{self._sentinel}' key to resolve object type")
-        return import_type(mapping[self._sentinel])
+        return import_class(mapping[self._sentinel])
 
     def _clear_sentinel(self, mapping):
         return {k: v for k, v in mapping.items() if k != self._sentinel}
 
-    def _get_constructor_params(self, cls):
-        try:
-            sig = inspect.signature(cls.__init__)
-            return {p.name for p in sig.parameters.values() if p.name != "self"}
-        except Exception:
-            return set()
-
-    def _accepts_kwargs(self, cls):
-        try:
-            sig = inspect.signature(cls.__init__)
-            return any(p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values())
-        except Exception:
-            return False
+    def accepted_types(self):
+        # With a class path, non-mapping values are handed to the class constructor.
+        return None if self.class_path else (dict,)
 
     def ui_widget_type(self):
         from readtheyaml.ui.widgets.object_field_widget import ObjectFieldWidget
@@ -127,16 +157,23 @@ class ObjectField(Field):
             "object_class_path": self.class_path,
         }
 
+    @classmethod
+    def handles_head(cls, head: str) -> bool:
+        # Besides `object[...]`, a bare dotted path names the class directly.
+        return head in cls.type_heads or "." in head
+
     @staticmethod
-    def from_type_string(type_str: str, name: str, factory, **kwargs):
-        object_type = extract_types_for_composite(type_str=type_str, type_name="object")
-        if object_type is not None:
-            return ObjectField(name=name, factory=factory, class_path=object_type, **kwargs)
-        else:
+    def from_type_node(node, name: str, factory, **kwargs):
+        if node.head == "object":
+            if node.bracketed and len(node.args) == 1:
+                return ObjectField(name=name, factory=factory, class_path=node.args[0].text, **kwargs)
+            return None
+
+        if "." in node.head and not node.bracketed:
             try:
-                import_type(type_str)
-                return ObjectField(name=name, factory=factory, class_path=type_str, **kwargs)
+                import_class(node.head)
             except ValidationError:
-                pass # ok to do nothing
+                return None
+            return ObjectField(name=name, factory=factory, class_path=node.head, **kwargs)
 
         return None
@@ -4,6 +4,9 @@ from readtheyaml.fields.field import Field
 
 
 class StringField(Field):
+    type_heads = frozenset({"str", "Str", "STR"})
+    validator_attributes = frozenset({"name", "min_length", "max_length", "cast_to_string"})
+
     def __init__(self, min_length=0, max_length=-1, cast_to_string=False, *, when=None, **kwargs):
         """
         A field that validates and optionally converts values to strings.
@@ -24,23 +27,49 @@ class StringField(Field):
         if max_length != -1 and max_length < min_length:
             raise FormatError(f"Field '{self.name}': max_length {max_length} smaller than min_length {min_length}")
 
+        self._validator = self._build_validator()
+
     def validate_and_build(self, value):
+        return self._validator(value)
+
+    def _build_validator(self):
+        name = self.name
+        min_length = self.min_length
+        max_length = self.max_length if self.max_length > 0 else None
+
         if self.cast_to_string:
-            try:
-                value = str(value)
-            except (TypeError, ValueError) as e:
-                raise ValidationError(
-                    f"Field '{self.name}': Could not convert value to string: {e}"
-                )
-        elif not isinstance(value, str):
-            raise ValidationError(f"Field '{self.name}': Expected string, got {type(value).__name__}")
-
-        if len(value) < self.min_length:
-            raise ValidationError(f"Field '{self.name}': Value must be at least {self.min_length} characters")
-
-        if 0 < self.max_length < len(value):
-            raise ValidationError(f"Field '{self.name}': Value must be at most {self.max_length} characters")
-        return value
+            def coerce(value):
+                if type(value) is str:
+                    return value
+                try:
+                    return str(value)
+                except (TypeError, ValueError) as e:
+                    raise ValidationError(
+                        f"Field '{name}': Could not convert value to string: {e}"
+                    )
+        else:
+            def coerce(value):
+                if isinstance(value, str):
+                    return value
+                raise ValidationError(f"Field '{name}': Expected string, got {type(value).__name__}")
+
+        if min_length == 0 and max_length is None:
+            return coerce
+
+        def validate(value):
+            if type(value) is not str:
+                value = coerce(value)
+            length = len(value)
+            if length < min_length:
+                raise ValidationError(f"Field '{name}': Value must be at least {min_length} characters")
+            if max_length is not None and length > max_length:
+                raise ValidationError(f"Field '{name}': Value must be at most {max_length} characters")
+            return value
+
+        return validate
+
+    def accepted_types(self):
+        return None if self.cast_to_string else (str,)
 
     def ui_widget_type(self):
         from readtheyaml.ui.widgets import StringFieldWidget
@@ -55,8 +84,8 @@ class StringField(Field):
         return constraints
 
     @staticmethod
-    def from_type_string(type_str: str, name: str, factory, **kwargs):
-        if type_str in {"str", "Str", "STR"}:
+    def from_type_node(node, name: str, factory, **kwargs):
+        if node.head in StringField.type_heads and not node.bracketed:
             return StringField(name=name, **kwargs)
 
         return None
@@ -2,19 +2,32 @@ import copy
 
 from readtheyaml.exceptions.format_error import FormatError
 from readtheyaml.exceptions.validation_error import ValidationError
+from readtheyaml.fields.base.numerical_field import NumericalField
 from readtheyaml.fields.field import Field
 from readtheyaml.fields.field_validation_helpers import find_and_validate_bounds
-from readtheyaml.utils.type_utils import extract_types_for_composite
+from readtheyaml.fields import numeric_arrays
 
 
 class ListField(Field):
-    def __init__(self, item_field, min_length=None, max_length=None, length_range=None, *, when=None, **kwargs):
+    type_heads = frozenset({"list"})
+    deferrable = True
+
+    def __init__(self, item_field, min_length=None, max_length=None, length_range=None, as_array=False, *, when=None, **kwargs):
         if not isinstance(item_field, Field):
             raise FormatError("ListField item_field must be a Field instance.")
         list_field_type = f"list({item_field.field_type()})"
         super().__init__(when=when, field_type=list_field_type, additional_allowed_kwargs={"min_length", "max_length", "length_range"}, **kwargs)
 
         self.item_field = item_field
+        self.as_array = as_array
+
+        # Lists of plain int/float items can be checked in bulk with NumPy (when installed).
+        numeric_items = type(item_field) is NumericalField
+        self._vectorized = numeric_items and numeric_arrays.HAS_NUMPY
+        if as_array and not numeric_items:
+            raise FormatError(f"Field '{self.name}': as_array is only supported for lists of int or float.")
+        if as_array and not numeric_arrays.HAS_NUMPY:
+            raise FormatError(f"Field '{self.name}': as_array requires numpy to be installed.")
 
         try:
             self.min_length, self.max_length = find_and_validate_bounds(length_range, min_length, max_length)
@@ -31,6 +44,11 @@ class ListField(Field):
         if self.max_length is not None and len(value) > self.max_length:
             raise ValidationError(f"Field '{self.name}': List must contain at most {self.max_length} items.")
 
+        if self._vectorized and (self.as_array or len(value) >= numeric_arrays.VECTORIZE_MIN_LENGTH):
+            built = self._validate_vectorized(value)
+            if built is not None:
+                return built
+
         validated = []
         for i, item in enumerate(value):
             try:
@@ -38,8 +56,35 @@ class ListField(Field):
             except ValidationError as e:
                 raise ValidationError(f"Field '{self.name}': Invalid item at index {i}: {e}")
 
+        if self.as_array:
+            try:
+                return numeric_arrays.to_array(validated, self.item_field.value_type)
+            except OverflowError:
+                raise ValidationError(f"Field '{self.name}': Values do not fit in a {self.item_field.value_type.__name__} array.")
         return validated
 
+    def _validate_vectorized(self, value):
+        item_field = self.item_field
+        result = numeric_arrays.validate_numeric_list(value, item_field.value_type, item_field.min_value, item_field.max_value)
+        if result is None:
+            return None
+
+        array, bad_index = result
+        if bad_index is not None:
+            # Re-validate only the offending item so the error matches the item-by-item path.
+            try:
+                item_field.validate_and_build(value[bad_index])
+            except ValidationError as e:
+                raise ValidationError(f"Field '{self.name}': Invalid item at index {bad_index}: {e}")
+            return None
+
+        if self.as_array:
+            return array
+        return array.tolist()
+
+    def accepted_types(self):
+        return (list,)
+
     def constraint_specs(self):
         constraints = {"length_unit": "items"}
         if self.min_length is not None:
@@ -52,14 +97,14 @@ class ListField(Field):
         return constraints
 
     @staticmethod
-    def from_type_string(type_str, name, factory, **kwargs):
-        list_type = extract_types_for_composite(type_str=type_str, type_name="list")
-        if list_type is not None:
+    def from_type_node(node, name, factory, **kwargs):
+        if node.head == "list" and node.bracketed and len(node.args) == 1:
             args_copy = copy.deepcopy(kwargs)
             args_copy["ignore_post"] = True
             args_copy["additional_allowed_kwargs"] = set(["min_length", "max_length", "length_range"])
+            args_copy.pop("as_array", None)
 
-            item_field = factory.create_field(list_type, name, **args_copy)
+            item_field = factory.create_item_field(node.args[0], name, **args_copy)
             return ListField(name=name, item_field=item_field, **kwargs)
 
         return None
@@ -4,10 +4,12 @@ import copy
 from readtheyaml.exceptions.format_error import FormatError
 from readtheyaml.exceptions.validation_error import ValidationError
 from readtheyaml.fields.field import Field
-from readtheyaml.utils.type_utils import extract_types_for_composite, split_top_level
 
 
 class TupleField(Field):
+    type_heads = frozenset({"tuple"})
+    deferrable = True
+
     def __init__(self, element_fields, *, when=None, **kwargs):
         if not element_fields or any(not isinstance(slot, Field) for slot in element_fields):
             raise FormatError("TupleField element_fields must be a non-empty list of Field instances.")
@@ -49,18 +51,18 @@ class TupleField(Field):
 
         return value
 
-    @staticmethod
-    def from_type_string(type_str, name, factory, **kwargs):
-        tuple_inner = extract_types_for_composite(type_str=type_str, type_name="tuple")
-        if tuple_inner is not None:
-            element_specs = split_top_level(tuple_inner, ',')
+    def accepted_types(self):
+        return (tuple, str)
 
+    @staticmethod
+    def from_type_node(node, name, factory, **kwargs):
+        if node.head == "tuple" and node.bracketed:
             args_copy = copy.deepcopy(kwargs)
             args_copy["ignore_post"] = True
 
             element_fields = []
-            for element in element_specs:
-                element_field = factory.create_field(element, name, **args_copy)
+            for element in node.args:
+                element_field = factory.create_item_field(element, name, **args_copy)
                 element_fields.append(element_field)
             return TupleField(name=name, element_fields=element_fields, **kwargs)
 
@@ -1,14 +1,17 @@
 import copy
 from functools import partial
 
+from readtheyaml import profiling
 from readtheyaml.exceptions.format_error import FormatError
 from readtheyaml.exceptions.validation_error import ValidationError
 from readtheyaml.fields.field import Field
 from readtheyaml.fields.base.string_field import StringField
-from readtheyaml.utils.type_utils import extract_types_for_composite, split_top_level
+from readtheyaml.fields.type_expression import UNION_HEAD
 
 
 class UnionField(Field):
+    type_heads = frozenset({"union", UNION_HEAD})
+
     def __init__(self, options, *, when=None, **kwargs):
         union_inner = " | ".join(self._option_field_type(option) for option in options)
         super().__init__(when=when, field_type=f"union({union_inner})", **kwargs)
@@ -57,21 +60,73 @@ class UnionField(Field):
             )
 
         self._options = options
+        # Options are materialized once; StringField must not cast when other options could match.
+        self._fields = tuple(self._materialize_option(option, len(options) > 1) for option in options)
+        # type(value) -> options that could accept it, in declaration order. Filled lazily.
+        self._candidates_by_type = {}
+        self.deferrable = any(field.deferrable for field in self._fields)
+
+    def __getstate__(self):
+        # The dispatch index may be keyed by unpicklable (e.g. local) classes; rebuild it lazily.
+        state = super().__getstate__()
+        state["_candidates_by_type"] = {}
+        return state
+
+    def _materialize_option(self, option, disable_string_cast):
+        field = self._make_partial_field(option, "option")
+        if disable_string_cast and isinstance(field, StringField) and field.cast_to_string:
+            # The option may be an interned item field shared with other composites: edit a copy.
+            field = copy.copy(field)
+            field.cast_to_string = False
+        return field
+
+    def _candidates_for(self, value_type):
+        candidates = []
+        for field in self._fields:
+            accepted = field.accepted_types()
+            if accepted is None or issubclass(value_type, accepted):
+                candidates.append(field)
+        return tuple(candidates)
 
     def validate_and_build(self, value):
-        errors = []
-        for option in self._options:
-            field = self._make_partial_field(option, "option")
+        value_type = type(value)
+        candidates = self._candidates_by_type.get(value_type)
+        if candidates is None:
+            candidates = self._candidates_by_type[value_type] = self._candidates_for(value_type)
+
+        profile = profiling.active
+        candidate_errors = {}
+        for field in candidates:
             try:
-                if isinstance(field, StringField) and len(self._options) > 1:
-                    field.cast_to_string = False
-
-                return field.validate_and_build(value)
+                if profile is None:
+                    return field.validate_and_build(value)
+                return profile.call(((profile.union_attempts, f"{self.name} -> {field.field_type()}"),), field.validate_and_build, value)
             except ValidationError as e:
-                errors.append(str(e))
+                candidate_errors[id(field)] = str(e)
+
+        # Every candidate failed: the message lists each option's reason in declaration order,
+        # so only the options skipped by the type index still have to be run.
+        errors = []
+        for field in self._fields:
+            error = candidate_errors.get(id(field))
+            if error is None:
+                try:
+                    return field.validate_and_build(value)
+                except ValidationError as e:
+                    error = str(e)
+            errors.append(error)
 
         raise ValidationError(f"Field '{self.name}': {value!r} does not match any allowed type: {' | '.join(errors)}")
 
+    def accepted_types(self):
+        accepted = []
+        for field in self._fields:
+            types = field.accepted_types()
+            if types is None:
+                return None
+            accepted.extend(types)
+        return tuple(dict.fromkeys(accepted))
+
     @staticmethod
     def _option_field_type(option):
         if isinstance(option, Field):
@@ -83,21 +138,11 @@ class UnionField(Field):
         return option.__class__.__name__
 
     @staticmethod
-    def from_type_string(type_str: str, name: str, factory, **kwargs):
-        def build_union_field(parts, split_token):
-            parsed_fields = []
+    def from_type_node(node, name: str, factory, **kwargs):
+        if node.head == UNION_HEAD or (node.head == "union" and node.bracketed):
             args_copy = copy.deepcopy(kwargs)
             args_copy["ignore_post"] = True
-            for part in split_top_level(parts, split_token):
-                option_field = factory.create_field(part, name, **args_copy)
-                parsed_fields.append(option_field)
+            parsed_fields = [factory.create_item_field(option, name, **args_copy) for option in node.args]
             return UnionField(name=name, options=parsed_fields, **kwargs)
 
-        if '|' in type_str:
-            return build_union_field(type_str, '|')
-
-        union_inner = extract_types_for_composite(type_str=type_str, type_name="union")
-        if union_inner:
-            return build_union_field(union_inner, ',')
-
         return None
@@ -3,6 +3,7 @@ from functools import partial
 from readtheyaml.exceptions.format_error import FormatError
 from readtheyaml.exceptions.validation_error import ValidationError
 from readtheyaml.conditions import parse_when
+from readtheyaml.fields.type_expression import TypeNode, parse_type_expression
 
 
 class PostInitMeta(type):
@@ -15,6 +16,21 @@ class PostInitMeta(type):
 
 class Field(metaclass=PostInitMeta):
     allowed_kwargs = {"type", "when"}
+    # Type-expression heads (e.g. `int`, `list`) FieldFactory dispatches to this class.
+    type_heads = frozenset()
+    # Bumped whenever a Field subclass is defined; caches derived from the set of
+    # field classes (e.g. reserved keywords) compare against it.
+    subclass_generation = 0
+    # Expensive builds (objects, collections) that a lazy DataInstance postpones until first read.
+    deferrable = False
+    # Attributes a specialized validator (`_build_validator`) is compiled from: setting one
+    # after the validator exists rebuilds it, so later edits (e.g. UnionField turning off
+    # cast_to_string on an option, or code adjusting a field in place) take effect.
+    validator_attributes = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Field.subclass_generation += 1
 
     def __init__(self, name, description, required=True, default=None, *, when=None, field_type=None, additional_allowed_kwargs=None, ignore_post=False, **kwargs):
         self.name = name
@@ -43,9 +59,30 @@ class Field(metaclass=PostInitMeta):
             except ValidationError as e:
                 raise FormatError(f"Field {self.name} got invalid default value: {e}") from None
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.validator_attributes and "_validator" in self.__dict__:
+            super().__setattr__("_validator", self._build_validator())
+
+    def __getstate__(self):
+        # Specialized validators (`_validator`) are closures: rebuild them after unpickling.
+        state = self.__dict__.copy()
+        state.pop("_validator", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        build_validator = getattr(self, "_build_validator", None)
+        if build_validator is not None:
+            self._validator = build_validator()
+
     def validate_and_build(self, value):
         raise NotImplementedError(f"Field '{self.name}': Each field must implement its own validate method.")
 
+    def accepted_types(self):
+        """Python types `validate_and_build` can accept, or None when it may accept any value."""
+        return None
+
     def constraint_specs(self):
         return {}
 
@@ -56,9 +93,21 @@ class Field(metaclass=PostInitMeta):
     def field_type(self):
         return self._field_type
 
+    @classmethod
+    def handles_head(cls, head: str) -> bool:
+        return head in cls.type_heads
+
+    @classmethod
+    def from_type_string(cls, type_str: str, name: str, factory, **kwargs):
+        try:
+            node = parse_type_expression(type_str)
+        except ValueError:
+            return None
+        return cls.from_type_node(node, name, factory, **kwargs)
+
     @staticmethod
-    def from_type_string(type_str: str, name: str, factory, **kwargs):
-        raise NotImplementedError("Each field must implement its own from_type_string.")
+    def from_type_node(node: TypeNode, name: str, factory, **kwargs):
+        raise NotImplementedError("Each field must implement its own from_type_node.")
 
     def _make_partial_field(self, field, suffix):
         if isinstance(field, partial):
@@ -1,3 +1,7 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+
 from readtheyaml.fields.base.any_field import AnyField
 from readtheyaml.fields.base.bool_field import BoolField
 from readtheyaml.fields.base.enum_field import EnumField
@@ -8,19 +12,82 @@ from readtheyaml.fields.base.string_field import StringField
 from readtheyaml.fields.composite.list_field import ListField
 from readtheyaml.fields.composite.tuple_field import TupleField
 from readtheyaml.fields.composite.union_field import UnionField
+from readtheyaml.fields.type_expression import TypeNode, parse_type_expression
+
+# Upper bound on interned item fields (list items, tuple slots, union options).
+ITEM_FIELD_CACHE_SIZE = 4096
 
 
 class FieldFactory:
     def __init__(self):
         self.builders = [AnyField, BoolField, EnumField, NoneField, NumericalField, StringField,
                          ListField, TupleField, UnionField, ObjectField]
+        self._dispatch_builders: Tuple[type, ...] = ()
+        self._dispatch: Dict[str, Tuple[type, ...]] = {}
+        self._item_fields: "OrderedDict[tuple, object]" = OrderedDict()
+        self._item_fields_lock = threading.Lock()
 
     def create_field(self, type_str: str, name: str, **kwargs):
-        for builder in self.builders:
-            field = builder.from_type_string(type_str, name, self, **kwargs)
+        return self.create_field_from_node(parse_type_expression(type_str), name, **kwargs)
+
+    def create_field_from_node(self, node: TypeNode, name: str, **kwargs):
+        for builder in self._builders_for(node.head):
+            if builder.type_heads:
+                field = builder.from_type_node(node, name, self, **kwargs)
+            else:
+                # Builders registered without `type_heads` only know the string protocol.
+                field = builder.from_type_string(node.text, name, self, **kwargs)
             if field:
                 return field
 
-        raise ValueError(f"Unknown field type: {type_str}")
+        raise ValueError(f"Unknown field type: {node.text}")
+
+    def create_item_field(self, node: TypeNode, name: str, **kwargs):
+        """
+        Build the field of a composite's item/slot/option, shared between identical requests.
+
+        Item fields only validate values (they never own a default), so two composites asking
+        for the same sub-type with the same options can use the same instance. The returned
+        field must therefore be treated as read-only: a caller needing a variant copies it.
+        """
+        key = (node, name, repr(sorted(kwargs.items())))
+        with self._item_fields_lock:
+            field = self._item_fields.get(key)
+            if field is not None:
+                self._item_fields.move_to_end(key)
+                return field
+
+        field = self.create_field_from_node(node, name, **kwargs)
+        with self._item_fields_lock:
+            self._item_fields[key] = field
+            if len(self._item_fields) > ITEM_FIELD_CACHE_SIZE:
+                self._item_fields.popitem(last=False)
+        return field
+
+    def _builders_for(self, head: str) -> Tuple[type, ...]:
+        builders = tuple(self.builders)
+        if builders != self._dispatch_builders:
+            self._dispatch_builders = builders
+            self._dispatch = {}
+
+        candidates = self._dispatch.get(head)
+        if candidates is None:
+            candidates = tuple(builder for builder in builders if not builder.type_heads or builder.handles_head(head))
+            self._dispatch[head] = candidates
+        return candidates
+
+    def __reduce__(self):
+        # Fields keep a reference to their factory; the shared one unpickles to itself and
+        # the caches (and lock) of any other one are rebuilt.
+        if self is FIELD_FACTORY:
+            return "FIELD_FACTORY"
+        return _rebuild_factory, (list(self.builders),)
+
+
+def _rebuild_factory(builders):
+    factory = FieldFactory()
+    factory.builders = builders
+    return factory
+
 
 FIELD_FACTORY = FieldFactory()
@@ -4,7 +4,35 @@ from typing import Any
 
 from readtheyaml.fields.field import Field
 
+_reserved_cache = None
+
+
 def get_reserved_keywords_by_loaded_fields():
+    """
+    Constructor keywords of every loaded Field subclass, by class name.
+
+    Computed once per set of field classes: defining a new Field subclass invalidates it.
+    The returned mapping is shared; do not mutate it.
+    """
+    return _reserved_keywords_state()[1]
+
+
+def get_all_reserved_keywords():
+    """Union of `get_reserved_keywords_by_loaded_fields()`, cached the same way."""
+    return _reserved_keywords_state()[2]
+
+
+def _reserved_keywords_state():
+    global _reserved_cache
+    state = _reserved_cache
+    if state is None or state[0] != Field.subclass_generation:
+        generation = Field.subclass_generation
+        by_class = _collect_reserved_keywords()
+        state = _reserved_cache = (generation, by_class, frozenset().union(*by_class.values()))
+    return state
+
+
+def _collect_reserved_keywords():
     reserved_by_class = {}
     allowed_field_names = {"when"}
 
@@ -23,7 +51,7 @@ def get_reserved_keywords_by_loaded_fields():
                 continue
 
         if keywords:
-            reserved_by_class[cls.__name__] = keywords - allowed_field_names
+            reserved_by_class[cls.__name__] = frozenset(keywords - allowed_field_names)
 
     return reserved_by_class
 
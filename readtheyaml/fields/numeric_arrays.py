@@ -0,0 +1,64 @@
+# Bulk validation of homogeneous numeric lists with NumPy. NumPy is optional: without it
+# (HAS_NUMPY False) every list is validated item by item.
+from typing import Any, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Below this length converting to an array costs more than validating item by item.
+VECTORIZE_MIN_LENGTH = 256
+
+# Largest magnitude where every int is exactly representable as a float64.
+_FLOAT64_EXACT_INT = 2 ** 53
+
+_DTYPES = {int: "int64", float: "float64"}
+
+
+def validate_numeric_list(
+    values: List[Any], value_type: type, min_value=None, max_value=None
+) -> Optional[Tuple[Any, Optional[int]]]:
+    """
+    Validate `values` for a NumericalField of `value_type` in bulk.
+
+    Returns `(array, bad_index)`, where `bad_index` is the first item that fails the type or
+    bounds checks (None when every item passes). Returns None when the list holds anything
+    this path does not reproduce exactly (bools, strings, numpy scalars, out-of-range ints,
+    non-finite floats for int fields); those lists must be validated item by item.
+    """
+    item_types = set(map(type, values))
+    if not item_types or not item_types <= {int, float}:
+        return None
+
+    try:
+        if value_type is float:
+            array = np.asarray(values, dtype=np.float64)
+            bad = np.zeros(len(values), dtype=bool)
+        elif item_types == {int}:
+            array = np.asarray(values, dtype=np.int64)
+            bad = np.zeros(len(values), dtype=bool)
+        else:
+            as_float = np.asarray(values, dtype=np.float64)
+            # NaN fails the comparison too, so non-finite values fall back to the scalar path.
+            if not np.all(np.abs(as_float) <= _FLOAT64_EXACT_INT):
+                return None
+            bad = as_float != np.trunc(as_float)
+            array = as_float.astype(np.int64)
+    except (OverflowError, TypeError, ValueError):
+        return None
+
+    if min_value is not None:
+        bad |= array < min_value
+    if max_value is not None:
+        bad |= array > max_value
+
+    offending = np.flatnonzero(bad)
+    return array, (int(offending[0]) if offending.size else None)
+
+
+def to_array(values: List[Any], value_type: type):
+    """Convert already validated numbers to an ndarray of the field's dtype."""
+    return np.asarray(values, dtype=_DTYPES[value_type])
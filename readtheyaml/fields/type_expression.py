@@ -0,0 +1,124 @@
+import re
+from functools import lru_cache
+from typing import List, NamedTuple, NoReturn, Optional, Tuple
+
+UNION_HEAD = "|"
+
+_TOKEN_PATTERN = re.compile(r"\s*(?:([A-Za-z_][A-Za-z0-9_.]*)|(\S))")
+_CLOSING = {"[": "]", "(": ")"}
+
+
+class TypeNode(NamedTuple):
+    """
+    One node of a parsed type expression.
+
+    `head` is the name as written (`list`, `Int`, `package.module.Class`, ...) or `UNION_HEAD`
+    for `A | B`; `args` holds the bracketed arguments and `text` the source of the node.
+    """
+
+    head: str
+    args: Tuple["TypeNode", ...] = ()
+    text: str = ""
+    bracketed: bool = False
+
+
+class _Token(NamedTuple):
+    value: str
+    is_name: bool
+    start: int
+    end: int
+
+
+@lru_cache(maxsize=4096)
+def parse_type_expression(type_str: str) -> TypeNode:
+    """Parse a type string such as `list[tuple[int, str] | None]` into a `TypeNode` tree (cached by string)."""
+    tokens = _tokenize(type_str)
+    if not tokens:
+        raise ValueError(f"Unknown field type: {type_str}")
+
+    parser = _Parser(type_str, tokens)
+    node = parser.parse_union()
+    if parser.position != len(tokens):
+        parser.fail(f"unexpected '{tokens[parser.position].value}'")
+    return node
+
+
+def _tokenize(type_str: str) -> List[_Token]:
+    tokens = []
+    for match in _TOKEN_PATTERN.finditer(type_str):
+        name, symbol = match.groups()
+        if name is not None:
+            tokens.append(_Token(name, True, match.start(1), match.end(1)))
+        elif symbol is not None:
+            tokens.append(_Token(symbol, False, match.start(2), match.end(2)))
+    return tokens
+
+
+class _Parser:
+    # union   := primary ('|' primary)*
+    # primary := NAME [('[' | '(') union (',' union)* (']' | ')')]
+
+    def __init__(self, source: str, tokens: List[_Token]):
+        self.source = source
+        self.tokens = tokens
+        self.position = 0
+
+    def fail(self, detail: str) -> NoReturn:
+        raise ValueError(f"Invalid type expression '{self.source}': {detail}")
+
+    def peek(self) -> Optional[_Token]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def take(self) -> _Token:
+        token = self.peek()
+        if token is None:
+            self.fail("unexpected end of expression")
+        self.position += 1
+        return token
+
+    def parse_union(self) -> TypeNode:
+        start = self.peek().start if self.peek() else len(self.source)
+        options = [self.parse_primary()]
+        while self.peek() is not None and self.peek().value == UNION_HEAD:
+            self.take()
+            options.append(self.parse_primary())
+        if len(options) == 1:
+            return options[0]
+        end = self.tokens[self.position - 1].end
+        return TypeNode(UNION_HEAD, _flatten_unions(options), self.source[start:end].strip())
+
+    def parse_primary(self) -> TypeNode:
+        token = self.take()
+        if not token.is_name:
+            self.fail(f"expected a type name, got '{token.value}'")
+
+        opening = self.peek()
+        if opening is None or opening.value not in _CLOSING:
+            return TypeNode(token.value, (), token.value)
+
+        self.take()
+        args = [self.parse_union()]
+        while self.peek() is not None and self.peek().value == ",":
+            self.take()
+            args.append(self.parse_union())
+
+        closing = self.take()
+        if closing.value != _CLOSING[opening.value]:
+            if closing.value in _CLOSING.values():
+                raise ValueError(f"Mismatched brackets in type: {self.source}")
+            self.fail(f"expected '{_CLOSING[opening.value]}', got '{closing.value}'")
+
+        if token.value == "union":
+            args = _flatten_unions(args)
+        return TypeNode(token.value, tuple(args), self.source[token.start:closing.end], bracketed=True)
+
+
+def _flatten_unions(options: List[TypeNode]) -> Tuple[TypeNode, ...]:
+    # `A | union[B, C]` and `union[A | B]` denote the same set of options as `A | B | C`.
+    flat = []
+    for option in options:
+        if option.head == UNION_HEAD or (option.head == "union" and option.bracketed):
+            flat.extend(option.args)
+        else:
+            flat.append(option)
+    return tuple(flat)
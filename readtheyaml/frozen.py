@@ -0,0 +1,115 @@
+# Immutable views of built configs: FrozenDict for mappings, tuples for lists. They can be shared
+# between threads without defensive copies, and `derive` builds variants that share every
+# untouched subtree with the original.
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Tuple
+
+_MISSING = object()
+
+
+class FrozenDict(Mapping):
+    """Read-only mapping; `copy.copy`/`copy.deepcopy` return the instance itself."""
+
+    __slots__ = ("_data", "_hash")
+
+    def __init__(self, data: Any = ()):
+        self._data = dict(data)
+        self._hash = None
+
+    @classmethod
+    def _wrap(cls, data: Dict[str, Any]) -> "FrozenDict":
+        # Takes ownership of `data` (no copy); callers must not keep a reference to it.
+        frozen = cls.__new__(cls)
+        frozen._data = data
+        frozen._hash = None
+        return frozen
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenDict):
+            return self._data == other._data
+        if isinstance(other, Mapping):
+            return self._data == dict(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({self._data!r})"
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenDict":
+        return self
+
+    def __reduce__(self):
+        return FrozenDict, (self._data,)
+
+    def derive(self, changes: Mapping) -> "FrozenDict":
+        """
+        New FrozenDict with `changes` applied; keys are dotted paths (`"db.port"`) and values are
+        frozen on the way in. Only the mappings along changed paths are copied, every other
+        subtree is shared with `self`. Values are not revalidated against the schema.
+        """
+        derived = self
+        for key, value in changes.items():
+            derived = derived._assoc(tuple(key.split(".")), freeze(value))
+        return derived
+
+    def _assoc(self, path: Tuple[str, ...], value: Any) -> "FrozenDict":
+        head = path[0]
+        if len(path) > 1:
+            child = self._data.get(head, _MISSING)
+            if child is _MISSING:
+                child = _EMPTY
+            elif not isinstance(child, FrozenDict):
+                raise TypeError(f"Cannot derive '{'.'.join(path)}': '{head}' is not a mapping")
+            value = child._assoc(path[1:], value)
+
+        data = dict(self._data)
+        data[head] = value
+        return FrozenDict._wrap(data)
+
+
+_EMPTY = FrozenDict()
+
+
+def freeze(value: Any) -> Any:
+    """Immutable copy of a built value: dicts become FrozenDicts, lists/tuples tuples, sets frozensets."""
+    kind = type(value)
+    if kind is FrozenDict:
+        return value
+    if isinstance(value, dict):
+        return FrozenDict._wrap({key: freeze(item) for key, item in value.items()})
+    if kind is list or kind is tuple:
+        return tuple(freeze(item) for item in value)
+    if kind is set:
+        return frozenset(value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Mutable copy of a frozen value: FrozenDicts become dicts and tuples lists."""
+    if isinstance(value, FrozenDict):
+        return {key: thaw(item) for key, item in value.items()}
+    if type(value) is tuple:
+        return [thaw(item) for item in value]
+    return value
@@ -0,0 +1,144 @@
+# Opt-in validation instrumentation. While `profile_validation()` is active, validation runs through an
+# instrumented plan that records time, calls and (optionally) allocations per field path and Field class,
+# plus ObjectField constructors and UnionField attempts. When inactive the only cost is one `active is None`
+# check per build, per object construction and per union attempt.
+import json
+import tracemalloc
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# The recorder in use, or None when profiling is off. Process-wide: meant for one validation at a time.
+active: Optional["ValidationProfile"] = None
+
+SORT_KEYS = ("seconds", "calls", "failures", "allocated_bytes")
+
+
+class CallStats:
+    __slots__ = ("calls", "failures", "seconds", "allocated_bytes")
+
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.seconds = 0.0
+        self.allocated_bytes = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "seconds": self.seconds,
+            "allocated_bytes": self.allocated_bytes,
+        }
+
+
+class ValidationProfile:
+    """
+    Per-key `CallStats` gathered by `profile_validation()`, grouped by category:
+
+    - `fields`: dotted path of each schema field (inclusive of nested items/objects)
+    - `field_classes`: Field class of those fields
+    - `object_constructors`: classes instantiated by ObjectField
+    - `union_attempts`: `"<union field> -> <option type>"`, failures are rejected attempts
+
+    With `track_allocations=True`, `allocated_bytes` is the net memory traced by `tracemalloc` across each call.
+    """
+
+    def __init__(self, track_allocations: bool = False):
+        self.track_allocations = track_allocations
+        self.fields: Dict[str, CallStats] = {}
+        self.field_classes: Dict[str, CallStats] = {}
+        self.object_constructors: Dict[str, CallStats] = {}
+        self.union_attempts: Dict[str, CallStats] = {}
+
+    def categories(self) -> Dict[str, Dict[str, CallStats]]:
+        return {
+            "fields": self.fields,
+            "field_classes": self.field_classes,
+            "object_constructors": self.object_constructors,
+            "union_attempts": self.union_attempts,
+        }
+
+    def call(self, keys: Tuple[Tuple[Dict[str, CallStats], str], ...], func: Callable, *args, **kwargs) -> Any:
+        """Run `func(*args, **kwargs)` and add its cost to the stats of every `(category, key)` in `keys`."""
+        track_allocations = self.track_allocations and tracemalloc.is_tracing()
+        start_memory = tracemalloc.get_traced_memory()[0] if track_allocations else 0
+        failed = False
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed = perf_counter() - start
+            allocated = tracemalloc.get_traced_memory()[0] - start_memory if track_allocations else 0
+            for category, key in keys:
+                stats = category.get(key)
+                if stats is None:
+                    stats = category[key] = CallStats()
+                stats.calls += 1
+                stats.failures += failed
+                stats.seconds += elapsed
+                stats.allocated_bytes += allocated
+
+    def as_dict(self, sort_by: str = "seconds") -> Dict[str, Dict[str, Dict[str, Any]]]:
+        return {name: {key: stats.as_dict() for key, stats in _sorted(category, sort_by)} for name, category in self.categories().items()}
+
+    def to_json(self, sort_by: str = "seconds", indent: Optional[int] = 2) -> str:
+        return json.dumps(self.as_dict(sort_by), indent=indent)
+
+    def table(self, sort_by: str = "seconds", limit: Optional[int] = 20) -> str:
+        """Plain-text report, one block per category, sorted by `sort_by` (descending)."""
+        lines: List[str] = []
+        for name, category in self.categories().items():
+            if not category:
+                continue
+            rows = _sorted(category, sort_by)[:limit]
+            width = max(len("key"), *(len(key) for key, _ in rows))
+            lines.append(f"{name}:")
+            alloc_header = f"  {'alloc KiB':>10}" if self.track_allocations else ""
+            lines.append(f"  {'key':<{width}}  {'calls':>8}  {'failures':>8}  {'total ms':>10}  {'mean us':>10}{alloc_header}")
+            for key, stats in rows:
+                mean_us = stats.seconds / stats.calls * 1e6 if stats.calls else 0.0
+                alloc = f"  {stats.allocated_bytes / 1024:>10.1f}" if self.track_allocations else ""
+                lines.append(
+                    f"  {key:<{width}}  {stats.calls:>8}  {stats.failures:>8}  {stats.seconds * 1000:>10.3f}  {mean_us:>10.2f}{alloc}"
+                )
+            lines.append("")
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile_validation(track_allocations: bool = False) -> Iterator[ValidationProfile]:
+    """Record validation costs inside the block: `with profile_validation() as profile: ...; print(profile.table())`."""
+    global active
+    profile = ValidationProfile(track_allocations)
+    started_tracing = track_allocations and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    previous, active = active, profile
+    try:
+        yield profile
+    finally:
+        active = previous
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def timed_field_validator(validate: Callable[[Any], Any], path: str, class_name: str) -> Callable[[Any], Any]:
+    """Wrap a field's `validate_and_build` for the instrumented plan."""
+
+    def timed(value):
+        profile = active
+        if profile is None:
+            return validate(value)
+        return profile.call(((profile.fields, path), (profile.field_classes, class_name)), validate, value)
+
+    return timed
+
+
+def _sorted(category: Dict[str, CallStats], sort_by: str) -> List[Tuple[str, CallStats]]:
+    if sort_by not in SORT_KEYS:
+        raise ValueError(f"Unknown sort key '{sort_by}'. Expected one of: {', '.join(SORT_KEYS)}.")
+    return sorted(category.items(), key=lambda item: getattr(item[1], sort_by), reverse=True)
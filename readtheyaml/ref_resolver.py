@@ -0,0 +1,216 @@
+import hashlib
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from . import yaml_backend
+from .exceptions.format_error import FormatError
+from .remote_fetch import RemoteFetcher, default_fetcher
+
+
+def is_remote_ref(ref: str) -> bool:
+    return ref.startswith("https://") or ref.startswith("http://")
+
+
+def content_digest(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class RefResolver:
+    """
+    Loads the root schema file and every `$ref` it pulls in during one schema load.
+
+    Each source read is recorded in `sources` (source id -> sha256 of its content), where the
+    source id is the resolved absolute path of a local file or the URL of a remote one.
+    Every source is read and parsed once per load, and the subsection built for a given
+    `(source id, overrides)` pair is shared by every `$ref` that asks for it.
+    Remote sources are downloaded through `fetcher` (see `prefetch`).
+    """
+
+    def __init__(self, fetcher: Optional[RemoteFetcher] = None):
+        self.fetcher = fetcher or default_fetcher()
+        self.sources: Dict[str, str] = {}
+        # (referencing base dir, local ref as written) -> source id, for every local ref resolved.
+        self.links: Dict[Tuple[str, str], str] = {}
+        self._prefetched: Dict[str, Union[str, Exception]] = {}
+        self._documents: Dict[str, Any] = {}
+        self._sections: Dict[Tuple[str, ...], Any] = {}
+        # Sources each shared subsection was built from, so `invalidate` can drop exactly
+        # the subsections affected by a changed file.
+        self._section_sources: Dict[Tuple[str, ...], FrozenSet[str]] = {}
+        self._building: List[str] = []
+        self._source_frames: List[Set[str]] = []
+
+    def load(self, source_id: str) -> Any:
+        return self._document(source_id)
+
+    def prefetch(self, data: Any, base_dir: Path) -> None:
+        """
+        Download every remote source reachable from `data` ahead of the schema build.
+
+        The `$ref` graph is walked breadth-first and each level's remote refs are fetched
+        concurrently. Failures are left for the build itself to report at the offending `$ref`.
+        """
+        seen = set()
+        level = [(data, base_dir)]
+        while level:
+            next_level = []
+            remote = {}
+            for document, document_base in level:
+                for ref in _iter_refs(document):
+                    source_id = self.target_id(ref, document_base)
+                    if source_id in seen:
+                        continue
+                    seen.add(source_id)
+                    if is_remote_ref(source_id):
+                        remote[source_id] = document_base
+                    elif Path(source_id).is_file():
+                        try:
+                            next_level.append((self._document(source_id), Path(source_id).parent))
+                        except (OSError, FormatError):
+                            continue
+
+            for url, fetched in self.fetcher.fetch_many(remote).items():
+                # Failures are kept too, so the build reports them without requesting the URL again.
+                self._prefetched[url] = fetched
+                if isinstance(fetched, Exception):
+                    continue
+                try:
+                    next_level.append((self._document(url), remote[url]))
+                except FormatError:
+                    continue
+            level = next_level
+
+    def resolve(self, ref: str, base_dir: Path) -> Tuple[Any, Path]:
+        source_id = self.target_id(ref, base_dir)
+        if is_remote_ref(ref):
+            return self._document(source_id), base_dir
+
+        target = Path(source_id)
+        if not target.exists():
+            raise FileNotFoundError(f"Referenced schema file not found: {target}")
+        return self._document(source_id), target.parent
+
+    def target_id(self, ref: str, base_dir: Path) -> str:
+        if is_remote_ref(ref):
+            return ref
+        source_id = str((base_dir / ref).resolve())
+        self.links[(str(base_dir), ref)] = source_id
+        return source_id
+
+    def shared_section(self, source_id: str, base_dir: Path, overrides: Dict[str, Any]) -> Tuple[Tuple[str, ...], Any]:
+        """Return the memo key for a `$ref` occurrence and the subsection already built for it (or None)."""
+        # Relative refs inside a remote document resolve against the referencing file's
+        # directory, so the same URL can expand differently from different places.
+        scope = str(base_dir) if is_remote_ref(source_id) else ""
+        key = (source_id, scope, json.dumps(overrides, sort_keys=True, default=repr))
+        section = self._sections.get(key)
+        if section is not None:
+            self._used(self._section_sources[key])
+        return key, section
+
+    def remember_section(self, key: Tuple[str, ...], section: Any, sources: Iterable[str] = ()) -> None:
+        self._sections[key] = section
+        self._section_sources[key] = frozenset(sources)
+
+    @contextmanager
+    def building(self, source_id: str) -> Iterator[Set[str]]:
+        """
+        Mark `source_id` as being expanded; re-entering it means the `$ref`s form a cycle.
+
+        Yields the set of source ids read (or reused through a shared subsection) while expanding it.
+        """
+        if source_id in self._building:
+            chain = self._building[self._building.index(source_id):] + [source_id]
+            raise FormatError(f"Cyclic $ref detected: {' -> '.join(chain)}")
+        self._building.append(source_id)
+        sources = {source_id}
+        self._source_frames.append(sources)
+        try:
+            yield sources
+        finally:
+            self._source_frames.pop()
+            self._building.pop()
+        self._used(sources)
+
+    def invalidate(self, source_ids: Iterable[str]) -> None:
+        """Forget the given sources and every shared subsection built from any of them."""
+        stale = set(source_ids)
+        for source_id in stale:
+            self._documents.pop(source_id, None)
+            self._prefetched.pop(source_id, None)
+            self.sources.pop(source_id, None)
+        for key, sources in list(self._section_sources.items()):
+            if sources & stale:
+                del self._sections[key]
+                del self._section_sources[key]
+
+    def _used(self, source_ids: Iterable[str]) -> None:
+        for frame in self._source_frames:
+            frame.update(source_ids)
+
+    def _document(self, source_id: str) -> Any:
+        self._used((source_id,))
+        if source_id not in self._documents:
+            self._documents[source_id] = self._parse(source_id, self.read_source(source_id))
+        return self._documents[source_id]
+
+    def read_source(self, source_id: str) -> str:
+        if is_remote_ref(source_id):
+            if source_id in self._prefetched:
+                fetched = self._prefetched.pop(source_id)
+                if isinstance(fetched, Exception):
+                    raise fetched
+                return fetched
+            return self.fetcher.fetch(source_id)
+
+        with open(source_id, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def current_digest(self, source_id: str) -> str:
+        """Hash the source as it is now, without recording it."""
+        return content_digest(self.read_source(source_id))
+
+    def current_digests(self, source_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        `current_digest` of several sources, None for those that cannot be read. Remote sources are
+        fetched concurrently and kept as prefetched, so a build that follows does not download them again.
+        """
+        digests: Dict[str, Optional[str]] = {}
+        remote = []
+        for source_id in source_ids:
+            if is_remote_ref(source_id):
+                remote.append(source_id)
+                continue
+            try:
+                digests[source_id] = self.current_digest(source_id)
+            except OSError:
+                digests[source_id] = None
+
+        for url, fetched in self.fetcher.fetch_many(remote).items():
+            self._prefetched[url] = fetched
+            digests[url] = None if isinstance(fetched, Exception) else content_digest(fetched)
+        return digests
+
+    def _parse(self, source_id: str, content: str) -> Any:
+        self.sources[source_id] = content_digest(content)
+        try:
+            return yaml_backend.safe_load(content)
+        except yaml_backend.YAMLError as e:
+            raise FormatError(f"Invalid YAML format in '{source_id}': {e}") from e
+
+
+def _iter_refs(document: Any) -> Iterator[str]:
+    # Mirrors Schema._section_from_dict: mappings with `type` are fields, mappings with
+    # `$ref` are referenced sections, any other mapping is a nested section.
+    if not isinstance(document, dict):
+        return
+    for value in document.values():
+        if not isinstance(value, dict) or "type" in value:
+            continue
+        ref = value.get("$ref")
+        if isinstance(ref, str):
+            yield ref
+        else:
+            yield from _iter_refs(value)
@@ -0,0 +1,137 @@
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from .ref_resolver import RefResolver, content_digest, is_remote_ref
+from .remote_fetch import RemoteFetcher
+from .schema import Schema
+
+
+class _StampingResolver(RefResolver):
+    """RefResolver that stats every local source right before reading it."""
+
+    def __init__(self, fetcher=None):
+        super().__init__(fetcher)
+        # Taken before the read: a write racing with it leaves a stamp older than the file, so the
+        # next `reload()` still sees a change instead of stamping new metadata on the old content.
+        self.read_stamps: Dict[str, Optional[Tuple[int, int]]] = {}
+
+    def read_source(self, source_id: str) -> str:
+        if not is_remote_ref(source_id):
+            self.read_stamps[source_id] = _stat(source_id)
+        return super().read_source(source_id)
+
+
+class ReloadableSchema:
+    """
+    Long-lived handle on a schema file that picks up edits to it and to its `$ref`s.
+
+    `reload()` stats every local file that contributed to the current schema and, when one
+    changed (mtime/size, confirmed by its sha256), rebuilds only the `$ref` subsections that
+    were built from it; untouched subsections are reused as-is. The new schema is fully built
+    and compiled before it replaces the current one in a single assignment, so concurrent
+    callers of `schema` (or the validation shortcuts) always get a complete schema.
+    Remote `$ref`s are not watched.
+    """
+
+    def __init__(
+        self,
+        schema_file: Union[str, Path],
+        base_schema_dir: Optional[Union[str, Path]] = None,
+        fetcher: Optional[RemoteFetcher] = None,
+    ):
+        if not os.path.isfile(schema_file):
+            raise FileNotFoundError(f"Schema file not found: {schema_file}")
+
+        self.root_id = str(Path(schema_file).resolve())
+        self.base_schema_dir = Path(self.root_id).parent if base_schema_dir is None else Path(base_schema_dir)
+        if not os.path.isdir(self.base_schema_dir):
+            raise NotADirectoryError(f"Base schema directory does not exist: {self.base_schema_dir}")
+
+        self._resolver = _StampingResolver(fetcher)
+        self._reload_lock = threading.Lock()
+        self._stamps: Dict[str, Tuple[int, int]] = {}
+        self._schema = self._build()
+
+    @property
+    def schema(self) -> Schema:
+        return self._schema
+
+    @property
+    def sources(self) -> List[str]:
+        """Source ids (resolved paths or URLs) the current schema was built from."""
+        return sorted(self._resolver.sources)
+
+    def reload(self) -> bool:
+        """
+        Rebuild the schema if any of its local source files changed; returns whether it did.
+
+        If the rebuild fails (invalid YAML, missing file, ...) the error propagates and the
+        previous schema stays active; the next `reload()` tries again.
+        """
+        with self._reload_lock:
+            changed = self._changed_sources()
+            if not changed:
+                return False
+            self._resolver.invalidate(changed)
+            self._schema = self._build(changed)
+            return True
+
+    def build_and_validate(self, data: Dict[str, Any], strict: bool = True):
+        return self._schema.build_and_validate(data, strict=strict)
+
+    def validate_all(self, data: Dict[str, Any], strict: bool = True):
+        return self._schema.validate_all(data, strict=strict)
+
+    def validate_file(self, yaml_path: Union[str, Path], strict: bool = True):
+        return self._schema.validate_file(yaml_path, strict=strict)
+
+    def _build(self, changed: Set[str] = frozenset()) -> Schema:
+        resolver = self._resolver
+        data = resolver.load(self.root_id)
+        resolver.prefetch(data, self.base_schema_dir)
+        with resolver.building(self.root_id) as used:
+            schema = Schema._from_dict(data, self.base_schema_dir, _resolver=resolver)
+        schema.compile()
+
+        # Refs dropped from the graph must no longer be watched.
+        resolver.invalidate(set(resolver.sources) - used)
+        # Stamps only move forward once a build succeeded, so a failed reload is retried.
+        self._stamps = {
+            source_id: (
+                self._stamps[source_id]
+                if source_id in self._stamps and source_id not in changed
+                else resolver.read_stamps.get(source_id, _stat(source_id))
+            )
+            for source_id in used
+            if not is_remote_ref(source_id)
+        }
+        return schema
+
+    def _changed_sources(self) -> Set[str]:
+        changed = set()
+        for source_id, stamp in list(self._stamps.items()):
+            current = _stat(source_id)
+            if current == stamp:
+                continue
+            # A touched file (new mtime, same bytes) does not need a rebuild.
+            if current is not None and self._unchanged_content(source_id):
+                self._stamps[source_id] = current
+                continue
+            changed.add(source_id)
+        return changed
+
+    def _unchanged_content(self, source_id: str) -> bool:
+        try:
+            return content_digest(self._resolver.read_source(source_id)) == self._resolver.sources.get(source_id)
+        except OSError:
+            return False
+
+
+def _stat(source_id: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(source_id)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
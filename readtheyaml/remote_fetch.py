@@ -0,0 +1,224 @@
+import atexit
+import base64
+import hashlib
+import http.client
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set, Tuple, Union
+from urllib.parse import SplitResult, unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+from .utils.file_utils import write_atomic
+
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+
+
+class RemoteFetcher:
+    """
+    Fetches remote `$ref` documents over persistent (per-thread, keep-alive) HTTP connections.
+    Proxies come from `HTTP_PROXY`/`HTTPS_PROXY`/`NO_PROXY`, as with `urllib`.
+
+    With `cache_dir`, every response is stored on disk with its ETag/Last-Modified validators
+    and later requests are conditional, so an unchanged document costs a `304`. With
+    `offline=True` documents are served from that cache only, without touching the network.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        offline: bool = False,
+        timeout: float = 10.0,
+        max_workers: int = 8,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.offline = offline
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self._local = threading.local()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # Every open connection, whichever thread owns it, so `close` can reach the pool threads' ones too.
+        self._open_connections: Set[http.client.HTTPConnection] = set()
+        self._connections_lock = threading.Lock()
+        # (scheme, netloc) -> proxy URL (None for a direct connection), resolved once per host.
+        self._proxies: Dict[Tuple[str, str], Optional[SplitResult]] = {}
+
+    def fetch(self, url: str) -> str:
+        cached = self._read_cache(url)
+        if self.offline:
+            if cached is None:
+                raise OSError(f"Remote schema '{url}' is not in the HTTP cache and offline mode is enabled")
+            return cached["body"]
+
+        headers = {}
+        if cached is not None:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        status, response_headers, body = self._get(url, headers)
+        if status == 304 and cached is not None:
+            return cached["body"]
+        if status != 200:
+            raise OSError(f"Failed to fetch remote schema '{url}': HTTP {status}")
+
+        text = body.decode(response_headers.get_content_charset() or "utf-8")
+        self._write_cache(url, text, response_headers.get("ETag"), response_headers.get("Last-Modified"))
+        return text
+
+    def fetch_many(self, urls: Iterable[str]) -> Dict[str, Union[str, Exception]]:
+        """Fetch `urls` concurrently; each maps to its text or to the exception its fetch raised."""
+        urls = list(dict.fromkeys(urls))
+        if len(urls) <= 1 or self.max_workers <= 1:
+            return {url: self._fetch_or_error(url) for url in urls}
+        return dict(zip(urls, self._pool().map(self._fetch_or_error, urls)))
+
+    def close(self) -> None:
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._connections_lock:
+            connections, self._open_connections = self._open_connections, set()
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def _fetch_or_error(self, url: str) -> Union[str, Exception]:
+        try:
+            return self.fetch(url)
+        except Exception as e:
+            return e
+
+    def _pool(self) -> ThreadPoolExecutor:
+        # Kept for the fetcher's lifetime so worker threads, and their open connections,
+        # are reused across breadth-first levels and across schema loads.
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="readtheyaml-fetch")
+            return self._executor
+
+    def _get(self, url: str, headers: Dict[str, str]) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        for _ in range(_MAX_REDIRECTS + 1):
+            status, response_headers, body = self._request(url, headers)
+            location = response_headers.get("Location")
+            if status not in _REDIRECT_STATUSES or not location:
+                return status, response_headers, body
+            url = urljoin(url, location)
+        raise OSError(f"Too many redirects while fetching remote schema '{url}'")
+
+    def _request(self, url: str, headers: Dict[str, str]) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        parts = urlsplit(url)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        key = (parts.scheme, parts.netloc)
+        proxy = self._proxy(key)
+        if proxy is not None and parts.scheme == "http":
+            # Plain HTTP goes through the proxy with the absolute URL; HTTPS is tunnelled (CONNECT).
+            target = f"http://{parts.netloc}{target}"
+            headers = {**headers, **_proxy_headers(proxy)}
+
+        # A pooled connection may have been closed by the server since its last use:
+        # retry once on a fresh connection before giving up.
+        for attempt in range(2):
+            connection = self._connection(key)
+            try:
+                connection.request("GET", target, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                self._drop_connection(key)
+                if attempt:
+                    raise OSError(f"Failed to fetch remote schema '{url}': {e}") from e
+                continue
+
+            if response.will_close:
+                self._drop_connection(key)
+            return response.status, response.headers, body
+
+    def _connection(self, key: Tuple[str, str]) -> http.client.HTTPConnection:
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        if key not in connections:
+            scheme, netloc = key
+            proxy = self._proxy(key)
+            if proxy is None:
+                connection = _open(scheme, netloc, self.timeout)
+            else:
+                connection = _open(proxy.scheme, proxy.netloc.rpartition("@")[2], self.timeout, https=scheme == "https")
+                if scheme == "https":
+                    connection.set_tunnel(netloc, headers=_proxy_headers(proxy))
+            with self._connections_lock:
+                self._open_connections.add(connection)
+            connections[key] = connection
+        return connections[key]
+
+    def _proxy(self, key: Tuple[str, str]) -> Optional[SplitResult]:
+        if key not in self._proxies:
+            scheme, netloc = key
+            proxy = getproxies().get(scheme)
+            if proxy and not proxy_bypass(urlsplit(f"//{netloc}").hostname or netloc):
+                self._proxies[key] = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+            else:
+                self._proxies[key] = None
+        return self._proxies[key]
+
+    def _drop_connection(self, key: Tuple[str, str]) -> None:
+        connection = getattr(self._local, "connections", {}).pop(key, None)
+        if connection is not None:
+            with self._connections_lock:
+                self._open_connections.discard(connection)
+            connection.close()
+
+    def _cache_path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def _read_cache(self, url: str) -> Optional[Dict[str, Any]]:
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._cache_path(url), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("url") != url or not isinstance(entry.get("body"), str):
+            return None
+        return entry
+
+    def _write_cache(self, url: str, body: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        if self.cache_dir is None:
+            return
+        entry = {"url": url, "etag": etag, "last_modified": last_modified, "body": body}
+        write_atomic(self._cache_path(url), json.dumps(entry).encode("utf-8"))
+
+
+def _open(scheme: str, netloc: str, timeout: float, https: bool = False) -> http.client.HTTPConnection:
+    # An HTTPS origin reached through a plain HTTP proxy still needs TLS after the CONNECT tunnel.
+    if scheme == "https" or https:
+        return http.client.HTTPSConnection(netloc, timeout=timeout)
+    return http.client.HTTPConnection(netloc, timeout=timeout)
+
+
+def _proxy_headers(proxy: SplitResult) -> Dict[str, str]:
+    if proxy.username is None:
+        return {}
+    credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}".encode("utf-8")
+    return {"Proxy-Authorization": f"Basic {base64.b64encode(credentials).decode('ascii')}"}
+
+
+_default_fetcher: Optional[RemoteFetcher] = None
+_default_fetcher_lock = threading.Lock()
+
+
+def default_fetcher() -> RemoteFetcher:
+    """Process-wide fetcher (no disk cache) used when a load does not pass its own."""
+    global _default_fetcher
+    with _default_fetcher_lock:
+        if _default_fetcher is None:
+            _default_fetcher = RemoteFetcher()
+            atexit.register(_default_fetcher.close)
+        return _default_fetcher
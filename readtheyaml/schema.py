@@ -1,16 +1,22 @@
 import copy
 import os
 from pathlib import Path
-import yaml
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
+from . import schema_bundle, schema_cache, yaml_backend
+from .batch import ValidationResult, validate_document, validate_many
+from .compiled_schema import CompiledSchema
+from .config_classes import ConfigSection, make_config_class, to_config
+from .condition_graph import ConditionGraph
 from .exceptions.format_error import FormatError
 from .exceptions.validation_error import ValidationError
-from .conditions import parse_when, evaluate_when
+from .ref_resolver import RefResolver
+from .remote_fetch import RemoteFetcher
+from .conditions import parse_when
 from .ui.constants import ROOT_PATH
 from .fields.field import Field
 from .fields.field_factory import FIELD_FACTORY
-from .fields.field_helpers import get_reserved_keywords_by_loaded_fields
+from .fields.field_helpers import get_all_reserved_keywords
 
 class Schema:
     def __init__(
@@ -32,79 +38,48 @@ class Schema:
         self.default = default
         self.has_default = has_default
         self.when = when
+        self._compiled: Optional[CompiledSchema] = None
+        self._condition_graph: Optional[ConditionGraph] = None
+        self._config_class: Optional[type] = None
 
     def build_and_validate(
         self, data: Dict[str, Any], strict: bool = True, _condition_context: Optional[Dict[str, Any]] = None
     ) -> tuple[Dict[str, Any], Dict[str, Any]]:
-        if not isinstance(data, dict):
-            raise ValidationError(f"Section '{self.name or ROOT_PATH}' expects a mapping/dictionary, got {type(data).__name__}")
-
-        if _condition_context is None:
-            _condition_context = self._build_condition_context(data)
-
-        built_data = {}
-        data_with_default = copy.deepcopy(data)
-
-        for field_name, field in self.fields.items():
-            if not evaluate_when(field.when, _condition_context):
-                data_with_default.pop(field_name, None)
-                continue
-
-            from_default = False
-            if field_name in data:
-                value = data[field_name]
-            elif field.required:
-                raise ValidationError(f"Missing required field '{field_name}'")
-            else:
-                from_default = True
-                value = copy.deepcopy(field.default)
-                data_with_default[field_name] = copy.deepcopy(value)
-
-            # Defaults are already validated/built by Field.post_init.
-            # Re-validating them can be harmful for fields like ObjectField
-            # where validate_and_build constructs instances.
-            if not from_default:
-                value = field.validate_and_build(value)
-
-            built_data[field_name] = value
-
-        # Validate subsections
-        for section_name, subsection in self.subsections.items():
-            if not evaluate_when(subsection.when, _condition_context):
-                data_with_default.pop(section_name, None)
-                continue
-
-            if section_name in data:
-                built_data[section_name], data_with_default[section_name] = subsection.build_and_validate(
-                    data[section_name], strict=strict, _condition_context=_condition_context
-                )
-            elif subsection.required:
-                raise ValidationError(f"Missing required section '{section_name}'")
-            else:
-                if subsection.has_default:
-                    built_data[section_name] = copy.deepcopy(subsection.default)
-                    data_with_default[section_name] = copy.deepcopy(subsection.default)
-                elif subsection.when is not None:
-                    # For when-gated optional subsections: once active, nested required
-                    # members must still be validated even if the subsection key is absent.
-                    subsection.build_and_validate({}, strict=strict, _condition_context=_condition_context)
-                else:
-                    # Missing optional subsection without explicit default is inactive:
-                    # do not materialize/validate nested required fields.
-                    data_with_default.pop(section_name, None)
-
-        # Handle extra keys
-        allowed_keys = set(self.fields.keys()) | set(self.subsections.keys())
-        if strict:
-            unexpected_keys = set(data.keys()) - allowed_keys
-            if unexpected_keys:
-                raise ValidationError(f"Unexpected key(s) in section '{self.name or ROOT_PATH}': {', '.join(sorted(unexpected_keys))}")
-        else:
-            for key in data:
-                if key not in allowed_keys:
-                    built_data[key] = data[key]
-
-        return built_data, data_with_default
+        return self.compile().build_and_validate(data, strict=strict, _condition_context=_condition_context)
+
+    def validate_all(
+        self, data: Dict[str, Any], strict: bool = True
+    ) -> tuple[Dict[str, Any], Dict[str, Any], List[ValidationError]]:
+        return self.compile().validate_all(data, strict=strict)
+
+    def revalidate(
+        self, previous: tuple[Dict[str, Any], ...], patch: Dict[str, Any], strict: bool = True
+    ) -> tuple[Dict[str, Any], ...]:
+        """Incremental `build_and_validate` of a patched result; see `CompiledSchema.revalidate`."""
+        return self.compile().revalidate(previous, patch, strict=strict)
+
+    def condition_graph(self) -> ConditionGraph:
+        """Dependency graph of the `when` conditions of this tree (built once, then cached)."""
+        if self._condition_graph is None:
+            self._condition_graph = ConditionGraph(self)
+        return self._condition_graph
+
+    def compile(self) -> CompiledSchema:
+        """Lower this schema tree into a reusable validation plan (built once, then cached)."""
+        if self._compiled is None:
+            self._compiled = CompiledSchema(self)
+        return self._compiled
+
+    def config_class(self) -> type:
+        """Frozen `__slots__` class of this tree, one nested class per section (generated once, then cached)."""
+        if self._config_class is None:
+            self._config_class = make_config_class(self)
+        return self._config_class
+
+    def build_config(self, data: Dict[str, Any], strict: bool = True) -> ConfigSection:
+        """`build_and_validate`, returning the built output as `config_class()` instances instead of dicts."""
+        built, _ = self.build_and_validate(data, strict=strict)
+        return to_config(self.config_class(), built)
 
     def to_dict(self) -> dict:
         output = {
@@ -121,7 +96,23 @@ class Schema:
         return output
 
     @classmethod
-    def from_yaml(cls, schema_file: str, base_schema_dir: Optional[Union[str, Path]] = None) -> "Schema":
+    def from_yaml(
+        cls,
+        schema_file: str,
+        base_schema_dir: Optional[Union[str, Path]] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        fetcher: Optional[RemoteFetcher] = None,
+    ) -> "Schema":
+        """
+        Load a schema file, resolving its `$ref`s.
+
+        With `cache_dir`, the loaded schema is pickled there together with the sha256 of every
+        source file of its `$ref` graph; later loads reuse it as long as none of them changed.
+        Only point `cache_dir` at a directory you trust, as entries are unpickled.
+
+        Remote `$ref`s are fetched concurrently before the build through `fetcher`; pass a
+        `RemoteFetcher(cache_dir=..., offline=...)` to keep them in a persistent HTTP cache.
+        """
         if not os.path.isfile(schema_file):
             raise FileNotFoundError(f"Schema file not found: {schema_file}")
 
@@ -134,10 +125,57 @@ class Schema:
         if not os.path.isdir(base_schema_dir):
             raise NotADirectoryError(f"Base schema directory does not exist: {base_schema_dir}")
 
-        with open(schema_file, "r", encoding="utf-8") as f:
-            data = cls._safe_load_yaml(f.read(), str(schema_file))
+        resolver = RefResolver(fetcher)
+        if cache_dir is not None:
+            cached = schema_cache.load_cached(cache_dir, schema_file, base_schema_dir, resolver)
+            if cached is not None:
+                return cached
+
+        root_id = str(Path(schema_file).resolve())
+        data = resolver.load(root_id)
+        if schema_bundle.is_bundle(data):
+            bundle_resolver, root_id, base_schema_dir = schema_bundle.open_bundle(data, schema_file)
+            schema = cls._load_root(root_id, base_schema_dir, bundle_resolver)
+        else:
+            schema = cls._load_root(root_id, base_schema_dir, resolver)
+
+        if cache_dir is not None:
+            schema_cache.store(cache_dir, schema_file, base_schema_dir, resolver.sources, schema)
+        return schema
+
+    @classmethod
+    def write_bundle(
+        cls,
+        schema_file: str,
+        output: Union[str, Path],
+        base_schema_dir: Optional[Union[str, Path]] = None,
+        fetcher: Optional[RemoteFetcher] = None,
+    ) -> "Schema":
+        """
+        Resolve the whole `$ref` graph of `schema_file` once and write it to `output` as a single bundle.
+
+        The bundle holds the content and sha256 of every local and remote source plus the
+        resolved `$ref` links; `from_yaml(output)` loads it without filesystem or network access.
+        Returns the schema that was loaded to build the bundle.
+        """
+        if not os.path.isfile(schema_file):
+            raise FileNotFoundError(f"Schema file not found: {schema_file}")
+        base_schema_dir = Path(schema_file).resolve().parent if base_schema_dir is None else Path(base_schema_dir)
+
+        resolver = schema_bundle.RecordingResolver(fetcher)
+        root_id = str(Path(schema_file).resolve())
+        schema = cls._load_root(root_id, base_schema_dir, resolver)
 
-        return cls._from_dict(data, base_schema_dir)
+        with open(output, "w", encoding="utf-8") as f:
+            yaml_backend.safe_dump(schema_bundle.dump_bundle(resolver, root_id, base_schema_dir), f, sort_keys=False)
+        return schema
+
+    @classmethod
+    def _load_root(cls, root_id: str, base_schema_dir: Path, resolver: RefResolver) -> "Schema":
+        data = resolver.load(root_id)
+        resolver.prefetch(data, base_schema_dir)
+        with resolver.building(root_id):
+            return cls._from_dict(data, base_schema_dir, _resolver=resolver)
 
     def validate_file(self, yaml_path: Union[str, Path], strict: bool = True):
         yaml_path = Path(yaml_path)
@@ -146,16 +184,61 @@ class Schema:
 
         return self.build_and_validate(config, strict=strict)
 
+    def iter_validate_stream(self, yaml_path: Union[str, Path], strict: bool = True) -> Iterator[ValidationResult]:
+        """
+        Validate every document of a multi-document (`---` separated) YAML file.
+
+        Documents are parsed and validated one at a time, so memory stays bounded by the
+        largest document. Each yields a `ValidationResult`; validation errors are reported
+        per document while a YAML syntax error ends the stream with a `FormatError`.
+        """
+        yaml_path = Path(yaml_path)
+        with open(yaml_path, "r", encoding="utf-8") as f:
+            for index, document in enumerate(self._safe_load_all_yaml(f, str(yaml_path))):
+                yield validate_document(self, index, document, strict, source=str(yaml_path))
+
+    def validate_many(
+        self, items: Iterable[Union[str, Path, Dict[str, Any]]], strict: bool = True, workers: Optional[int] = None, chunksize: int = 16
+    ) -> Iterator[ValidationResult]:
+        """
+        Validate config files (paths) and/or already loaded dicts across a process pool.
+
+        The schema is sent once to each worker and results are yielded in input order as
+        `ValidationResult` objects; a failing item never stops the batch. `workers` defaults
+        to the CPU count and `workers=1` validates in the calling process.
+        """
+        return validate_many(self, items, strict=strict, workers=workers, chunksize=chunksize)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Compiled plans hold closures and config classes are generated; both are rebuilt lazily after unpickling.
+        state = self.__dict__.copy()
+        state["_compiled"] = None
+        state["_condition_graph"] = None
+        state["_config_class"] = None
+        return state
+
     @classmethod
-    def _from_dict(cls, data: Dict[str, Any], base_schema_dir: Optional[Path] = None) -> "Schema":
+    def _from_dict(
+        cls, data: Dict[str, Any], base_schema_dir: Optional[Path] = None, _resolver: Optional[RefResolver] = None
+    ) -> "Schema":
+        schema = cls._section_from_dict(data, base_schema_dir, _resolver or RefResolver())
+        # `when` paths are absolute, so dependencies are only known once the whole tree is built.
+        schema.condition_graph()
+        return schema
+
+    @classmethod
+    def _section_from_dict(
+        cls, data: Dict[str, Any], base_schema_dir: Optional[Path] = None, _resolver: Optional[RefResolver] = None
+    ) -> "Schema":
         if not isinstance(data, dict):
             raise ValidationError(f"Schema definition must be a mapping/dictionary, got {type(data).__name__}")
 
-        reserved_map = get_reserved_keywords_by_loaded_fields()
-        all_reserved_keywords = set().union(*reserved_map.values())
+        all_reserved_keywords = get_all_reserved_keywords()
 
         if base_schema_dir is None:
             base_schema_dir = Path(".")
+        if _resolver is None:
+            _resolver = RefResolver()
 
         name = data.get("name", "")
         description = data.get("description", "")
@@ -191,23 +274,10 @@ class Schema:
                     except Exception as e:
                         raise ValidationError(f"Failed to build field '{key}': {e}")
                 elif "$ref" in value:
-                    ref_path = value["$ref"]
-                    ref_dict, ref_base_dir = cls._resolve_ref_and_base(ref_path, base_schema_dir)
-                    if not isinstance(ref_dict, dict):
-                        raise ValidationError(f"Schema definition must be a mapping/dictionary, got {type(ref_dict).__name__}")
-                    full_section_data = ref_dict.copy()
-                    full_section_data.update({k: v for k, v in value.items() if k != "$ref"})
-
-                    # Optional referenced sections should default to None unless explicitly overridden.
-                    # This avoids implicitly materializing nested defaults when the whole section is absent.
-                    if full_section_data.get("required", True) is False and "default" not in full_section_data:
-                        full_section_data["default"] = None
-
-                    subsection = cls._from_dict(full_section_data, base_schema_dir=ref_base_dir)
-                    subsections[key] = subsection
+                    subsections[key] = cls._ref_section(value, base_schema_dir, _resolver)
                 else:
                     # Handle nested sections
-                    subsection = cls._from_dict(value, base_schema_dir=base_schema_dir)
+                    subsection = cls._section_from_dict(value, base_schema_dir=base_schema_dir, _resolver=_resolver)
                     subsections[key] = subsection
 
         return cls(
@@ -221,69 +291,36 @@ class Schema:
             when=when,
         )
 
+    @classmethod
+    def _ref_section(cls, value: Dict[str, Any], base_schema_dir: Path, resolver: RefResolver) -> "Schema":
+        # One subsection is built per (target, overrides) pair and shared by every `$ref` to it;
+        # shared subsections must be treated as read-only.
+        ref_path = value["$ref"]
+        overrides = {k: v for k, v in value.items() if k != "$ref"}
+        source_id = resolver.target_id(ref_path, base_schema_dir)
+        memo_key, subsection = resolver.shared_section(source_id, base_schema_dir, overrides)
+        if subsection is not None:
+            return subsection
+
+        with resolver.building(source_id) as sources:
+            ref_dict, ref_base_dir = resolver.resolve(ref_path, base_schema_dir)
+            if not isinstance(ref_dict, dict):
+                raise ValidationError(f"Schema definition must be a mapping/dictionary, got {type(ref_dict).__name__}")
+            full_section_data = ref_dict.copy()
+            full_section_data.update(overrides)
+
+            # Optional referenced sections should default to None unless explicitly overridden.
+            # This avoids implicitly materializing nested defaults when the whole section is absent.
+            if full_section_data.get("required", True) is False and "default" not in full_section_data:
+                full_section_data["default"] = None
+
+            subsection = cls._section_from_dict(full_section_data, base_schema_dir=ref_base_dir, _resolver=resolver)
+
+        resolver.remember_section(memo_key, subsection, sources)
+        return subsection
+
     def _build_condition_context(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        context = copy.deepcopy(data)
-        self._prune_inactive_from_condition_context(context)
-        self._inject_defaults_for_condition_context(context)
-        return context
-
-    def _prune_inactive_from_condition_context(self, context: Dict[str, Any]) -> None:
-        changed = True
-        while changed:
-            changed = False
-
-            for field_name, field in self.fields.items():
-                if field_name not in context:
-                    continue
-                if evaluate_when(field.when, context):
-                    continue
-                context.pop(field_name, None)
-                changed = True
-
-            for section_name, subsection in self.subsections.items():
-                if section_name not in context:
-                    continue
-                if not evaluate_when(subsection.when, context):
-                    context.pop(section_name, None)
-                    changed = True
-                    continue
-
-                section_value = context.get(section_name)
-                if isinstance(section_value, dict):
-                    subsection._prune_inactive_from_condition_context(section_value)
-
-    def _inject_defaults_for_condition_context(self, context: Dict[str, Any]) -> None:
-        changed = True
-        while changed:
-            changed = False
-
-            for field_name, field in self.fields.items():
-                if field_name in context or field.required:
-                    continue
-                if not evaluate_when(field.when, context):
-                    continue
-
-                default_value = getattr(field, "raw_default", field.default)
-                context[field_name] = copy.deepcopy(default_value)
-                changed = True
-
-            for section_name, subsection in self.subsections.items():
-                if section_name in context:
-                    section_value = context[section_name]
-                    if isinstance(section_value, dict):
-                        subsection._inject_defaults_for_condition_context(section_value)
-                    continue
-
-                if not evaluate_when(subsection.when, context):
-                    continue
-                if not subsection.has_default:
-                    continue
-
-                context[section_name] = copy.deepcopy(subsection.default)
-                section_value = context[section_name]
-                if isinstance(section_value, dict):
-                    subsection._inject_defaults_for_condition_context(section_value)
-                changed = True
+        return self.condition_graph().build_context(data)
 
     @staticmethod
     def _resolve_ref(ref: str, base_dir: Path) -> Dict[str, Any]:
@@ -292,21 +329,22 @@ class Schema:
 
     @staticmethod
     def _resolve_ref_and_base(ref: str, base_dir: Path) -> tuple[Dict[str, Any], Path]:
-        if ref.startswith("https://") or ref.startswith("http://"):
-            import requests
-            resp = requests.get(ref, timeout=10)
-            resp.raise_for_status()
-            return Schema._safe_load_yaml(resp.text, ref), base_dir
-
-        target = (base_dir / ref).resolve()
-        if not target.exists():
-            raise FileNotFoundError(f"Referenced schema file not found: {target}")
-        with open(target, "r", encoding="utf-8") as f:
-            return Schema._safe_load_yaml(f.read(), str(target)), target.parent
+        return RefResolver().resolve(ref, base_dir)
 
     @staticmethod
     def _safe_load_yaml(content: str, source: str) -> Any:
         try:
-            return yaml.safe_load(content)
-        except yaml.YAMLError as e:
+            return yaml_backend.safe_load(content)
+        except yaml_backend.YAMLError as e:
             raise FormatError(f"Invalid YAML format in '{source}': {e}") from e
+
+    @staticmethod
+    def _safe_load_all_yaml(stream: Any, source: str) -> Iterator[Any]:
+        documents = yaml_backend.safe_load_all(stream)
+        while True:
+            try:
+                yield next(documents)
+            except StopIteration:
+                return
+            except yaml_backend.YAMLError as e:
+                raise FormatError(f"Invalid YAML format in '{source}': {e}") from e
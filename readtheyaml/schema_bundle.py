@@ -0,0 +1,95 @@
+# Single-file schema bundles, a lockfile for a `$ref` graph: every local and remote source with its
+# sha256 plus the resolved `$ref` links. Loading one needs no filesystem or network access, and a
+# source whose content no longer matches its hash fails the load with `FormatError`.
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+
+from .exceptions.format_error import FormatError
+from .ref_resolver import RefResolver, content_digest, is_remote_ref
+
+BUNDLE_KEY = "readtheyaml_bundle"
+BUNDLE_FORMAT = 1
+
+
+def is_bundle(data: Any) -> bool:
+    return isinstance(data, dict) and BUNDLE_KEY in data
+
+
+class RecordingResolver(RefResolver):
+    """RefResolver that also keeps the raw text of every source, so a load can be written out as a bundle."""
+
+    def __init__(self, fetcher=None):
+        super().__init__(fetcher)
+        self.contents: Dict[str, str] = {}
+
+    def _parse(self, source_id: str, content: str) -> Any:
+        self.contents[source_id] = content
+        return super()._parse(source_id, content)
+
+
+class BundleResolver(RefResolver):
+    """Serves every source and `$ref` link from a bundle, without filesystem or network access."""
+
+    def __init__(self, contents: Dict[str, str], links: Dict[Tuple[str, str], str]):
+        super().__init__(fetcher=None)
+        self.contents = contents
+        self.links = links
+
+    def target_id(self, ref: str, base_dir: Path) -> str:
+        if is_remote_ref(ref):
+            return ref
+        try:
+            return self.links[(str(base_dir), ref)]
+        except KeyError:
+            raise FileNotFoundError(f"Referenced schema '{ref}' (from '{base_dir}') is not part of the schema bundle") from None
+
+    def resolve(self, ref: str, base_dir: Path) -> Tuple[Any, Path]:
+        source_id = self.target_id(ref, base_dir)
+        if is_remote_ref(source_id):
+            return self._document(source_id), base_dir
+        return self._document(source_id), Path(source_id).parent
+
+    def prefetch(self, data: Any, base_dir: Path) -> None:
+        return None
+
+    def read_source(self, source_id: str) -> str:
+        try:
+            return self.contents[source_id]
+        except KeyError:
+            raise FileNotFoundError(f"Schema source '{source_id}' is not part of the schema bundle") from None
+
+
+def dump_bundle(resolver: RecordingResolver, root_id: str, base_schema_dir: Path) -> Dict[str, Any]:
+    return {
+        BUNDLE_KEY: BUNDLE_FORMAT,
+        "root": root_id,
+        "base_dir": str(base_schema_dir),
+        "sources": {
+            source_id: {"sha256": resolver.sources[source_id], "content": resolver.contents[source_id]}
+            for source_id in sorted(resolver.contents)
+        },
+        "links": [
+            {"base": base, "ref": ref, "target": target}
+            for (base, ref), target in sorted(resolver.links.items())
+        ],
+    }
+
+
+def open_bundle(bundle: Dict[str, Any], source: Union[str, Path]) -> Tuple[BundleResolver, str, Path]:
+    """Check a parsed bundle and return its resolver, root source id and root base directory."""
+    if bundle.get(BUNDLE_KEY) != BUNDLE_FORMAT:
+        raise FormatError(f"Unsupported schema bundle format in '{source}': {bundle.get(BUNDLE_KEY)!r}")
+
+    try:
+        contents = {}
+        for source_id, entry in bundle["sources"].items():
+            if content_digest(entry["content"]) != entry["sha256"]:
+                raise FormatError(f"Schema bundle '{source}' is corrupt: content of '{source_id}' does not match its sha256")
+            contents[source_id] = entry["content"]
+        links = {(link["base"], link["ref"]): link["target"] for link in bundle["links"]}
+        root_id = bundle["root"]
+        base_dir = Path(bundle["base_dir"])
+    except (KeyError, TypeError, AttributeError) as e:
+        raise FormatError(f"Malformed schema bundle '{source}': {e}") from e
+
+    return BundleResolver(contents, links), root_id, base_dir
@@ -0,0 +1,73 @@
+import hashlib
+import pickle
+import sys
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Union
+
+from .utils.file_utils import write_atomic
+
+# Bump whenever the pickled layout of Schema/Field objects changes incompatibly.
+CACHE_FORMAT = 2
+
+try:
+    # Pickled Field objects are tied to the installed code, not only to CACHE_FORMAT.
+    PACKAGE_VERSION = metadata.version("ReadTheYAML")
+except metadata.PackageNotFoundError:
+    PACKAGE_VERSION = "source"
+
+_LOAD_ERRORS = (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, TypeError, ValueError)
+
+
+def entry_path(cache_dir: Union[str, Path], schema_file: Union[str, Path], base_schema_dir: Union[str, Path]) -> Path:
+    key = "\0".join(
+        (
+            str(CACHE_FORMAT),
+            PACKAGE_VERSION,
+            sys.version.split()[0],
+            str(Path(schema_file).resolve()),
+            str(Path(base_schema_dir).resolve()),
+        )
+    )
+    return Path(cache_dir) / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.pickle"
+
+
+def load_cached(cache_dir: Union[str, Path], schema_file: Union[str, Path], base_schema_dir: Union[str, Path], resolver):
+    """
+    Return the cached schema for `schema_file`, or None when there is no entry or any source
+    of its `$ref` graph changed since the entry was written.
+    """
+    try:
+        with open(entry_path(cache_dir, schema_file, base_schema_dir), "rb") as f:
+            entry = pickle.load(f)
+    except _LOAD_ERRORS:
+        return None
+
+    if not isinstance(entry, dict) or entry.get("format") != CACHE_FORMAT:
+        return None
+
+    sources: Dict[str, str] = entry["sources"]
+    if resolver.current_digests(sources) != sources:
+        return None
+
+    try:
+        schema = pickle.loads(entry["schema"])
+    except _LOAD_ERRORS:
+        return None
+
+    resolver.sources.update(sources)
+    return schema
+
+
+def store(
+    cache_dir: Union[str, Path], schema_file: Union[str, Path], base_schema_dir: Union[str, Path], sources: Dict[str, str], schema
+) -> bool:
+    """Write a cache entry; returns False (and writes nothing) when the schema cannot be pickled."""
+    try:
+        payload = pickle.dumps(schema, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return False
+
+    entry = {"format": CACHE_FORMAT, "sources": dict(sources), "schema": payload}
+    write_atomic(entry_path(cache_dir, schema_file, base_schema_dir), pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+    return True
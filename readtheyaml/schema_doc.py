@@ -7,10 +7,10 @@ from typing import Any
 import re
 from urllib.parse import urlparse
 
-import yaml
-
+from readtheyaml import yaml_backend
 from readtheyaml.conditions import format_when_human, parse_when
 from readtheyaml.fields.field_factory import FIELD_FACTORY
+from readtheyaml.remote_fetch import default_fetcher
 from readtheyaml.schema import Schema
 
 
@@ -44,14 +44,10 @@ def _source_label(source_id: str, docs_root: Path) -> str:
 
 def _load_yaml(source: str) -> Any:
     if source.startswith("https://") or source.startswith("http://"):
-        import requests
-
-        response = requests.get(source, timeout=10)
-        response.raise_for_status()
-        return yaml.safe_load(response.text)
+        return yaml_backend.safe_load(default_fetcher().fetch(source))
 
     with open(source, "r", encoding="utf-8") as file:
-        return yaml.safe_load(file)
+        return yaml_backend.safe_load(file)
 
 
 def _resolve_ref(ref: str, base_dir: Path) -> tuple[dict[str, Any], str, Path]:
@@ -1,9 +1,11 @@
 from copy import deepcopy
 from datetime import timedelta
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
+from readtheyaml import yaml_backend
 from readtheyaml.conditions import evaluate_when
 from readtheyaml.ui.path_helpers import normalize_path, subsection_key
 
@@ -19,10 +21,6 @@ class _FlowList(list):
     pass
 
 
-class _InlineDumper(yaml.SafeDumper):
-    pass
-
-
 def _represent_plain_scalar(dumper: yaml.SafeDumper, data: _PlainScalar):
     return dumper.represent_scalar("tag:yaml.org,2002:str", str(data), style="")
 
@@ -31,8 +29,12 @@ def _represent_flow_list(dumper: yaml.SafeDumper, data: _FlowList):
     return dumper.represent_sequence("tag:yaml.org,2002:seq", list(data), flow_style=True)
 
 
-_InlineDumper.add_representer(_PlainScalar, _represent_plain_scalar)
-_InlineDumper.add_representer(_FlowList, _represent_flow_list)
+@lru_cache(maxsize=None)
+def _inline_dumper(base_dumper: type):
+    dumper = type("_InlineDumper", (base_dumper,), {})
+    dumper.add_representer(_PlainScalar, _represent_plain_scalar)
+    dumper.add_representer(_FlowList, _represent_flow_list)
+    return dumper
 
 
 def _to_yaml_friendly(value: Any) -> Any:
@@ -63,7 +65,8 @@ def _to_yaml_friendly(value: Any) -> Any:
 
 
 def serialize_yaml(data: Any):
-    text = yaml.dump(_to_yaml_friendly(data), Dumper=_InlineDumper, sort_keys=False, allow_unicode=True)
+    dumper = _inline_dumper(yaml_backend.safe_dumper())
+    text = yaml_backend.safe_dump(_to_yaml_friendly(data), Dumper=dumper, sort_keys=False, allow_unicode=True)
     if not text.endswith("\n"):
         text += "\n"
     return text
@@ -1,18 +1,15 @@
 import re
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from readtheyaml.conditions import evaluate_when
 from readtheyaml.exceptions.validation_error import ValidationError
 from readtheyaml.schema import Schema
-from readtheyaml.ui.form_helpers import join_path
-from readtheyaml.ui.path_helpers import normalize_path, subsection_key
+from readtheyaml.ui.path_helpers import normalize_path
 from readtheyaml.ui.schema_helpers import flatten_field_paths
 from readtheyaml.ui.schema_introspect import introspect_schema_dict
 
 
 FIELD_ERROR_PATTERN = re.compile(r"^Field '([^']+)':\s*(.+)$")
 MISSING_FIELD_PATTERN = re.compile(r"^Missing required field '([^']+)'$")
-MISSING_SECTION_PATTERN = re.compile(r"^Missing required section '([^']+)'$")
 AT_LEAST_PATTERN = re.compile(r"at least\s+(-?\d+(?:\.\d+)?)", re.IGNORECASE)
 AT_MOST_PATTERN = re.compile(r"at most\s+(-?\d+(?:\.\d+)?)", re.IGNORECASE)
 TYPE_NAME_PATTERN = re.compile(r"Expected\s+([A-Za-z_][A-Za-z0-9_]*)", re.IGNORECASE)
@@ -112,7 +109,7 @@ class ValidationController:
         self.schema = schema
         self.strict = strict
         self._schema_model = introspect_schema_dict(schema)
-        self._all_field_paths = [normalize_path(path) for path in flatten_field_paths(self._schema_model)]
+        self._field_paths = {normalize_path(path) for path in flatten_field_paths(self._schema_model)}
         self.schedule_callback = schedule_callback
         self.cancel_callback = cancel_callback
         self.state_callback = state_callback
@@ -136,27 +133,24 @@ class ValidationController:
         self._pending_token = None
         draft_config = self._pending_config or {}
         try:
-            built_output, data_with_default = self.schema.build_and_validate(draft_config, strict=self.strict)
-            state = ValidationState(
-                is_valid=True,
-                built_output=built_output,
-                data_with_default=data_with_default,
-                field_errors={},
-                global_errors=[],
-            )
-        except ValidationError as exc:
-            field_errors, global_errors = parse_validation_error(str(exc))
-            section_errors = self._expand_missing_required_section_errors(global_errors, draft_config)
-            field_errors.update(section_errors)
-            field_errors.update(self._collect_all_missing_required_field_errors(draft_config))
-            field_errors = self._resolve_unscoped_field_paths(field_errors, draft_config)
-            state = ValidationState(
-                is_valid=False,
-                built_output=None,
-                data_with_default=None,
-                field_errors=field_errors,
-                global_errors=global_errors,
-            )
+            built_output, data_with_default, errors = self.schema.validate_all(draft_config, strict=self.strict)
+            if not errors:
+                state = ValidationState(
+                    is_valid=True,
+                    built_output=built_output,
+                    data_with_default=data_with_default,
+                    field_errors={},
+                    global_errors=[],
+                )
+            else:
+                field_errors, global_errors = self._split_errors(errors)
+                state = ValidationState(
+                    is_valid=False,
+                    built_output=None,
+                    data_with_default=None,
+                    field_errors=field_errors,
+                    global_errors=global_errors,
+                )
         except Exception as exc:
             state = ValidationState(
                 is_valid=False,
@@ -169,125 +163,17 @@ class ValidationController:
             return
         self.state_callback(state)
 
-    def _resolve_unscoped_field_paths(self, field_errors: Dict[str, str], draft_config: Dict[str, Any]):
-        resolved: Dict[str, str] = {}
-        for raw_path, message in field_errors.items():
-            path = normalize_path(raw_path)
-            if "." in path:
-                resolved[path] = message
-                continue
-            candidates = [field_path for field_path in self._all_field_paths if field_path.split(".")[-1] == path]
-            if not candidates:
-                resolved[path] = message
+    def _split_errors(self, errors: List[ValidationError]):
+        field_errors: Dict[str, str] = {}
+        global_errors: List[str] = []
+        for error in errors:
+            path = normalize_path(error.path)
+            if path not in self._field_paths:
+                global_errors.append(error.message)
                 continue
-            if len(candidates) == 1:
-                resolved[candidates[0]] = message
+            if MISSING_FIELD_PATTERN.match(error.message):
+                field_errors[path] = "Missing required field."
                 continue
-            active_candidates = [candidate for candidate in candidates if self._parent_exists(draft_config, candidate)]
-            if len(active_candidates) == 1:
-                resolved[active_candidates[0]] = message
-                continue
-            resolved[path] = message
-        return resolved
-
-    def _expand_missing_required_section_errors(self, global_errors: List[str], draft_config: Dict[str, Any]):
-        expanded: Dict[str, str] = {}
-        for message in global_errors:
-            section_match = MISSING_SECTION_PATTERN.match(message)
-            if not section_match:
-                continue
-            section_name = section_match.group(1)
-            for section_path in self._candidate_section_paths(section_name, draft_config):
-                section_model = self._find_section_model_by_path(self._schema_model, section_path)
-                if not section_model:
-                    continue
-                for required_path in self._required_field_paths_for_section(section_model):
-                    expanded[required_path] = "Missing required field."
-        return expanded
-
-    def _candidate_section_paths(self, section_name: str, draft_config: Dict[str, Any]):
-        candidates = [p for p in self._collect_section_paths(self._schema_model) if p.split(".")[-1] == section_name]
-        if len(candidates) <= 1:
-            return candidates
-        active = [p for p in candidates if self._parent_exists(draft_config, p)]
-        return active or candidates
-
-    def _collect_section_paths(self, section_model: Dict[str, Any]):
-        paths: List[str] = []
-        for subsection in section_model.get("subsections", []):
-            path = normalize_path(subsection.get("path", ""))
-            if path:
-                paths.append(path)
-            paths.extend(self._collect_section_paths(subsection))
-        return paths
-
-    def _find_section_model_by_path(self, section_model: Dict[str, Any], target_path: str):
-        if normalize_path(section_model.get("path", "")) == target_path:
-            return section_model
-        for subsection in section_model.get("subsections", []):
-            found = self._find_section_model_by_path(subsection, target_path)
-            if found is not None:
-                return found
-        return None
-
-    def _required_field_paths_for_section(self, section_model: Dict[str, Any]):
-        section_path = normalize_path(section_model.get("path", ""))
-        required_paths: List[str] = []
-        for field in section_model.get("fields", []):
-            if bool(field.get("required", True)):
-                required_paths.append(join_path(section_path, field["key"]))
-        for subsection in section_model.get("subsections", []):
-            if bool(subsection.get("required", True)):
-                required_paths.extend(self._required_field_paths_for_section(subsection))
-        return required_paths
-
-    def _collect_all_missing_required_field_errors(self, draft_config: Dict[str, Any]):
-        condition_context = self.schema._build_condition_context(draft_config)
-        errors: Dict[str, str] = {}
-        self._collect_missing_required_recursive(self._schema_model, draft_config, condition_context, errors)
-        return errors
-
-    def _collect_missing_required_recursive(self, section_model: Dict[str, Any], section_data: Any, condition_context: Dict[str, Any], errors: Dict[str, str]):
-        if not isinstance(section_data, dict):
-            section_data = {}
-        section_path = normalize_path(section_model.get("path", ""))
-
-        for field in section_model.get("fields", []):
-            if not evaluate_when(field.get("when"), condition_context):
-                continue
-            if not bool(field.get("required", True)):
-                continue
-            key = field["key"]
-            if key not in section_data:
-                errors[join_path(section_path, key)] = "Missing required field."
-
-        for subsection in section_model.get("subsections", []):
-            if not evaluate_when(subsection.get("when"), condition_context):
-                continue
-            child_key = subsection_key(section_model, subsection)
-            subsection_data = section_data.get(child_key)
-            is_required_subsection = bool(subsection.get("required", True))
-
-            if subsection_data is None:
-                if is_required_subsection:
-                    for required_path in self._required_field_paths_for_section(subsection):
-                        errors[required_path] = "Missing required field."
-                else:
-                    # Active optional sections still enforce required nested fields.
-                    self._collect_missing_required_recursive(subsection, {}, condition_context, errors)
-                continue
-
-            if isinstance(subsection_data, dict):
-                self._collect_missing_required_recursive(subsection, subsection_data, condition_context, errors)
-
-    @staticmethod
-    def _parent_exists(draft_config: Dict[str, Any], field_path: str):
-        parent = field_path.rsplit(".", 1)[0] if "." in field_path else ""
-        if not parent:
-            return True
-        current: Any = draft_config
-        for part in parent.split("."):
-            if not isinstance(current, dict) or part not in current:
-                return False
-            current = current[part]
-        return isinstance(current, dict)
+            field_match = FIELD_ERROR_PATTERN.match(error.message)
+            field_errors[path] = field_match.group(2) if field_match else error.message
+        return field_errors, global_errors
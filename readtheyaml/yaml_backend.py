@@ -0,0 +1,50 @@
+# Single entry point for YAML parsing/emitting: libyaml (CSafeLoader/CSafeDumper) when
+# PyYAML was built with it, the pure-Python SafeLoader/SafeDumper otherwise.
+from typing import Any, Iterator, Optional, Type
+
+import yaml
+
+YAMLError = yaml.YAMLError
+
+BACKEND_LIBYAML = "libyaml"
+BACKEND_PYTHON = "python"
+
+HAS_LIBYAML = bool(getattr(yaml, "__with_libyaml__", False)) and hasattr(yaml, "CSafeLoader")
+
+_BACKENDS = {BACKEND_PYTHON: (yaml.SafeLoader, yaml.SafeDumper)}
+if HAS_LIBYAML:
+    _BACKENDS[BACKEND_LIBYAML] = (yaml.CSafeLoader, yaml.CSafeDumper)
+
+_active_backend = BACKEND_LIBYAML if HAS_LIBYAML else BACKEND_PYTHON
+
+
+def get_backend() -> str:
+    return _active_backend
+
+
+def set_backend(name: str) -> None:
+    global _active_backend
+    if name not in _BACKENDS:
+        available = ", ".join(sorted(_BACKENDS))
+        raise ValueError(f"YAML backend '{name}' is not available. Available backends: {available}.")
+    _active_backend = name
+
+
+def safe_loader() -> Type[yaml.SafeLoader]:
+    return _BACKENDS[_active_backend][0]
+
+
+def safe_dumper() -> Type[yaml.SafeDumper]:
+    return _BACKENDS[_active_backend][1]
+
+
+def safe_load(stream: Any) -> Any:
+    return yaml.load(stream, Loader=safe_loader())
+
+
+def safe_load_all(stream: Any) -> Iterator[Any]:
+    return yaml.load_all(stream, Loader=safe_loader())
+
+
+def safe_dump(data: Any, stream: Optional[Any] = None, Dumper: Optional[Type[yaml.SafeDumper]] = None, **kwargs) -> Optional[str]:
+    return yaml.dump(data, stream, Dumper=Dumper or safe_dumper(), **kwargs)
@@ -383,3 +383,44 @@ def test_float_field_enforces_bounds_for_fraction_values():
         field.validate_and_build(Fraction(1, 100))
     with pytest.raises(ValidationError, match="Value must be at most"):
         field.validate_and_build(Fraction(1, 1))
+
+
+@pytest.mark.parametrize(
+    "value_type,value,expected",
+    [(int, 3, 3), (int, 4.0, 4), (int, "5", 5), (float, 2, 2.0), (float, 2.5, 2.5), (float, "1e3", 1000.0)],
+)
+def test_specialized_validator_converts_like_generic_cast(value_type, value, expected):
+    field = NumericalField(name="n", description="", value_type=value_type)
+
+    built = field.validate_and_build(value)
+
+    assert built == expected
+    assert type(built) is value_type
+
+
+@pytest.mark.parametrize("value,message", [(True, "contains True or False"), (2.5, "Not good"), (float("nan"), "Must be of type int")])
+def test_specialized_int_validator_keeps_error_messages(value, message):
+    field = NumericalField(name="n", description="", value_type=int, min_value=0)
+    with pytest.raises(ValidationError, match=message):
+        field.validate_and_build(value)
+
+
+def test_numeric_field_validator_survives_pickling():
+    import pickle
+
+    field = pickle.loads(pickle.dumps(NumericalField(name="n", description="", value_type=int, max_value=10)))
+
+    assert field.validate_and_build(7) == 7
+    with pytest.raises(ValidationError, match="Value must be at most 10."):
+        field.validate_and_build(11)
+
+
+def test_numeric_field_validator_follows_bound_changes():
+    field = NumericalField(name="n", description="", value_type=int, max_value=10)
+
+    field.max_value = 20
+    field.min_value = 5
+
+    assert field.validate_and_build(15) == 15
+    with pytest.raises(ValidationError, match="Value must be at least 5."):
+        field.validate_and_build(4)
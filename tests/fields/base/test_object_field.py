@@ -3,7 +3,8 @@ import pytest
 from readtheyaml.exceptions.validation_error import ValidationError
 from readtheyaml.fields.base.any_field import AnyField
 from readtheyaml.fields.base.numerical_field import NumericalField
-from readtheyaml.fields.base.object_field import ObjectField
+from readtheyaml.fields.base import object_field as object_field_module
+from readtheyaml.fields.base.object_field import CLASS_METADATA_CACHE_SIZE, ObjectField, class_metadata, import_class
 from readtheyaml.fields.field_factory import FIELD_FACTORY
 from readtheyaml.schema import Schema
 from readtheyaml.ui.widgets.object_field_widget import ObjectFieldWidget
@@ -51,6 +52,12 @@ class Dog(Animal):
         self.breed = breed
 
 
+class WithUnsupportedHint:
+    def __init__(self, name: str, tags: set[str]):
+        self.name = name
+        self.tags = tags
+
+
 class Car:
     def __init__(self, model: str):
         self.model = model
@@ -254,3 +261,42 @@ def test_object_widget_inspection_includes_forwarded_parent_required_kwargs():
     assert "description" in by_name
     assert by_name["name"]["required"] is True
     assert by_name["description"]["required"] is True
+
+
+def test_object_field_metadata_is_shared_between_fields():
+    first = ObjectField(name="a", description="a", factory=FIELD_FACTORY, class_path="tests.fields.base.test_object_field.SimpleUser")
+    second = ObjectField(name="b", description="b", factory=FIELD_FACTORY, class_path="tests.fields.base.test_object_field.SimpleUser")
+
+    assert first.subfields is second.subfields
+    assert class_metadata(SimpleUser, FIELD_FACTORY).params == frozenset({"name", "age"})
+    assert class_metadata(WithKwargs, FIELD_FACTORY).accepts_kwargs is True
+
+
+def test_object_field_validation_skips_reflection_and_imports_after_first_use(monkeypatch):
+    field = ObjectField(name="animal", description="animal", factory=FIELD_FACTORY, class_path="tests.fields.base.test_object_field.Animal")
+    config = {"_type_": "tests.fields.base.test_object_field.Dog", "name": "Rex"}
+    field.validate_and_build(config)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("metadata should be cached")
+
+    monkeypatch.setattr(object_field_module.inspect, "signature", fail)
+    monkeypatch.setattr(object_field_module, "import_type", fail)
+    results = [field.validate_and_build(dict(config)) for _ in range(3)]
+
+    assert all(isinstance(result, Dog) for result in results)
+
+
+def test_object_field_metadata_cache_is_bounded():
+    assert class_metadata.cache_info().maxsize == CLASS_METADATA_CACHE_SIZE
+    assert import_class.cache_info().maxsize == CLASS_METADATA_CACHE_SIZE
+
+
+def test_object_field_skips_unsupported_hints_silently(capsys):
+    field = ObjectField(name="tagged", description="tagged", factory=FIELD_FACTORY, class_path="tests.fields.base.test_object_field.WithUnsupportedHint")
+
+    built = field.validate_and_build({"name": "a", "tags": {"x"}})
+
+    assert sorted(field.subfields) == ["name"]
+    assert built.tags == {"x"}
+    assert capsys.readouterr().out == ""
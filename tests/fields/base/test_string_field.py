@@ -223,3 +223,36 @@ def test_string_rejects_none_default_without_casting():
     """StringField should reject None default when required=False and cast_to_string=False."""
     with pytest.raises(FormatError):
         StringField(name="s", description="", required=False, default=None, min_length=0, max_length=-1, cast_to_string=False)
+
+
+def test_string_validator_follows_cast_to_string_changes():
+    """Turning casting off after construction (as UnionField does) must take effect."""
+    field = StringField(name="s", description="", cast_to_string=True)
+    assert field.validate_and_build(12) == "12"
+
+    field.cast_to_string = False
+
+    with pytest.raises(ValidationError, match="Expected string, got int"):
+        field.validate_and_build(12)
+
+
+def test_string_validator_follows_length_changes():
+    """Bounds edited after construction must take effect."""
+    field = StringField(name="s", description="", max_length=3)
+
+    field.max_length = 5
+    assert field.validate_and_build("abcde") == "abcde"
+
+    field.min_length = 2
+    with pytest.raises(ValidationError, match="Value must be at least 2 characters"):
+        field.validate_and_build("a")
+
+
+def test_string_validator_survives_pickling():
+    import pickle
+
+    field = pickle.loads(pickle.dumps(StringField(name="s", description="", min_length=2, max_length=3)))
+
+    assert field.validate_and_build("abc") == "abc"
+    with pytest.raises(ValidationError, match="at most 3 characters"):
+        field.validate_and_build("abcd")
@@ -2,6 +2,7 @@
 
 import pytest
 
+from readtheyaml.exceptions.format_error import FormatError
 from readtheyaml.exceptions.validation_error import ValidationError
 from readtheyaml.fields.composite.list_field import ListField
 from readtheyaml.fields.base.numerical_field import NumericalField
@@ -9,6 +10,7 @@ from readtheyaml.fields.base.string_field import StringField
 from readtheyaml.fields.base.bool_field import BoolField
 from readtheyaml.fields.base.object_field import ObjectField
 from readtheyaml.fields.field_factory import FIELD_FACTORY
+from readtheyaml.fields import numeric_arrays
 
 
 def make_field(field_cls, **kwargs):
@@ -651,3 +653,72 @@ def test_validate_list_rejects_non_subclass_for_base_class_object_field():
                 {"_type_": "tests.fields.composite.test_list_field.ListCar", "model": "Roadster"},
             ]
         )
+
+
+def _numeric_list_field(value_type, vectorized=True, **kwargs):
+    field = ListField(
+        name="values",
+        description="numbers",
+        item_field=make_field(NumericalField, value_type=value_type, **kwargs),
+    )
+    field._vectorized = vectorized and numeric_arrays.HAS_NUMPY
+    return field
+
+
+@pytest.mark.parametrize(
+    "value_type,values",
+    [
+        (float, [float(i) / 3 for i in range(1000)]),
+        (float, list(range(1000))),
+        (int, list(range(-500, 500))),
+        (int, [float(i) for i in range(1000)]),
+        (int, ["1"] * 1000),
+    ],
+)
+def test_vectorized_numeric_list_matches_item_by_item(value_type, values):
+    """Bulk validation of numeric lists must build the same Python values as the scalar path."""
+    pytest.importorskip("numpy")
+    built = _numeric_list_field(value_type).validate_and_build(values)
+
+    assert built == _numeric_list_field(value_type, vectorized=False).validate_and_build(values)
+    assert [type(item) for item in built[:2]] == [value_type, value_type]
+
+
+@pytest.mark.parametrize(
+    "bad_index,bad_value",
+    [(0, True), (300, 1.5), (700, -1), (999, 10**6)],
+)
+def test_vectorized_numeric_list_reports_first_offending_index(bad_index, bad_value):
+    """Errors from the bulk path must match the item-by-item messages."""
+    pytest.importorskip("numpy")
+    values = [1] * 1000
+    values[bad_index] = bad_value
+    values[-1] = values[-1] if bad_index == 999 else -5
+
+    messages = []
+    for vectorized in (True, False):
+        with pytest.raises(ValidationError) as exc_info:
+            _numeric_list_field(int, vectorized, min_value=0, max_value=1000).validate_and_build(values)
+        messages.append(str(exc_info.value))
+
+    assert messages[0] == messages[1]
+    assert f"Invalid item at index {bad_index}:" in messages[0]
+
+
+def test_list_field_as_array_returns_ndarray():
+    """as_array=True should build a NumPy array of the item dtype, even for short lists."""
+    np = pytest.importorskip("numpy")
+    field = FIELD_FACTORY.create_field("list[float]", "weights", description="weights", as_array=True)
+
+    built = field.validate_and_build([1, 2.5, 3])
+
+    assert isinstance(built, np.ndarray)
+    assert built.dtype == np.float64
+    assert built.tolist() == [1.0, 2.5, 3.0]
+    assert FIELD_FACTORY.create_field("list[int]", "ids", description="ids", as_array=True).validate_and_build(["7"]).dtype == np.int64
+
+
+def test_list_field_as_array_rejects_non_numeric_items():
+    """as_array is only meaningful for int/float item fields."""
+    with pytest.raises(FormatError, match="as_array is only supported"):
+        ListField(name="names", description="names", item_field=make_field(StringField), as_array=True)
@@ -502,3 +502,77 @@ def test_union_field_rejects_non_subclass_for_base_class_object_option():
         field.validate_and_build(
             {"_type_": "tests.fields.composite.test_union_field.UnionCar", "model": "Roadster"}
         )
+
+
+def test_union_field_only_tries_options_accepting_the_value_type(monkeypatch):
+    """UnionField should skip options whose accepted types cannot match the value."""
+    field = UnionField(
+        name="indexed",
+        description="Type-indexed union",
+        options=[
+            make_field(ListField, item_field=make_field(NumericalField, value_type=int)),
+            make_field(StringField),
+            make_field(NumericalField, value_type=int),
+        ]
+    )
+    list_option = field._fields[0]
+
+    def fail_if_called(value):
+        raise AssertionError("list option should not be tried for a str value")
+
+    monkeypatch.setattr(list_option, "validate_and_build", fail_if_called)
+
+    assert field.validate_and_build("text") == "text"
+    assert field._candidates_by_type[str] == (field._fields[1], field._fields[2])
+
+
+def test_union_field_error_message_lists_every_option_in_order():
+    """When no candidate matches, the error still reports the failure of every option."""
+    field = UnionField(
+        name="indexed",
+        description="Type-indexed union",
+        options=[
+            make_field(ListField, item_field=make_field(NumericalField, value_type=int)),
+            make_field(NoneField),
+            make_field(NumericalField, value_type=int, min_value=0),
+        ]
+    )
+
+    with pytest.raises(ValidationError) as exc_info:
+        field.validate_and_build(-1)
+
+    assert str(exc_info.value) == (
+        "Field 'indexed': -1 does not match any allowed type: "
+        "Field 'item': Expected a list. | Field 'item': must be null/None | Field 'item': Value must be at least 0."
+    )
+
+
+def test_union_field_mismatch_runs_each_option_once(monkeypatch):
+    """Building the mismatch message reuses the candidates' errors instead of validating them again."""
+    field = UnionField(
+        name="indexed",
+        description="Type-indexed union",
+        options=[
+            make_field(ListField, item_field=make_field(NumericalField, value_type=int)),
+            make_field(NoneField),
+            make_field(NumericalField, value_type=int, min_value=0),
+        ]
+    )
+    calls = []
+    for option in field._fields:
+        original = option.validate_and_build
+        monkeypatch.setattr(option, "validate_and_build", lambda value, option=option, original=original: calls.append(option) or original(value))
+
+    with pytest.raises(ValidationError, match="does not match any allowed type"):
+        field.validate_and_build(-1)
+
+    assert sorted(map(id, calls)) == sorted(map(id, field._fields))
+
+
+def test_union_field_accepted_types_combines_options():
+    """A union accepts the types of its options, or anything if one option does."""
+    narrow = UnionField(name="narrow", description="narrow", options=[make_field(ListField, item_field=make_field(StringField)), make_field(NoneField)])
+    wide = UnionField(name="wide", description="wide", options=[make_field(NoneField), make_field(ObjectField, factory=FIELD_FACTORY, class_path="tests.fields.composite.test_union_field.UnionPet")])
+
+    assert narrow.accepted_types() == (list, type(None), str)
+    assert wide.accepted_types() is None
@@ -0,0 +1,57 @@
+import inspect
+
+import pytest
+
+from readtheyaml.exceptions.format_error import FormatError
+from readtheyaml.fields.field import Field
+from readtheyaml.fields.field_helpers import get_all_reserved_keywords, get_reserved_keywords_by_loaded_fields
+from readtheyaml.schema import Schema
+
+
+def _nested_schema_dict(sections):
+    return {
+        f"section_{index}": {
+            "host": {"type": "str", "description": "host"},
+            "inner": {"port": {"type": "int", "description": "port"}},
+        }
+        for index in range(sections)
+    }
+
+
+def test_reserved_keywords_include_constructor_parameters():
+    """Test that constructor parameters of field classes are reserved, except 'when'."""
+    reserved = get_all_reserved_keywords()
+
+    assert {"name", "description", "min_length", "value_type"} <= reserved
+    assert "when" not in reserved
+    assert reserved == frozenset().union(*get_reserved_keywords_by_loaded_fields().values())
+
+
+def test_schema_load_does_not_reflect_on_field_classes(monkeypatch):
+    """Test that loading a schema with many sections reuses the cached reserved keywords."""
+    get_all_reserved_keywords()
+    calls = []
+    original_signature = inspect.signature
+
+    def counting_signature(*args, **kwargs):
+        calls.append(args[0])
+        return original_signature(*args, **kwargs)
+
+    monkeypatch.setattr(inspect, "signature", counting_signature)
+    Schema._from_dict(_nested_schema_dict(200))
+
+    assert calls == []
+
+
+def test_new_field_subclass_invalidates_reserved_keywords():
+    """Test that defining a Field subclass adds its constructor keywords."""
+    before = get_all_reserved_keywords()
+    assert "brand_new_option" not in before
+
+    class BrandNewField(Field):
+        def __init__(self, brand_new_option=None, **kwargs):
+            super().__init__(**kwargs)
+
+    assert "brand_new_option" in get_all_reserved_keywords()
+    with pytest.raises(FormatError, match="reserved"):
+        Schema._from_dict({"brand_new_option": {"type": "int", "description": "x"}})
@@ -0,0 +1,135 @@
+import pickle
+
+import pytest
+
+from readtheyaml.exceptions.validation_error import ValidationError
+from readtheyaml.fields.composite.list_field import ListField
+from readtheyaml.fields.composite.union_field import UnionField
+from readtheyaml.fields.base.string_field import StringField
+from readtheyaml.fields.field_factory import FIELD_FACTORY, FieldFactory
+from readtheyaml.fields.type_expression import UNION_HEAD, TypeNode, parse_type_expression
+from readtheyaml.schema import Schema
+
+
+def test_parse_nested_expression():
+    """Test that nested composites and unions parse into one tree."""
+    node = parse_type_expression("list[tuple[int, str] | None]")
+
+    assert node.head == "list"
+    (union,) = node.args
+    assert union.head == UNION_HEAD
+    assert [option.text for option in union.args] == ["tuple[int, str]", "None"]
+    assert [arg.head for arg in union.args[0].args] == ["int", "str"]
+
+
+def test_parse_is_cached_by_string():
+    """Test that the same string returns the same parsed tree."""
+    assert parse_type_expression("list[int]") is parse_type_expression("list[int]")
+
+
+def test_parse_flattens_nested_unions():
+    """Test that union[...] and | forms collapse into a single option list."""
+    assert [option.head for option in parse_type_expression("union(int | None)").args] == ["int", "None"]
+    assert [option.head for option in parse_type_expression("int | union[str, bool]").args] == ["int", "str", "bool"]
+
+
+def test_parse_accepts_both_bracket_styles():
+    """Test that list(int) and list[int] describe the same type."""
+    assert parse_type_expression("list(int)").args == (TypeNode("int", (), "int"),)
+    assert parse_type_expression("list[int]").args == (TypeNode("int", (), "int"),)
+
+
+@pytest.mark.parametrize(
+    "type_str, message",
+    [
+        ("list[int)", "Mismatched brackets"),
+        ("list[]", "Invalid type expression"),
+        ("int |", "Invalid type expression"),
+        ("list[int] extra", "Invalid type expression"),
+        ("", "Unknown field type"),
+    ],
+)
+def test_parse_rejects_malformed_expressions(type_str, message):
+    """Test that malformed expressions raise a ValueError."""
+    with pytest.raises(ValueError, match=message):
+        parse_type_expression(type_str)
+
+
+def test_factory_builds_union_of_lists():
+    """Test that a union whose options are lists is split at the top level."""
+    field = FIELD_FACTORY.create_field("list[int] | tuple[int, str]", name="values", description="values")
+
+    assert isinstance(field, UnionField)
+    assert field.validate_and_build([1, 2]) == [1, 2]
+    assert field.validate_and_build((1, "a")) == (1, "a")
+    with pytest.raises(ValidationError):
+        field.validate_and_build([1.5])
+
+
+def test_factory_builds_nested_union_inside_list():
+    """Test that a union nested in a list validates each item."""
+    field = FIELD_FACTORY.create_field("list[tuple[int, str] | None]", name="pairs", description="pairs")
+
+    assert field.validate_and_build([(1, "a"), None]) == [(1, "a"), None]
+    with pytest.raises(ValidationError):
+        field.validate_and_build([("a", 1)])
+
+
+def test_factory_rejects_unknown_nested_type():
+    """Test that an unknown item type names the offending sub-expression."""
+    with pytest.raises(ValueError, match="Unknown field type: foo"):
+        FIELD_FACTORY.create_field("list[foo]", name="values", description="values")
+
+
+def test_identical_item_fields_are_shared():
+    """Test that identical sub-types reuse one item field instance."""
+    first = FIELD_FACTORY.create_field("list[int]", name="ports", description="ports")
+    second = FIELD_FACTORY.create_field("list[int]", name="ports", description="ports")
+    pair = FIELD_FACTORY.create_field("tuple[int, int]", name="pair", description="pair")
+    bounded = FIELD_FACTORY.create_field("list[int]", name="ports", description="ports", min_length=1)
+
+    assert isinstance(first, ListField)
+    assert first is not second
+    assert first.item_field is second.item_field
+    assert pair._slots[0] is pair._slots[1]
+    assert bounded.item_field is not first.item_field
+
+
+def test_from_type_string_returns_none_for_other_types():
+    """Test that builders keep returning None for expressions they do not handle."""
+    assert ListField.from_type_string("int", "x", FIELD_FACTORY, description="x") is None
+    assert ListField.from_type_string("list[", "x", FIELD_FACTORY, description="x") is None
+
+
+def test_pickled_object_field_keeps_the_shared_factory():
+    """Test that fields referencing the factory unpickle to the shared instance."""
+    schema = Schema._from_dict({"when_at": {"type": "object[datetime.date]", "description": "date"}})
+
+    clone = pickle.loads(pickle.dumps(schema))
+
+    assert clone.fields["when_at"].factory is FIELD_FACTORY
+
+
+def test_union_does_not_edit_item_fields_shared_with_other_composites():
+    """Test that a union turning off string casting leaves the shared item field untouched."""
+
+    class CastingStringField(StringField):
+        type_heads = frozenset({"text"})
+
+        def __init__(self, cast_to_string=True, **kwargs):
+            super().__init__(cast_to_string=cast_to_string, **kwargs)
+
+        @staticmethod
+        def from_type_node(node, name, factory, **kwargs):
+            if node.head == "text" and not node.bracketed:
+                return CastingStringField(name=name, **kwargs)
+            return None
+
+    factory = FieldFactory()
+    factory.builders.insert(0, CastingStringField)
+    labels = factory.create_field("tuple[text, text]", name="labels", description="labels")
+    label_or_none = factory.create_field("text | None", name="labels", description="labels")
+
+    assert labels.validate_and_build((1, "a")) == (1, "a")
+    with pytest.raises(ValidationError, match="Expected string"):
+        label_or_none.validate_and_build(1)
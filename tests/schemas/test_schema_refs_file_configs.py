@@ -1,6 +1,8 @@
 import pytest
 
+from readtheyaml.exceptions.format_error import FormatError
 from readtheyaml.exceptions.validation_error import ValidationError
+from readtheyaml.ref_resolver import RefResolver
 from readtheyaml.schema import Schema
 
 
@@ -334,3 +336,58 @@ def test_ref_present_section_rejects_extra_keys_in_strict_mode(create_schema_exa
     schema = Schema.from_yaml(str(files["schema.yaml"]))
     with pytest.raises(ValidationError, match="Unexpected key\\(s\\) in section"):
         schema.validate_file(files["config.yaml"], strict=True)
+
+
+def test_ref_repeated_target_is_read_once_and_shared(create_schema_examples, monkeypatch):
+    files = create_schema_examples(
+        {
+            "shared/server.yaml": """
+                host:
+                  type: str
+                  description: Host
+            """,
+            "schema.yaml": """
+                primary:
+                  $ref: shared/server.yaml
+                replica:
+                  $ref: ./shared/server.yaml
+                backup:
+                  $ref: shared/server.yaml
+                  required: false
+            """,
+        }
+    )
+    reads = []
+    original_read = RefResolver.read_source
+
+    def counting_read(self, source_id):
+        reads.append(source_id)
+        return original_read(self, source_id)
+
+    monkeypatch.setattr(RefResolver, "read_source", counting_read)
+    schema = Schema.from_yaml(str(files["schema.yaml"]))
+
+    assert reads.count(str(files["shared/server.yaml"].resolve())) == 1
+    assert schema.subsections["primary"] is schema.subsections["replica"]
+    assert schema.subsections["backup"] is not schema.subsections["primary"]
+    assert schema.subsections["backup"].required is False
+    built, _ = schema.build_and_validate({"primary": {"host": "a"}, "replica": {"host": "b"}})
+    assert built == {"primary": {"host": "a"}, "replica": {"host": "b"}, "backup": None}
+
+
+@pytest.mark.parametrize(
+    "files",
+    [
+        {"schema.yaml": "loop:\n  $ref: schema.yaml\n"},
+        {
+            "schema.yaml": "a:\n  $ref: sections/a.yaml\n",
+            "sections/a.yaml": "b:\n  $ref: b.yaml\n",
+            "sections/b.yaml": "a:\n  $ref: a.yaml\n",
+        },
+    ],
+)
+def test_ref_cycles_are_rejected(create_schema_examples, files):
+    created = create_schema_examples(files)
+
+    with pytest.raises(FormatError, match="Cyclic \\$ref detected"):
+        Schema.from_yaml(str(created["schema.yaml"]))
@@ -0,0 +1,145 @@
+import pickle
+
+import pytest
+
+from readtheyaml.batch import ValidationResult
+from readtheyaml.exceptions.validation_error import ValidationError
+from readtheyaml.schema import Schema
+
+
+def _schema():
+    return Schema._from_dict(
+        {
+            "service": {"type": "str", "description": "service"},
+            "port": {"type": "int", "description": "port", "required": False, "default": 8080},
+            "tls": {
+                "required": False,
+                "when": {"field": "port", "op": "eq", "value": 443},
+                "cert": {"type": "str", "description": "cert path"},
+            },
+        }
+    )
+
+
+def test_schema_round_trips_through_pickle():
+    schema = _schema()
+    schema.build_and_validate({"service": "a"})
+
+    clone = pickle.loads(pickle.dumps(schema))
+
+    assert clone.build_and_validate({"service": "a", "port": 443, "tls": {"cert": "x"}}) == (
+        {"service": "a", "port": 443, "tls": {"cert": "x"}},
+        {"service": "a", "port": 443, "tls": {"cert": "x"}},
+    )
+
+
+def test_validation_error_round_trips_through_pickle():
+    error = ValidationError("bad value", path="a.b")
+
+    clone = pickle.loads(pickle.dumps(error))
+
+    assert (clone.message, clone.path, str(clone)) == ("bad value", "a.b", "[a.b] bad value")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_many_reports_every_item_in_input_order(create_schema_examples, workers):
+    files = create_schema_examples(
+        {
+            "good.yaml": {"service": "api"},
+            "bad.yaml": {"service": "api", "port": "not-a-port"},
+        }
+    )
+    items = [files["good.yaml"], {"port": 1}, files["bad.yaml"], {"service": "inline"}, files["good.yaml"].parent / "absent.yaml"]
+
+    results = list(_schema().validate_many(items, workers=workers, chunksize=2))
+
+    assert [result.index for result in results] == [0, 1, 2, 3, 4]
+    assert all(isinstance(result, ValidationResult) for result in results)
+    assert [result.ok for result in results] == [True, False, False, True, False]
+    assert results[0].source == str(files["good.yaml"])
+    assert results[0].built == {"service": "api", "port": 8080}
+    assert results[1].source is None
+    assert isinstance(results[1].error, ValidationError)
+    assert "Missing required field 'service'" in str(results[1].error)
+    assert "Must be of type int" in str(results[2].error)
+    assert results[3].data_with_default == {"service": "inline", "port": 8080}
+    assert isinstance(results[4].error, FileNotFoundError)
+
+
+def test_validate_many_applies_strict_flag_in_workers():
+    items = [{"service": "a", "extra": 1}] * 3
+
+    strict_results = list(_schema().validate_many(items, strict=True, workers=2))
+    lenient_results = list(_schema().validate_many(items, strict=False, workers=2))
+
+    assert not any(result.ok for result in strict_results)
+    assert [result.built["extra"] for result in lenient_results] == [1, 1, 1]
+
+
+class UnpicklableTarget:
+    def __init__(self, value: int):
+        self.value = value
+
+    def __reduce__(self):
+        raise TypeError("UnpicklableTarget cannot be pickled")
+
+
+def _refuse_unpickling(value):
+    raise ValueError("cannot rebuild")
+
+
+class UnloadableTarget:
+    def __init__(self, value: int):
+        self.value = value
+
+    def __reduce__(self):
+        return _refuse_unpickling, (self.value,)
+
+
+def _object_schema(target: str):
+    return Schema._from_dict(
+        {"item": {"type": f"object[tests.test_batch.{target}]", "description": "item"}}
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_many_records_unexpected_errors_per_item(workers):
+    items = [{"service": "a"}, 5, {"service": "b"}]
+
+    results = list(_schema().validate_many(items, workers=workers, chunksize=1))
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, TypeError)
+    assert results[2].built["service"] == "b"
+
+
+def test_validate_many_reports_unpicklable_worker_output_as_error():
+    results = list(_object_schema("UnpicklableTarget").validate_many([{"item": {"value": 1}}] * 2, workers=2))
+
+    assert [result.ok for result in results] == [False, False]
+    assert "cannot be pickled" in str(results[0].error)
+
+
+def test_validate_many_stops_submitting_when_consumer_stops_early():
+    items_pulled = []
+
+    def items():
+        for index in range(1000):
+            items_pulled.append(index)
+            yield {"service": f"s{index}"}
+
+    results = _schema().validate_many(items(), workers=2, chunksize=4)
+    first = next(results)
+    results.close()
+
+    assert first.ok
+    assert len(items_pulled) < 100
+
+
+def test_validate_many_reports_worker_output_that_cannot_be_unpickled():
+    items = [{"item": {"value": 1}}]
+
+    results = list(_object_schema("UnloadableTarget").validate_many(items * 2, workers=2))
+
+    assert [result.ok for result in results] == [False, False]
+    assert "cannot be unpickled" in str(results[0].error)
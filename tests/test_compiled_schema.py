@@ -0,0 +1,200 @@
+import pytest
+
+from readtheyaml.compiled_schema import CompiledSchema
+from readtheyaml.exceptions.validation_error import ValidationError
+from readtheyaml.schema import Schema
+
+
+def _nested_schema():
+    return Schema._from_dict(
+        {
+            "service": {"type": "str", "description": "service"},
+            "tags": {"type": "list(str)", "description": "tags", "required": False, "default": ["a"]},
+            "network": {
+                "port": {"type": "int", "description": "port", "required": False, "default": 80},
+                "tls": {
+                    "required": False,
+                    "enabled": {"type": "bool", "description": "tls toggle"},
+                },
+            },
+        }
+    )
+
+
+def test_compile_returns_cached_plan():
+    schema = _nested_schema()
+
+    plan = schema.compile()
+
+    assert isinstance(plan, CompiledSchema)
+    assert schema.compile() is plan
+
+
+def test_compiled_plan_precomputes_paths_and_allowed_keys():
+    schema = _nested_schema()
+
+    root = schema.compile().root
+
+    assert root.path == ()
+    assert root.allowed_keys == frozenset({"service", "tags", "network"})
+    assert root.subsections["network"].path == ("network",)
+    assert root.subsections["network"].subsections["tls"].path == ("network", "tls")
+
+
+def test_compiled_plan_matches_schema_results():
+    schema = _nested_schema()
+    data = {"service": "svc", "network": {"port": 8080}}
+
+    built, data_with_default = schema.compile().build_and_validate(data, strict=True)
+
+    expected = {"service": "svc", "tags": ["a"], "network": {"port": 8080}}
+    assert built == expected
+    assert data_with_default == expected
+    assert (built, data_with_default) == schema.build_and_validate(data, strict=True)
+
+
+def test_compiled_plan_copies_mutable_defaults_per_call():
+    schema = _nested_schema()
+
+    first, _ = schema.build_and_validate({"service": "a", "network": {}})
+    first["tags"].append("mutated")
+    second, _ = schema.build_and_validate({"service": "b", "network": {}})
+
+    assert second["tags"] == ["a"]
+    assert schema.fields["tags"].default == ["a"]
+
+
+def test_compiled_plan_reports_errors_like_schema():
+    schema = _nested_schema()
+
+    with pytest.raises(ValidationError, match="Missing required field 'service'"):
+        schema.compile().build_and_validate({"network": {}})
+    with pytest.raises(ValidationError, match="Unexpected key\\(s\\) in section '<root>': extra"):
+        schema.compile().build_and_validate({"service": "a", "network": {}, "extra": 1})
+    with pytest.raises(ValidationError, match="expects a mapping/dictionary"):
+        schema.compile().build_and_validate(["not", "a", "dict"])
+
+
+def test_compiled_plan_covers_ref_sections(create_schema_examples):
+    files = create_schema_examples(
+        {
+            "schema.yaml": """
+                service:
+                  $ref: ./sections/service.yaml
+            """,
+            "sections/service.yaml": """
+                port:
+                  type: int
+                  description: port
+                  required: false
+                  default: 8080
+            """,
+        }
+    )
+
+    schema = Schema.from_yaml(str(files["schema.yaml"]))
+    built, data_with_default = schema.compile().build_and_validate({"service": {}})
+
+    assert built == {"service": {"port": 8080}}
+    assert data_with_default == {"service": {"port": 8080}}
+
+
+def test_data_with_default_shares_untouched_subtrees_with_input():
+    schema = Schema._from_dict(
+        {
+            "payload": {"type": "any", "description": "payload"},
+            "network": {
+                "port": {"type": "int", "description": "port"},
+            },
+        }
+    )
+    data = {"payload": {"large": [1, 2, 3]}, "network": {"port": 80}}
+
+    _, data_with_default = schema.build_and_validate(data)
+
+    assert data_with_default is data
+    assert data_with_default["payload"] is data["payload"]
+
+
+def test_data_with_default_copies_only_paths_with_injected_defaults():
+    schema = _nested_schema()
+    data = {"service": "svc", "tags": ["x"], "network": {"tls": {"enabled": True}}}
+
+    _, data_with_default = schema.build_and_validate(data)
+
+    assert data_with_default == {"service": "svc", "tags": ["x"], "network": {"tls": {"enabled": True}, "port": 80}}
+    assert data_with_default is not data
+    assert data_with_default["network"] is not data["network"]
+    assert data_with_default["network"]["tls"] is data["network"]["tls"]
+    assert data_with_default["tags"] is data["tags"]
+    assert data == {"service": "svc", "tags": ["x"], "network": {"tls": {"enabled": True}}}
+
+
+def test_data_with_default_pops_inactive_branch_without_mutating_input():
+    schema = Schema._from_dict(
+        {
+            "enabled": {"type": "bool", "description": "toggle"},
+            "extra": {
+                "type": "int",
+                "description": "gated",
+                "when": {"field": "enabled", "op": "eq", "value": True},
+            },
+        }
+    )
+    data = {"enabled": False, "extra": 3}
+
+    _, data_with_default = schema.build_and_validate(data)
+
+    assert data_with_default == {"enabled": False}
+    assert data == {"enabled": False, "extra": 3}
+
+
+def test_validate_all_collects_every_error_with_dotted_paths():
+    schema = Schema._from_dict(
+        {
+            "service": {"type": "str", "description": "service"},
+            "port": {"type": "int", "description": "port"},
+            "network": {
+                "host": {"type": "str", "description": "host"},
+                "retries": {"type": "int", "description": "retries", "min_value": 0},
+            },
+            "deploy": {
+                "target": {"type": "str", "description": "target"},
+            },
+        }
+    )
+
+    built, _, errors = schema.validate_all(
+        {"port": "x", "network": {"retries": -1, "oops": 1}, "extra": True}, strict=True
+    )
+
+    assert [(error.path, error.message) for error in errors] == [
+        ("service", "Missing required field 'service'"),
+        ("port", "Field 'port': Must be of type int"),
+        ("network.host", "Missing required field 'host'"),
+        ("network.retries", "Field 'retries': Value must be at least 0."),
+        ("network.oops", "Unexpected key 'oops' in section '<root>'"),
+        ("deploy", "Missing required section 'deploy'"),
+        ("deploy.target", "Missing required field 'target'"),
+        ("extra", "Unexpected key 'extra' in section '<root>'"),
+    ]
+    assert built == {"network": {}}
+
+
+def test_validate_all_returns_outputs_when_valid():
+    schema = _nested_schema()
+
+    built, data_with_default, errors = schema.validate_all({"service": "a", "network": {}})
+
+    assert errors == []
+    assert (built, data_with_default) == schema.build_and_validate({"service": "a", "network": {}})
+
+
+def test_validate_all_reports_non_mapping_sections():
+    schema = _nested_schema()
+
+    _, _, errors = schema.validate_all({"service": "a", "network": [1]})
+
+    assert [(error.path, error.message) for error in errors] == [
+        ("network", "Section '<root>' expects a mapping/dictionary, got list"),
+    ]
@@ -0,0 +1,175 @@
+import pytest
+
+from readtheyaml.exceptions.format_error import FormatError
+from readtheyaml.exceptions.validation_error import ValidationError
+from readtheyaml.fields.base.numerical_field import NumericalField
+from readtheyaml.schema import Schema
+
+
+def _toggle_chain_schema():
+    # Declared in reverse order of their dependencies on purpose.
+    return Schema._from_dict(
+        {
+            "c": {
+                "type": "str",
+                "description": "needs b",
+                "when": {"field": "b", "op": "eq", "value": True},
+            },
+            "b": {
+                "type": "bool",
+                "description": "needs a",
+                "required": False,
+                "default": True,
+                "when": {"field": "a", "op": "eq", "value": True},
+            },
+            "a": {"type": "bool", "description": "root toggle", "required": False, "default": False},
+        }
+    )
+
+
+def test_condition_graph_orders_members_by_dependency():
+    graph = _toggle_chain_schema().condition_graph()
+
+    order = [".".join(node.path) for node in graph.order]
+
+    assert order.index("a") < order.index("b") < order.index("c")
+    assert graph.dependents[("a",)] == [("b",)]
+
+
+def test_condition_graph_resolves_chain_in_single_pass():
+    schema = _toggle_chain_schema()
+
+    built, _ = schema.build_and_validate({}, strict=True)
+    assert built == {"a": False}
+
+    with pytest.raises(ValidationError, match="Missing required field 'c'"):
+        schema.build_and_validate({"a": True}, strict=True)
+
+
+def test_condition_graph_links_nested_paths_to_owning_member():
+    schema = Schema._from_dict(
+        {
+            "settings": {
+                "required": False,
+                "flag": {"type": "bool", "description": "flag", "required": False, "default": False},
+            },
+            "token": {
+                "type": "str",
+                "description": "gated",
+                "when": {"field": "settings.flag.deeper", "op": "exists"},
+            },
+        }
+    )
+
+    graph = schema.condition_graph()
+
+    assert graph.owner_of(("settings", "flag", "deeper")) == ("settings", "flag")
+    assert ("token",) in graph.dependents[("settings", "flag")]
+    assert ("settings", "flag") in graph.dependents[("settings",)]
+
+
+def test_condition_graph_rejects_cycles_at_load():
+    with pytest.raises(FormatError, match=r"Cyclic 'when' dependencies \(each member depends on the next\): a -> b -> a$"):
+        Schema._from_dict(
+            {
+                "a": {
+                    "type": "int",
+                    "description": "a",
+                    "required": False,
+                    "default": 1,
+                    "when": {"field": "b", "op": "exists"},
+                },
+                "b": {
+                    "type": "int",
+                    "description": "b",
+                    "required": False,
+                    "default": 1,
+                    "when": {"field": "a", "op": "exists"},
+                },
+            }
+        )
+
+
+def test_condition_graph_allows_section_gated_on_its_own_child():
+    schema = Schema._from_dict(
+        {
+            "compile": {
+                "required": False,
+                "when": {"field": "compile.enabled", "op": "eq", "value": True},
+                "enabled": {"type": "bool", "description": "toggle"},
+                "command": {"type": "str", "description": "command"},
+            },
+        }
+    )
+
+    built, data_with_default = schema.build_and_validate({"compile": {"enabled": False, "command": 3}})
+
+    assert built == {}
+    assert data_with_default == {}
+
+
+def test_condition_context_does_not_mutate_or_copy_untouched_input():
+    schema = _toggle_chain_schema()
+    untouched = {"x": 1}
+    data = {"a": False, "payload": untouched}
+
+    context = schema._build_condition_context(data)
+
+    assert context == {"a": False, "payload": {"x": 1}}
+    assert data == {"a": False, "payload": {"x": 1}}
+    assert context["payload"] is untouched
+
+
+def test_condition_context_copies_injected_section_defaults_before_editing():
+    port = NumericalField(name="port", description="port", value_type=int, required=False, default=80)
+    network = Schema(name="network", required=False, fields={"port": port}, default={"host": "local"}, has_default=True)
+    schema = Schema(name="", subsections={"network": network})
+
+    context = schema._build_condition_context({})
+
+    assert context == {"network": {"host": "local", "port": 80}}
+    assert network.default == {"host": "local"}
+
+
+def _optional_int(description, when_field=None, value=None):
+    spec = {"type": "int", "description": description, "required": False, "default": 1}
+    if when_field is not None:
+        spec["when"] = {"field": when_field, "op": "exists"} if value is None else {"field": when_field, "op": "eq", "value": value}
+    return spec
+
+
+def test_condition_graph_reports_only_the_cycle_not_its_dependents():
+    with pytest.raises(FormatError) as exc_info:
+        Schema._from_dict(
+            {
+                "downstream": _optional_int("reads the cycle", "a"),
+                "a": _optional_int("a", "b"),
+                "b": _optional_int("b", "c"),
+                "c": _optional_int("c", "a"),
+            }
+        )
+
+    assert str(exc_info.value) == "Cyclic 'when' dependencies (each member depends on the next): a -> b -> c -> a"
+
+
+def test_nested_conditions_use_absolute_paths_and_resolved_dependencies():
+    """
+    Pins the dependency-order semantics: nested `when`s read absolute paths of the fully resolved
+    context, and a member gated on a defaulted value is decided after that default is injected.
+    """
+    schema = Schema._from_dict(
+        {
+            "mode": {"type": "str", "description": "mode", "required": False, "default": "x"},
+            "extra": _optional_int("gated on a default", "mode", "x"),
+            "tail": _optional_int("gated on extra", "extra", 5),
+            "s": {
+                "kind": {"type": "str", "description": "kind"},
+                "b": _optional_int("nested, gated on a sibling", "s.kind", "on"),
+            },
+            "c": _optional_int("gated on a nested member", "s.b", 2),
+        }
+    )
+
+    built, _ = schema.build_and_validate({"extra": 5, "tail": 7, "s": {"kind": "on", "b": 2}, "c": 3})
+
+    assert built == {"mode": "x", "extra": 5, "tail": 7, "s": {"kind": "on", "b": 2}, "c": 3}
@@ -1,6 +1,9 @@
+import copy
+import pickle
+
 import pytest
 
-from readtheyaml.conditions import AtomicOp, Combinator, evaluate_when, parse_when
+from readtheyaml.conditions import AtomicOp, Combinator, ParsedCondition, compile_when, evaluate_when, parse_when
 from readtheyaml.exceptions.format_error import FormatError
 
 
@@ -350,3 +353,44 @@ def test_evaluate_when_cascading_conditions_downstream_inactive_when_parent_valu
 
     assert evaluate_when(parent_condition, context) is True
     assert evaluate_when(child_condition, context) is False
+
+
+def test_parse_when_returns_condition_with_compiled_predicate():
+    parsed = parse_when({"any": [{"field": "a.b", "op": "eq", "value": 1}, {"field": "c", "op": "missing"}]})
+
+    assert isinstance(parsed, ParsedCondition)
+    assert parsed.predicate is parsed.predicate
+    assert compile_when(parsed) is parsed.predicate
+    assert parsed.predicate({"a": {"b": 1}, "c": 0}) is True
+    assert parsed.predicate({"a": {"b": 2}, "c": 0}) is False
+    assert parsed.predicate({"a": 5}) is True
+
+
+def test_compiled_membership_uses_set_and_falls_back_for_unhashable_values():
+    condition = parse_when({"field": "mode", "op": "in", "value": ["dev", ["nested"], 3]})
+    negated = parse_when({"field": "mode", "op": "not_in", "value": ["dev", "prod"]})
+
+    assert condition.predicate({"mode": "dev"}) is True
+    assert condition.predicate({"mode": ["nested"]}) is True
+    assert condition.predicate({"mode": 3.0}) is True
+    assert condition.predicate({"mode": {"x": 1}}) is False
+    assert negated.predicate({"mode": "stage"}) is True
+    assert negated.predicate({"mode": ["dev"]}) is True
+    assert negated.predicate({}) is False
+
+
+def test_compile_when_accepts_plain_dict_conditions():
+    predicate = compile_when({"kind": "atomic", "field": "count", "op": "ge", "value": 2})
+
+    assert predicate({"count": 2}) is True
+    assert predicate({"count": "2"}) is False
+    assert compile_when(None)({}) is True
+
+
+def test_parsed_condition_survives_copy_and_pickle():
+    parsed = parse_when({"not": {"field": "a", "op": "lt", "value": 3}})
+
+    for clone in (copy.deepcopy(parsed), pickle.loads(pickle.dumps(parsed))):
+        assert isinstance(clone, ParsedCondition)
+        assert clone == parsed
+        assert clone.predicate({"a": 5}) is True
@@ -0,0 +1,92 @@
+import pickle
+
+import pytest
+
+from readtheyaml.config_classes import ConfigSection, config_to_dict
+from readtheyaml.schema import Schema
+
+
+def _schema():
+    return Schema._from_dict(
+        {
+            "service": {"type": "str", "description": "service"},
+            "tags": {"type": "list[str]", "description": "tags", "required": False, "default": ["a"]},
+            "network": {
+                "port": {"type": "int", "description": "port", "required": False, "default": 80},
+                "tls": {
+                    "required": False,
+                    "enabled": {"type": "bool", "description": "tls toggle"},
+                },
+            },
+        }
+    )
+
+
+def test_build_config_returns_slotted_section_instances():
+    schema = _schema()
+
+    config = schema.build_config({"service": "svc", "network": {"tls": {"enabled": True}}})
+
+    assert isinstance(config, schema.config_class())
+    assert config.service == "svc"
+    assert config.tags == ["a"]
+    assert config.network.port == 80
+    assert config["network"]["tls"]["enabled"] is True
+    assert type(config.network).__name__ == "NetworkConfig"
+    assert not hasattr(config, "__dict__")
+
+
+def test_config_class_is_generated_once_per_schema():
+    schema = _schema()
+
+    assert schema.config_class() is schema.config_class()
+    assert pickle.loads(pickle.dumps(schema)).build_config({"service": "svc", "network": {}}).service == "svc"
+
+
+def test_config_instances_are_frozen():
+    config = _schema().build_config({"service": "svc", "network": {}})
+
+    with pytest.raises(AttributeError, match="frozen"):
+        config.service = "other"
+    with pytest.raises(AttributeError, match="frozen"):
+        del config.network.port
+
+
+def test_config_to_dict_matches_build_and_validate():
+    schema = _schema()
+    data = {"service": "svc", "network": {"tls": {"enabled": False}}}
+
+    built, _ = schema.build_and_validate(data)
+
+    assert config_to_dict(schema.build_config(data)) == built
+    assert schema.build_config(data) == schema.build_config(data)
+
+
+def test_unknown_and_non_identifier_keys_go_to_extras():
+    schema = Schema._from_dict({"my-key": {"type": "int", "description": "dashed"}})
+
+    config = schema.build_config({"my-key": 1, "extra": "kept"}, strict=False)
+
+    assert config["my-key"] == 1
+    assert config["extra"] == "kept"
+    assert config._extras == {"my-key": 1, "extra": "kept"}
+    assert "extra" in config and "missing" not in config
+    with pytest.raises(KeyError):
+        config["missing"]
+
+
+def test_fields_skipped_by_when_are_unset():
+    schema = Schema._from_dict(
+        {
+            "enabled": {"type": "bool", "description": "toggle"},
+            "level": {"type": "int", "description": "gated", "when": {"field": "enabled", "op": "eq", "value": True}},
+        }
+    )
+
+    config = schema.build_config({"enabled": False, "level": 3})
+
+    assert isinstance(config, ConfigSection)
+    assert list(config) == ["enabled"]
+    assert not hasattr(config, "level")
+    with pytest.raises(KeyError):
+        config["level"]
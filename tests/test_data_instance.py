@@ -212,3 +212,142 @@ def test_data_instance_dotted_access_fails_on_non_dict():
     with pytest.raises(TypeError):
         _ = instance["config.subkey"]
 
+
+
+class CountingModel:
+    created = 0
+
+    def __init__(self, size: int):
+        CountingModel.created += 1
+        self.size = size
+
+
+def _lazy_schema():
+    return Schema._from_dict(
+        {
+            "service": {"type": "str", "description": "service name"},
+            "model": {
+                "type": "object[tests.test_data_instance.CountingModel]",
+                "description": "heavy object",
+            },
+            "data": {
+                "weights": {"type": "list[int]", "description": "weights"},
+                "port": {"type": "int", "description": "port", "required": False, "default": 80},
+            },
+        }
+    )
+
+
+def test_lazy_data_instance_builds_heavy_fields_on_first_access():
+    """Lazy mode defers object construction until the path is read, then memoizes it."""
+    CountingModel.created = 0
+    instance = DataInstance({"service": "svc", "model": {"size": 3}, "data": {"weights": [1, 2]}}, _lazy_schema(), lazy=True)
+
+    assert CountingModel.created == 0
+    assert instance["service"] == "svc"
+    assert instance["data.port"] == 80
+
+    model = instance["model"]
+    assert isinstance(model, CountingModel) and model.size == 3
+    assert instance["model"] is model
+    assert CountingModel.created == 1
+
+
+def test_lazy_data_instance_section_and_built_match_eager_mode():
+    """Reading a section or `built` yields the same values as the eager mode."""
+    data = {"service": "svc", "model": {"size": 3}, "data": {"weights": [1, 2]}}
+    lazy = DataInstance(data, _lazy_schema(), lazy=True)
+    eager = DataInstance(data, _lazy_schema())
+
+    assert lazy["data"] == {"weights": [1, 2], "port": 80}
+    assert lazy.built.keys() == eager.built.keys()
+    assert lazy.built["data"] == eager.built["data"]
+    assert lazy.data_with_default == eager.data_with_default
+
+
+def test_lazy_data_instance_runs_structural_checks_up_front():
+    """Missing required keys, unknown keys and primitive fields are still checked eagerly."""
+    with pytest.raises(ValidationError, match="Missing required field 'weights'"):
+        DataInstance({"service": "svc", "model": {"size": 3}, "data": {}}, _lazy_schema(), lazy=True)
+    with pytest.raises(ValidationError, match="Unexpected key"):
+        DataInstance({"service": "svc", "model": {"size": 3}, "data": {"weights": []}, "x": 1}, _lazy_schema(), lazy=True)
+    with pytest.raises(ValidationError, match="Field 'service'"):
+        DataInstance({"service": 1, "model": {"size": 3}, "data": {"weights": []}}, _lazy_schema(), lazy=True)
+
+
+def test_lazy_data_instance_reports_deferred_errors_on_access():
+    """Invalid heavy values raise the eager-mode error when their path is first read."""
+    instance = DataInstance({"service": "svc", "model": {"size": 3}, "data": {"weights": [1, "x"]}}, _lazy_schema(), lazy=True)
+
+    with pytest.raises(ValidationError, match="Invalid item at index 1"):
+        _ = instance["data.weights"]
+    with pytest.raises(ValidationError, match="Invalid item at index 1"):
+        _ = instance.built
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_built_can_be_replaced(lazy):
+    """Assigning `built` (a plain attribute before lazy mode) keeps working and wins over deferred values."""
+    CountingModel.created = 0
+    instance = DataInstance({"service": "svc", "model": {"size": 3}, "data": {"weights": [1]}}, _lazy_schema(), lazy=lazy)
+
+    instance.built = {"service": "replaced"}
+
+    assert instance.built == {"service": "replaced"}
+    assert instance["service"] == "replaced"
+    assert CountingModel.created == (0 if lazy else 1)
+
+
+def _nested_instance(**kwargs):
+    schema = Schema._from_dict(
+        {
+            "db": {
+                "host": {"type": "str", "description": "database host"},
+                "port": {"type": "int", "description": "database port", "required": False, "default": 5432},
+                "pool": {
+                    "size": {"type": "int", "description": "pool size"},
+                    "timeouts": {
+                        "connect": {"type": "float", "description": "connect timeout"},
+                    },
+                },
+            },
+            "service": {"type": "str", "description": "service name"},
+        }
+    )
+    data = {"service": "svc", "db": {"host": "localhost", "pool": {"size": 4, "timeouts": {"connect": 1.5}}}}
+    return DataInstance(data, schema, **kwargs)
+
+
+@pytest.mark.parametrize("key", ["service", "db.port", "db.pool.size", "db.pool.timeouts.connect", "db"])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_accessor_matches_getitem(key, lazy):
+    """A precompiled accessor returns what dotted indexing returns, for any instance."""
+    get = DataInstance.accessor(key)
+    first, second = _nested_instance(lazy=lazy), _nested_instance(lazy=lazy)
+
+    assert get(first) == first[key]
+    assert get(second) == second[key]
+
+
+def test_accessor_rejects_empty_key_and_reports_missing_segments():
+    with pytest.raises(KeyError, match="Empty key"):
+        DataInstance.accessor("")
+    with pytest.raises(KeyError):
+        DataInstance.accessor("db.missing")(_nested_instance())
+
+
+def test_get_many_resolves_keys_sharing_prefixes():
+    instance = _nested_instance()
+
+    values = instance.get_many(["db.host", "db.pool.size", "db.pool.timeouts.connect", "service", "db.pool"])
+
+    assert values == {
+        "db.host": "localhost",
+        "db.pool.size": 4,
+        "db.pool.timeouts.connect": 1.5,
+        "service": "svc",
+        "db.pool": {"size": 4, "timeouts": {"connect": 1.5}},
+    }
+    assert instance.get_many(["db.port"]) == _nested_instance(lazy=True).get_many(["db.port"])
+    with pytest.raises(TypeError):
+        instance.get_many(["service.name"])
@@ -0,0 +1,82 @@
+import copy
+import pickle
+import threading
+
+import pytest
+
+from readtheyaml.data_instance import DataInstance
+from readtheyaml.frozen import FrozenDict, freeze, thaw
+from readtheyaml.schema import Schema
+
+
+def _built():
+    return {"service": "svc", "tags": ["a", "b"], "db": {"host": "h", "pool": {"size": 4}}, "cache": {"ttl": 30}}
+
+
+def test_freeze_makes_nested_values_immutable():
+    frozen = freeze(_built())
+
+    assert isinstance(frozen, FrozenDict)
+    assert isinstance(frozen["db"]["pool"], FrozenDict)
+    assert frozen["tags"] == ("a", "b")
+    assert frozen == _built() | {"tags": ("a", "b")}
+    with pytest.raises(TypeError):
+        frozen["service"] = "other"
+    assert thaw(frozen) == _built()
+
+
+def test_copies_of_frozen_configs_are_free():
+    frozen = freeze(_built())
+
+    assert copy.deepcopy(frozen) is frozen
+    assert copy.copy(frozen) is frozen
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    assert hash(freeze({"a": (1, 2)})) == hash(freeze({"a": [1, 2]}))
+
+
+def test_derive_shares_untouched_subtrees():
+    base = freeze(_built())
+
+    derived = base.derive({"db.pool.size": 8, "db.user": "admin"})
+
+    assert derived["db"]["pool"]["size"] == 8
+    assert derived["db"]["user"] == "admin"
+    assert base["db"]["pool"]["size"] == 4 and "user" not in base["db"]
+    assert derived["cache"] is base["cache"]
+    assert derived["tags"] is base["tags"]
+    assert derived["db"] is not base["db"]
+
+
+def test_derive_freezes_new_values_and_rejects_non_mapping_parents():
+    base = freeze(_built())
+
+    derived = base.derive({"extra": {"items": [1, 2]}})
+
+    assert derived["extra"] == FrozenDict({"items": (1, 2)})
+    with pytest.raises(TypeError, match="'service' is not a mapping"):
+        base.derive({"service.name": "x"})
+
+
+def test_frozen_data_instance_is_shared_between_threads_without_copies():
+    schema = Schema._from_dict(
+        {
+            "service": {"type": "str", "description": "service"},
+            "ports": {"type": "list[int]", "description": "ports"},
+            "db": {"host": {"type": "str", "description": "host"}},
+        }
+    )
+    instance = DataInstance({"service": "svc", "ports": [1, 2], "db": {"host": "h"}}, schema, frozen=True)
+    seen = []
+
+    threads = [threading.Thread(target=lambda: seen.append(instance.built)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(built is instance.built for built in seen)
+    assert instance["ports"] == (1, 2)
+    assert instance["db.host"] == "h"
+    assert instance.data_with_default == {"service": "svc", "ports": [1, 2], "db": {"host": "h"}}
+    with pytest.raises(ValueError, match="cannot be combined"):
+        DataInstance({}, schema, lazy=True, frozen=True)
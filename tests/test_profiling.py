@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from readtheyaml import profiling
+from readtheyaml.exceptions.validation_error import ValidationError
+from readtheyaml.profiling import profile_validation
+from readtheyaml.schema import Schema
+
+
+class ProfiledPoint:
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+
+
+def _schema():
+    return Schema._from_dict(
+        {
+            "service": {"type": "str", "description": "service"},
+            "limit": {"type": "int | str | None", "description": "limit"},
+            "network": {
+                "port": {"type": "int", "description": "port"},
+                "origin": {"type": "object[tests.test_profiling.ProfiledPoint]", "description": "origin"},
+            },
+        }
+    )
+
+
+def _data():
+    return {"service": "svc", "limit": "none", "network": {"port": 80, "origin": {"x": 1, "y": 2}}}
+
+
+def test_profile_records_fields_classes_objects_and_union_attempts():
+    schema = _schema()
+
+    with profile_validation() as profile:
+        schema.build_and_validate(_data())
+        schema.build_and_validate(_data())
+
+    assert set(profile.fields) == {"service", "limit", "network.port", "network.origin"}
+    assert profile.fields["network.port"].calls == 2
+    assert profile.field_classes["ObjectField"].calls == 2
+    assert profile.field_classes["UnionField"].calls == 2
+    assert profile.object_constructors["tests.test_profiling.ProfiledPoint"].calls == 2
+    assert profile.union_attempts["limit -> str"].calls == 2
+    assert profile.union_attempts["limit -> str"].failures == 0
+    assert all(stats.seconds >= 0 for stats in profile.fields.values())
+
+
+def test_profile_counts_failures_and_is_off_outside_the_block():
+    schema = _schema()
+    data = _data()
+    data["network"]["port"] = "x"
+
+    with profile_validation() as profile:
+        with pytest.raises(ValidationError):
+            schema.build_and_validate(data)
+
+    assert profile.fields["network.port"].failures == 1
+    assert profiling.active is None
+    schema.build_and_validate(_data())
+    assert profile.fields["network.port"].calls == 1
+
+
+def test_profile_exports_sorted_table_and_json():
+    schema = _schema()
+
+    with profile_validation(track_allocations=True) as profile:
+        schema.validate_all(_data())
+
+    exported = json.loads(profile.to_json(sort_by="calls"))
+    assert set(exported) == {"fields", "field_classes", "object_constructors", "union_attempts"}
+    assert exported["fields"]["service"]["calls"] == 1
+    assert set(exported["fields"]["service"]) == {"calls", "failures", "seconds", "allocated_bytes"}
+
+    table = profile.table(limit=2)
+    fields_block = table.split("\n\n")[0].splitlines()
+    assert fields_block[0] == "fields:"
+    assert len(fields_block) == 4  # title, header, two rows
+    assert "object_constructors:" in table
+    with pytest.raises(ValueError, match="Unknown sort key"):
+        profile.table(sort_by="name")
@@ -0,0 +1,154 @@
+import os
+import threading
+
+import pytest
+
+from readtheyaml.exceptions.format_error import FormatError
+from readtheyaml.exceptions.validation_error import ValidationError
+from readtheyaml.ref_resolver import RefResolver
+from readtheyaml.reloadable_schema import ReloadableSchema
+
+
+def _files(create_schema_examples):
+    return create_schema_examples(
+        {
+            "schema.yaml": """
+                service:
+                  type: str
+                  description: service
+                network:
+                  $ref: sections/network.yaml
+                logging:
+                  $ref: sections/logging.yaml
+            """,
+            "sections/network.yaml": """
+                port:
+                  type: int
+                  description: port
+                  required: false
+                  default: 8080
+            """,
+            "sections/logging.yaml": """
+                level:
+                  type: str
+                  description: level
+                  required: false
+                  default: info
+            """,
+        }
+    )
+
+
+def _rewrite(path, content):
+    previous = os.stat(path)
+    path.write_text(content, encoding="utf-8")
+    # Make the change visible even on filesystems with coarse mtime resolution.
+    os.utime(path, ns=(previous.st_atime_ns, previous.st_mtime_ns + 1_000_000_000))
+
+
+def test_reload_without_changes_keeps_the_schema(create_schema_examples):
+    files = _files(create_schema_examples)
+    handle = ReloadableSchema(files["schema.yaml"])
+    schema = handle.schema
+
+    assert handle.reload() is False
+    assert handle.schema is schema
+
+
+def test_reload_rebuilds_only_the_changed_ref(create_schema_examples):
+    files = _files(create_schema_examples)
+    handle = ReloadableSchema(files["schema.yaml"])
+    before = handle.schema
+
+    _rewrite(files["sections/network.yaml"], "port:\n  type: int\n  description: port\n  required: false\n  default: 9090\n")
+
+    assert handle.reload() is True
+    after = handle.schema
+    assert after is not before
+    assert after.subsections["logging"] is before.subsections["logging"]
+    assert after.subsections["network"] is not before.subsections["network"]
+    built, _ = handle.build_and_validate({"service": "api", "network": {}, "logging": {}})
+    assert built == {"service": "api", "network": {"port": 9090}, "logging": {"level": "info"}}
+
+
+def test_write_racing_with_the_build_is_reloaded(create_schema_examples, monkeypatch):
+    files = _files(create_schema_examples)
+    network = files["sections/network.yaml"]
+    read_source = RefResolver.read_source
+
+    def read_then_rewrite(resolver, source_id):
+        content = read_source(resolver, source_id)
+        if source_id == str(network.resolve()) and "9090" not in content:
+            # The file changes after it was read but before the build finishes.
+            _rewrite(network, "port:\n  type: int\n  description: port\n  required: false\n  default: 9090\n")
+        return content
+
+    monkeypatch.setattr(RefResolver, "read_source", read_then_rewrite)
+    handle = ReloadableSchema(files["schema.yaml"])
+
+    assert handle.reload() is True
+    built, _ = handle.build_and_validate({"service": "api", "network": {}, "logging": {}})
+    assert built["network"] == {"port": 9090}
+
+
+def test_touched_file_with_same_content_does_not_rebuild(create_schema_examples):
+    files = _files(create_schema_examples)
+    handle = ReloadableSchema(files["schema.yaml"])
+
+    _rewrite(files["sections/logging.yaml"], files["sections/logging.yaml"].read_text(encoding="utf-8"))
+
+    assert handle.reload() is False
+
+
+def test_refs_added_and_removed_from_the_graph_are_tracked(create_schema_examples):
+    files = _files(create_schema_examples)
+    handle = ReloadableSchema(files["schema.yaml"])
+
+    _rewrite(files["schema.yaml"], "service:\n  type: str\n  description: service\nnetwork:\n  $ref: sections/network.yaml\n")
+    handle.reload()
+
+    assert handle.sources == sorted(str(files[name].resolve()) for name in ("schema.yaml", "sections/network.yaml"))
+
+
+def test_failed_reload_keeps_the_previous_schema_and_retries(create_schema_examples):
+    files = _files(create_schema_examples)
+    handle = ReloadableSchema(files["schema.yaml"])
+    before = handle.schema
+
+    _rewrite(files["sections/network.yaml"], "port: [unclosed\n")
+    with pytest.raises(FormatError):
+        handle.reload()
+    assert handle.schema is before
+
+    _rewrite(files["sections/network.yaml"], "port:\n  type: int\n  description: port\n")
+    assert handle.reload() is True
+    with pytest.raises(ValidationError, match="Missing required field 'port'"):
+        handle.build_and_validate({"service": "api", "network": {}, "logging": {}})
+
+
+def test_concurrent_validations_always_see_a_complete_schema(create_schema_examples):
+    files = _files(create_schema_examples)
+    handle = ReloadableSchema(files["schema.yaml"])
+    failures = []
+    stop = threading.Event()
+
+    def validate():
+        while not stop.is_set():
+            try:
+                built, _ = handle.build_and_validate({"service": "api", "network": {}, "logging": {}})
+                assert built["network"]["port"] in (8080, 9090)
+            except Exception as e:
+                failures.append(e)
+                return
+
+    workers = [threading.Thread(target=validate) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for default in (9090, 8080, 9090):
+        _rewrite(files["sections/network.yaml"], f"port:\n  type: int\n  description: port\n  required: false\n  default: {default}\n")
+        handle.reload()
+    stop.set()
+    for worker in workers:
+        worker.join()
+
+    assert failures == []
@@ -0,0 +1,213 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from readtheyaml.remote_fetch import RemoteFetcher
+from readtheyaml.schema import Schema
+
+
+class _SchemaServer:
+    def __init__(self):
+        self.documents = {}
+        self.requests = []
+        self.client_ports = set()
+        self.barrier = None
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    def url(self, path: str) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}{path}"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.requests.append((self.path, self.headers.get("If-None-Match")))
+                server.client_ports.add(self.client_address[1])
+                if server.barrier is not None:
+                    server.barrier.wait(timeout=5)
+
+                if self.path not in server.documents:
+                    self._reply(404, b"")
+                    return
+                body = server.documents[self.path].encode("utf-8")
+                etag = f'"{hash(body)}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self._reply(304, b"", etag)
+                    return
+                self._reply(200, body, etag)
+
+            def _reply(self, status, body, etag=None):
+                self.send_response(status)
+                if etag is not None:
+                    self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def schema_server():
+    server = _SchemaServer()
+    server._thread.start()
+    yield server
+    server._server.shutdown()
+    server._server.server_close()
+
+
+def test_from_yaml_loads_nested_remote_refs(schema_server, create_schema_examples):
+    schema_server.documents = {
+        "/network.yaml": f"port:\n  type: int\n  description: port\ntls:\n  $ref: {schema_server.url('/tls.yaml')}\n",
+        "/tls.yaml": "enabled:\n  type: bool\n  description: tls\n",
+        "/logging.yaml": "level:\n  type: str\n  description: level\n",
+    }
+    files = create_schema_examples(
+        {
+            "schema.yaml": f"""
+                network:
+                  $ref: {schema_server.url('/network.yaml')}
+                logging:
+                  $ref: {schema_server.url('/logging.yaml')}
+            """,
+        }
+    )
+    fetcher = RemoteFetcher()
+
+    schema = Schema.from_yaml(str(files["schema.yaml"]), fetcher=fetcher)
+    fetcher.close()
+
+    built, _ = schema.build_and_validate({"network": {"port": 1, "tls": {"enabled": True}}, "logging": {"level": "info"}})
+    assert built == {"network": {"port": 1, "tls": {"enabled": True}}, "logging": {"level": "info"}}
+    assert sorted(path for path, _ in schema_server.requests) == ["/logging.yaml", "/network.yaml", "/tls.yaml"]
+
+
+def test_fetch_many_downloads_concurrently(schema_server):
+    schema_server.documents = {f"/doc{index}.yaml": f"value: {index}\n" for index in range(3)}
+    # Every request blocks until all three are in flight, so a serial fetch would time out.
+    schema_server.barrier = threading.Barrier(3)
+    fetcher = RemoteFetcher(max_workers=3)
+
+    results = fetcher.fetch_many(schema_server.url(f"/doc{index}.yaml") for index in range(3))
+    fetcher.close()
+
+    assert list(results.values()) == ["value: 0\n", "value: 1\n", "value: 2\n"]
+
+
+def test_close_closes_connections_of_every_fetch_thread(schema_server):
+    schema_server.documents = {f"/doc{index}.yaml": f"value: {index}\n" for index in range(3)}
+    schema_server.barrier = threading.Barrier(3)
+    fetcher = RemoteFetcher(max_workers=3)
+    fetcher.fetch_many(schema_server.url(f"/doc{index}.yaml") for index in range(3))
+    connections = list(fetcher._open_connections)
+
+    fetcher.close()
+
+    assert len(connections) == 3
+    assert all(connection.sock is None for connection in connections)
+    assert not fetcher._open_connections
+
+
+def test_sequential_fetches_reuse_the_connection(schema_server):
+    schema_server.documents = {"/a.yaml": "a: 1\n", "/b.yaml": "b: 2\n"}
+    fetcher = RemoteFetcher()
+
+    fetcher.fetch(schema_server.url("/a.yaml"))
+    fetcher.fetch(schema_server.url("/b.yaml"))
+    fetcher.close()
+
+    assert len(schema_server.client_ports) == 1
+
+
+def test_disk_cache_revalidates_with_etag(schema_server, schema_examples_dir):
+    schema_server.documents = {"/a.yaml": "a: 1\n"}
+    url = schema_server.url("/a.yaml")
+
+    assert RemoteFetcher(cache_dir=schema_examples_dir).fetch(url) == "a: 1\n"
+    assert RemoteFetcher(cache_dir=schema_examples_dir).fetch(url) == "a: 1\n"
+
+    assert schema_server.requests[0][1] is None
+    assert schema_server.requests[1][1] is not None
+
+    schema_server.documents["/a.yaml"] = "a: 2\n"
+    assert RemoteFetcher(cache_dir=schema_examples_dir).fetch(url) == "a: 2\n"
+
+
+def test_offline_mode_serves_from_cache_only(schema_server, schema_examples_dir):
+    schema_server.documents = {"/a.yaml": "a: 1\n"}
+    RemoteFetcher(cache_dir=schema_examples_dir).fetch(schema_server.url("/a.yaml"))
+    request_count = len(schema_server.requests)
+
+    offline = RemoteFetcher(cache_dir=schema_examples_dir, offline=True)
+
+    assert offline.fetch(schema_server.url("/a.yaml")) == "a: 1\n"
+    assert len(schema_server.requests) == request_count
+    with pytest.raises(OSError, match="offline mode"):
+        offline.fetch(schema_server.url("/missing.yaml"))
+
+
+def test_http_errors_fail_the_ref(schema_server, create_schema_examples):
+    files = create_schema_examples({"schema.yaml": f"network:\n  $ref: {schema_server.url('/missing.yaml')}\n"})
+
+    with pytest.raises(OSError, match="HTTP 404"):
+        Schema.from_yaml(str(files["schema.yaml"]), fetcher=RemoteFetcher())
+    # The failed prefetch is reported by the build without requesting the URL again.
+    assert [path for path, _ in schema_server.requests] == ["/missing.yaml"]
+
+
+def _clear_proxy_env(monkeypatch):
+    for name in ("http_proxy", "https_proxy", "no_proxy", "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_http_refs_go_through_the_configured_proxy(schema_server, monkeypatch):
+    _clear_proxy_env(monkeypatch)
+    monkeypatch.setenv("http_proxy", schema_server.url(""))
+    schema_server.documents = {"http://schemas.example/doc.yaml": "value: 1\n"}
+    fetcher = RemoteFetcher()
+
+    text = fetcher.fetch("http://schemas.example/doc.yaml")
+    fetcher.close()
+
+    assert text == "value: 1\n"
+    assert [path for path, _ in schema_server.requests] == ["http://schemas.example/doc.yaml"]
+
+
+def test_no_proxy_hosts_are_fetched_directly(schema_server, monkeypatch):
+    _clear_proxy_env(monkeypatch)
+    monkeypatch.setenv("http_proxy", "http://127.0.0.1:9")
+    monkeypatch.setenv("no_proxy", "127.0.0.1")
+    schema_server.documents = {"/doc.yaml": "value: 1\n"}
+    fetcher = RemoteFetcher()
+
+    text = fetcher.fetch(schema_server.url("/doc.yaml"))
+    fetcher.close()
+
+    assert text == "value: 1\n"
+
+
+def test_schema_cache_checks_remote_sources_concurrently(schema_server, create_schema_examples, schema_examples_dir):
+    schema_server.documents = {f"/part{index}.yaml": f"value:\n  type: int\n  description: value {index}\n" for index in range(3)}
+    files = create_schema_examples(
+        {"schema.yaml": "".join(f"part{index}:\n  $ref: {schema_server.url(f'/part{index}.yaml')}\n" for index in range(3))}
+    )
+    cache_dir = schema_examples_dir / "cache"
+    fetcher = RemoteFetcher(max_workers=3)
+    Schema.from_yaml(str(files["schema.yaml"]), cache_dir=cache_dir, fetcher=fetcher)
+    # Every request now blocks until all three are in flight, so a serial freshness check would time out.
+    schema_server.barrier = threading.Barrier(3)
+
+    schema = Schema.from_yaml(str(files["schema.yaml"]), cache_dir=cache_dir, fetcher=fetcher)
+    fetcher.close()
+
+    assert sorted(schema.subsections) == ["part0", "part1", "part2"]
+    assert len(schema_server.requests) == 6
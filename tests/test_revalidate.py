@@ -0,0 +1,231 @@
+import copy
+
+import pytest
+
+from readtheyaml.compiled_schema import DELETE
+from readtheyaml.exceptions.validation_error import ValidationError
+from readtheyaml.schema import Schema
+
+
+def _schema():
+    return Schema._from_dict(
+        {
+            "service": {"type": "str", "description": "service"},
+            "mode": {"type": "str", "description": "mode", "required": False, "default": "basic"},
+            "level": {
+                "type": "int",
+                "description": "advanced level",
+                "required": False,
+                "default": 1,
+                "when": {"field": "mode", "op": "eq", "value": "advanced"},
+            },
+            "network": {
+                "port": {"type": "int", "description": "port", "required": False, "default": 80},
+                "hosts": {"type": "list[str]", "description": "hosts", "required": False, "default": []},
+                "tls": {
+                    "required": False,
+                    "when": {"field": "network.port", "op": "eq", "value": 443},
+                    "cert": {"type": "str", "description": "certificate"},
+                },
+            },
+            "cache": {
+                "ttl": {"type": "int", "description": "ttl", "required": False, "default": 30},
+            },
+        }
+    )
+
+
+def _full(schema, previous, patch, strict=True):
+    data = copy.deepcopy(previous[1])
+    for key, value in patch.items():
+        *parents, name = key.split(".")
+        section = data
+        for segment in parents:
+            section = section.setdefault(segment, {})
+        if value is DELETE:
+            section.pop(name, None)
+        else:
+            section[name] = value
+    return schema.build_and_validate(data, strict=strict)
+
+
+@pytest.mark.parametrize(
+    "patch",
+    [
+        {"service": "other"},
+        {"network.port": 8080},
+        {"mode": "advanced"},
+        {"mode": "advanced", "level": 5},
+        {"network.port": 443, "network.tls": {"cert": "pem"}},
+        {"network.hosts": ["a", "b"]},
+        {"network": {"port": 81}},
+        {"cache.ttl": DELETE},
+    ],
+)
+def test_revalidate_matches_full_validation(patch):
+    schema = _schema()
+    previous = schema.build_and_validate({"service": "svc", "network": {"hosts": ["h"]}, "cache": {}})
+    snapshot = copy.deepcopy(previous)
+
+    assert schema.revalidate(previous, patch) == _full(schema, previous, patch)
+    assert previous == snapshot
+
+
+def test_revalidate_reuses_untouched_built_subtrees():
+    schema = _schema()
+    previous = schema.build_and_validate({"service": "svc", "network": {"hosts": ["h"]}, "cache": {}})
+
+    built, data_with_default = schema.revalidate(previous, {"network.port": 8080})
+
+    assert built["network"]["port"] == 8080
+    assert built["cache"] is previous[0]["cache"]
+    assert built["network"]["hosts"] is previous[0]["network"]["hosts"]
+    assert data_with_default["cache"] is previous[1]["cache"]
+
+
+def test_revalidate_only_reruns_patched_members_and_their_dependents(monkeypatch):
+    schema = _schema()
+    previous = schema.build_and_validate({"service": "svc", "mode": "advanced", "network": {}, "cache": {}})
+    calls = []
+    for name, field in [("service", schema.fields["service"]), ("level", schema.fields["level"]), ("ttl", schema.subsections["cache"].fields["ttl"])]:
+        original = field.validate_and_build
+        monkeypatch.setattr(field, "validate_and_build", lambda value, name=name, original=original: calls.append(name) or original(value))
+    schema._compiled = None
+
+    schema.revalidate(previous, {"mode": "basic"})
+    schema.revalidate(previous, {"mode": "advanced"})
+
+    assert calls == ["level"]
+
+
+def test_revalidate_reports_errors_like_full_validation():
+    schema = _schema()
+    previous = schema.build_and_validate({"service": "svc", "network": {}, "cache": {}})
+
+    with pytest.raises(ValidationError, match="Field 'port': Must be of type int"):
+        schema.revalidate(previous, {"network.port": "x"})
+    with pytest.raises(ValidationError, match="Missing required field 'service'"):
+        schema.revalidate(previous, {"service": DELETE})
+    with pytest.raises(ValidationError, match="Missing required field 'cert'"):
+        schema.revalidate(previous, {"network.port": 443})
+    with pytest.raises(ValidationError, match="Unexpected key"):
+        schema.revalidate(previous, {"network.extra": 1})
+    with pytest.raises(ValidationError, match="Unexpected key"):
+        schema.revalidate(previous, {"extra": 1})
+    with pytest.raises(ValidationError, match="'service' is not a mapping"):
+        schema.revalidate(previous, {"service.name": "x"})
+
+
+def test_revalidate_keeps_unknown_keys_in_non_strict_mode():
+    schema = _schema()
+    previous = schema.build_and_validate({"service": "svc", "network": {}, "cache": {}}, strict=False)
+
+    built, _ = schema.revalidate(previous, {"network.extra": 1, "extra": 2}, strict=False)
+
+    assert built["network"]["extra"] == 1
+    assert built["extra"] == 2
+
+
+@pytest.mark.parametrize(
+    "patch",
+    [
+        {"network.port": 443},
+        {"mode": "advanced"},
+        {"network.port": 443, "network.tls.cert": "new"},
+        {"network": {"port": 443, "tls": {"cert": "other"}}},
+        {"cache.ttl": DELETE, "service": "other"},
+    ],
+)
+def test_revalidate_with_raw_source_matches_full_validation_of_patched_source(patch):
+    schema = _schema()
+    raw = {"service": "svc", "level": 7, "network": {"tls": {"cert": "pem"}}, "cache": {}}
+    previous = (*schema.build_and_validate(raw), raw)
+    assert "tls" not in previous[1]["network"]
+    snapshot = copy.deepcopy(previous)
+
+    built, data_with_default, patched = schema.revalidate(previous, patch)
+
+    assert (built, data_with_default) == _full(schema, (None, raw), patch)
+    assert (built, data_with_default) == schema.build_and_validate(patched)
+    assert previous == snapshot
+
+
+def test_revalidate_with_raw_source_restores_values_of_reactivated_members():
+    schema = _schema()
+    raw = {"service": "svc", "network": {"tls": {"cert": "pem"}}, "cache": {}}
+    previous = (*schema.build_and_validate(raw), raw)
+
+    activated = schema.revalidate(previous, {"network.port": 443})
+    deactivated = schema.revalidate(activated, {"network.port": 80})
+
+    assert activated[0]["network"]["tls"] == {"cert": "pem"}
+    assert "tls" not in deactivated[0]["network"]
+    assert deactivated[2]["network"]["tls"] == {"cert": "pem"}
+
+
+def test_revalidate_only_builds_the_context_of_observed_members(monkeypatch):
+    schema = _schema()
+    previous = schema.build_and_validate({"service": "svc", "network": {}, "cache": {}})
+    graph = schema.condition_graph()
+
+    def full_context(data):
+        raise AssertionError("revalidate must not build the full condition context")
+
+    monkeypatch.setattr(graph, "build_context", full_context)
+
+    assert schema.revalidate(previous, {"cache.ttl": 5})[0]["cache"]["ttl"] == 5
+    assert {node.path for node in graph.observed_order} == {("mode",), ("network",), ("network", "port")}
+
+
+def _defaulted_section_schema():
+    from readtheyaml.fields.field_factory import FIELD_FACTORY
+
+    db = Schema(
+        "db",
+        required=False,
+        default={"host": "h"},
+        has_default=True,
+        fields={
+            "host": FIELD_FACTORY.create_field("str", "host", description="host"),
+            "port": FIELD_FACTORY.create_field("int", "port", description="port", required=False, default=1),
+            "pooled": FIELD_FACTORY.create_field(
+                "bool", "pooled", description="pooled", required=False, default=True,
+                when={"field": "db.port", "op": "eq", "value": 2},
+            ),
+        },
+    )
+    return Schema("", subsections={"db": db})
+
+
+@pytest.mark.parametrize("patch", [{"db.port": 2}, {"db.host": "x"}, {"db.host": "x", "db.port": 2}])
+def test_revalidate_of_default_filled_section_matches_full_validation_of_patched_source(patch):
+    schema = _defaulted_section_schema()
+    raw = {}
+    previous = (*schema.build_and_validate(raw), raw)
+    patched = _full_source(raw, patch)
+
+    try:
+        expected = schema.build_and_validate(patched)
+    except ValidationError as e:
+        with pytest.raises(ValidationError, match=str(e)):
+            schema.revalidate(previous, patch)
+    else:
+        assert schema.revalidate(previous, patch) == (*expected, patched)
+
+
+def _full_source(raw, patch):
+    data = copy.deepcopy(raw)
+    for key, value in patch.items():
+        *parents, name = key.split(".")
+        section = data
+        for segment in parents:
+            section = section.setdefault(segment, {})
+        section[name] = value
+    return data
+
+
+def test_revalidate_pair_reruns_default_filled_section_as_a_whole():
+    schema = _defaulted_section_schema()
+    previous = schema.build_and_validate({})
+
+    assert schema.revalidate(previous, {"db.port": 2}) == schema.build_and_validate({"db": {"host": "h", "port": 2}})
@@ -0,0 +1,98 @@
+import pytest
+
+from readtheyaml import yaml_backend
+from readtheyaml.exceptions.format_error import FormatError
+from readtheyaml.ref_resolver import RefResolver
+from readtheyaml.schema import Schema
+
+
+def _files(create_schema_examples):
+    return create_schema_examples(
+        {
+            "schema.yaml": """
+                service:
+                  type: str
+                  description: service
+                network:
+                  $ref: ./sections/network.yaml
+                backup_network:
+                  $ref: sections/network.yaml
+                  required: false
+            """,
+            "sections/network.yaml": """
+                port:
+                  type: int
+                  description: port
+                  required: false
+                  default: 8080
+                tls:
+                  $ref: tls.yaml
+            """,
+            "sections/tls.yaml": """
+                enabled:
+                  type: bool
+                  description: tls
+                  required: false
+                  default: false
+            """,
+        }
+    )
+
+
+def test_bundle_loads_like_the_source_schema(create_schema_examples, schema_examples_dir):
+    files = _files(create_schema_examples)
+    bundle_path = schema_examples_dir / "schema.bundle.yaml"
+
+    Schema.write_bundle(str(files["schema.yaml"]), bundle_path)
+    schema = Schema.from_yaml(str(bundle_path))
+
+    data = {"service": "api", "network": {"tls": {}}}
+    assert schema.build_and_validate(data) == Schema.from_yaml(str(files["schema.yaml"])).build_and_validate(data)
+
+
+def test_bundle_records_every_source_with_its_hash(create_schema_examples, schema_examples_dir):
+    files = _files(create_schema_examples)
+    bundle_path = schema_examples_dir / "schema.bundle.yaml"
+
+    Schema.write_bundle(str(files["schema.yaml"]), bundle_path)
+    with open(bundle_path, "r", encoding="utf-8") as f:
+        bundle = yaml_backend.safe_load(f)
+
+    assert set(bundle["sources"]) == {str(files[name].resolve()) for name in files}
+    assert all(len(entry["sha256"]) == 64 for entry in bundle["sources"].values())
+
+
+def test_bundle_load_does_not_read_the_original_sources(create_schema_examples, schema_examples_dir, monkeypatch):
+    files = _files(create_schema_examples)
+    bundle_path = schema_examples_dir / "schema.bundle.yaml"
+    Schema.write_bundle(str(files["schema.yaml"]), bundle_path)
+    for name in files:
+        files[name].unlink()
+
+    original_read = RefResolver.read_source
+    reads = []
+
+    def tracking_read(self, source_id):
+        reads.append(source_id)
+        return original_read(self, source_id)
+
+    monkeypatch.setattr(RefResolver, "read_source", tracking_read)
+    schema = Schema.from_yaml(str(bundle_path))
+
+    assert reads == [str(bundle_path.resolve())]
+    assert set(schema.subsections) == {"network", "backup_network"}
+
+
+def test_tampered_bundle_is_rejected(create_schema_examples, schema_examples_dir):
+    files = _files(create_schema_examples)
+    bundle_path = schema_examples_dir / "schema.bundle.yaml"
+    Schema.write_bundle(str(files["schema.yaml"]), bundle_path)
+
+    with open(bundle_path, "r", encoding="utf-8") as f:
+        bundle = yaml_backend.safe_load(f)
+    bundle["sources"][str(files["sections/tls.yaml"].resolve())]["content"] += "\nextra:\n  type: int\n  description: x\n"
+    with open(bundle_path, "w", encoding="utf-8") as f:
+        yaml_backend.safe_dump(bundle, f)
+
+    with pytest.raises(FormatError, match="does not match its sha256"):
+        Schema.from_yaml(str(bundle_path))
@@ -0,0 +1,100 @@
+from pathlib import Path
+
+from readtheyaml import schema_cache
+from readtheyaml.ref_resolver import RefResolver
+from readtheyaml.schema import Schema
+
+
+def _files(create_schema_examples):
+    return create_schema_examples(
+        {
+            "schema.yaml": """
+                service:
+                  type: str
+                  description: service
+                network:
+                  $ref: ./sections/network.yaml
+            """,
+            "sections/network.yaml": """
+                port:
+                  type: int
+                  description: port
+                  required: false
+                  default: 8080
+            """,
+        }
+    )
+
+
+def test_cache_entry_is_written_and_reused(create_schema_examples, schema_examples_dir, monkeypatch):
+    files = _files(create_schema_examples)
+    cache_dir = schema_examples_dir / "cache"
+
+    first = Schema.from_yaml(str(files["schema.yaml"]), cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("schema should be served from the cache")
+
+    monkeypatch.setattr(Schema, "_from_dict", fail)
+    second = Schema.from_yaml(str(files["schema.yaml"]), cache_dir=cache_dir)
+
+    assert second is not first
+    assert second.build_and_validate({"service": "api", "network": {}}) == first.build_and_validate(
+        {"service": "api", "network": {}}
+    )
+
+
+def test_cache_is_invalidated_when_a_referenced_file_changes(create_schema_examples, schema_examples_dir):
+    files = _files(create_schema_examples)
+    cache_dir = schema_examples_dir / "cache"
+    Schema.from_yaml(str(files["schema.yaml"]), cache_dir=cache_dir)
+
+    files["sections/network.yaml"].write_text(
+        "port:\n  type: int\n  description: port\n  required: false\n  default: 9090\n", encoding="utf-8"
+    )
+    schema = Schema.from_yaml(str(files["schema.yaml"]), cache_dir=cache_dir)
+
+    built, _ = schema.build_and_validate({"service": "api", "network": {}})
+    assert built["network"] == {"port": 9090}
+
+
+def test_cache_entry_records_every_source_of_the_ref_graph(create_schema_examples, schema_examples_dir):
+    files = _files(create_schema_examples)
+    cache_dir = schema_examples_dir / "cache"
+    Schema.from_yaml(str(files["schema.yaml"]), cache_dir=cache_dir)
+
+    resolver = RefResolver()
+    schema = schema_cache.load_cached(cache_dir, files["schema.yaml"], Path(files["schema.yaml"]).parent, resolver)
+
+    assert schema is not None
+    assert set(resolver.sources) == {str(files["schema.yaml"].resolve()), str(files["sections/network.yaml"].resolve())}
+
+
+def test_corrupt_cache_entry_falls_back_to_a_fresh_load(create_schema_examples, schema_examples_dir):
+    files = _files(create_schema_examples)
+    cache_dir = schema_examples_dir / "cache"
+    Schema.from_yaml(str(files["schema.yaml"]), cache_dir=cache_dir)
+    for entry in cache_dir.glob("*.pickle"):
+        entry.write_bytes(b"not a pickle")
+
+    schema = Schema.from_yaml(str(files["schema.yaml"]), cache_dir=cache_dir)
+
+    assert "network" in schema.subsections
+
+
+def test_unpicklable_schema_is_not_cached(schema_examples_dir):
+    schema = Schema._from_dict({"service": {"type": "str", "description": "service"}})
+    schema.fields["service"].unpicklable = lambda: None
+
+    stored = schema_cache.store(schema_examples_dir / "cache", "schema.yaml", ".", {}, schema)
+
+    assert stored is False
+    assert not (schema_examples_dir / "cache").exists()
+
+
+def test_cache_entries_are_keyed_by_package_version(monkeypatch):
+    before = schema_cache.entry_path("cache", "schema.yaml", ".")
+    monkeypatch.setattr(schema_cache, "PACKAGE_VERSION", "999.0.0")
+
+    assert schema_cache.entry_path("cache", "schema.yaml", ".") != before
@@ -0,0 +1,66 @@
+import pytest
+
+from readtheyaml.exceptions.format_error import FormatError
+from readtheyaml.exceptions.validation_error import ValidationError
+from readtheyaml.schema import Schema
+
+
+def _schema():
+    return Schema._from_dict(
+        {
+            "tenant": {"type": "str", "description": "tenant id"},
+            "quota": {"type": "int", "description": "quota", "required": False, "default": 10, "min_value": 0},
+        }
+    )
+
+
+def test_iter_validate_stream_validates_each_document(create_schema_examples):
+    files = create_schema_examples(
+        {
+            "tenants.yaml": """
+                tenant: alpha
+                ---
+                tenant: beta
+                quota: -1
+                ---
+                tenant: gamma
+                quota: 3
+                ---
+                - not
+                - a mapping
+            """,
+        }
+    )
+
+    results = list(_schema().iter_validate_stream(files["tenants.yaml"]))
+
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert [result.ok for result in results] == [True, False, True, False]
+    assert results[0].built == {"tenant": "alpha", "quota": 10}
+    assert results[0].data_with_default == {"tenant": "alpha", "quota": 10}
+    assert isinstance(results[1].error, ValidationError)
+    assert "at least 0" in str(results[1].error)
+    assert results[2].built == {"tenant": "gamma", "quota": 3}
+    assert "expects a mapping/dictionary" in str(results[3].error)
+    assert all(result.source == str(files["tenants.yaml"]) for result in results)
+
+
+def test_iter_validate_stream_is_lazy(create_schema_examples):
+    files = create_schema_examples({"tenants.yaml": "tenant: a\n---\ntenant: b\n"})
+
+    stream = _schema().iter_validate_stream(files["tenants.yaml"])
+
+    assert next(stream).built["tenant"] == "a"
+    assert next(stream).built["tenant"] == "b"
+    with pytest.raises(StopIteration):
+        next(stream)
+
+
+def test_iter_validate_stream_raises_format_error_on_broken_document(create_schema_examples):
+    files = create_schema_examples({"tenants.yaml": "tenant: a\n---\ntenant: [unclosed\n"})
+
+    stream = _schema().iter_validate_stream(files["tenants.yaml"])
+
+    assert next(stream).ok
+    with pytest.raises(FormatError, match="Invalid YAML format"):
+        next(stream)
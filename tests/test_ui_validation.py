@@ -259,3 +259,37 @@ def test_build_fix_hints_for_bounds_violation():
 def test_build_fix_hints_for_type_mismatch():
     hints = build_fix_hints({"port": "Must be of type int"}, [])
     assert hints == ["Use value type 'int' for 'port'."]
+
+
+def test_validation_controller_reports_all_errors_from_single_validation():
+    scheduler = FakeScheduler()
+    states = []
+    schema = Schema._from_dict(
+        {
+            "service_name": {"type": "str", "description": "service"},
+            "workers": {"type": "int", "description": "workers", "max_value": 8},
+            "network": {
+                "port": {"type": "int", "description": "port"},
+            },
+        }
+    )
+    controller = ValidationController(
+        schema=schema,
+        strict=True,
+        schedule_callback=scheduler.schedule,
+        cancel_callback=scheduler.cancel,
+        state_callback=states.append,
+        debounce_ms=300,
+    )
+
+    controller.request_validation({"workers": 16, "network": {"port": "http"}, "extra": 1})
+    scheduler.run_last()
+
+    state = states[0]
+    assert state.is_valid is False
+    assert state.field_errors == {
+        "service_name": "Missing required field.",
+        "workers": "Value must be at most 8.",
+        "network.port": "Must be of type int",
+    }
+    assert state.global_errors == ["Unexpected key 'extra' in section '<root>'"]
@@ -0,0 +1,52 @@
+import pytest
+import yaml
+
+from readtheyaml import yaml_backend
+from readtheyaml.exceptions.format_error import FormatError
+from readtheyaml.schema import Schema
+from readtheyaml.ui.save_helpers import serialize_yaml
+
+AVAILABLE_BACKENDS = [yaml_backend.BACKEND_PYTHON] + ([yaml_backend.BACKEND_LIBYAML] if yaml_backend.HAS_LIBYAML else [])
+
+
+@pytest.fixture
+def backend(request):
+    previous = yaml_backend.get_backend()
+    yaml_backend.set_backend(request.param)
+    yield request.param
+    yaml_backend.set_backend(previous)
+
+
+def test_default_backend_prefers_libyaml_when_available():
+    expected = yaml_backend.BACKEND_LIBYAML if yaml_backend.HAS_LIBYAML else yaml_backend.BACKEND_PYTHON
+    assert yaml_backend.get_backend() == expected
+
+
+def test_set_backend_rejects_unknown_backend():
+    with pytest.raises(ValueError, match="YAML backend 'fast' is not available"):
+        yaml_backend.set_backend("fast")
+
+
+@pytest.mark.parametrize("backend", AVAILABLE_BACKENDS, indirect=True)
+def test_backend_loads_and_dumps_like_pure_python(backend):
+    text = "a: 1\nb: [x, 2.5, null, true]\nc:\n  d: '2024-01-01'\n"
+
+    assert yaml_backend.safe_load(text) == yaml.safe_load(text)
+    assert list(yaml_backend.safe_load_all("a: 1\n---\nb: 2\n")) == [{"a": 1}, {"b": 2}]
+    assert yaml_backend.safe_dump({"b": 1, "a": [1, 2]}) == yaml.safe_dump({"b": 1, "a": [1, 2]})
+
+
+@pytest.mark.parametrize("backend", AVAILABLE_BACKENDS, indirect=True)
+def test_backend_keeps_inline_dumper_representers(backend):
+    text = serialize_yaml({"pair": (1, "alpha"), "items": [1, 2, 3]})
+
+    assert "pair: (1, 'alpha')" in text
+    assert "items: [1, 2, 3]" in text
+
+
+@pytest.mark.parametrize("backend", AVAILABLE_BACKENDS, indirect=True)
+def test_backend_parse_errors_surface_as_format_error(backend, create_schema_examples):
+    files = create_schema_examples({"schema.yaml": "app:\n  type: str\n  default: [1, 2\n"})
+
+    with pytest.raises(FormatError, match="Invalid YAML format in"):
+        Schema.from_yaml(str(files["schema.yaml"]))